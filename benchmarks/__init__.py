@@ -0,0 +1,4 @@
+"""Micro- and macro-benchmarks of the request processing hot paths.
+
+Run with ``python -m benchmarks``, see ``python -m benchmarks --help``.
+"""
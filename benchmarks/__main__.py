@@ -0,0 +1,142 @@
+"""Run benchmarks, save machine-readable results and compare with a baseline.
+
+Examples:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --filter validation --baseline benchmarks/baseline.json
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+
+Exit status is 1 if any benchmark is slower than the baseline by more than
+the tolerance, so it can be used as a gate.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import importlib
+import json
+import os
+import pathlib
+import sys
+import typing
+
+import django
+
+MODULES = (
+    "benchmarks.bench_steps",
+    "benchmarks.bench_validation",
+    "benchmarks.bench_mapping",
+    "benchmarks.bench_history",
+    "benchmarks.bench_routing",
+    "benchmarks.bench_asgi",
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        help="Run only benchmarks with names matching given glob or substring",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Measurements per benchmark"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimal duration of a single measurement in seconds",
+    )
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="Results file")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Baseline to compare")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline, 0.25 is 25%%",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        type=pathlib.Path,
+        help="Save results as a new baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    from django.core.management import call_command  # pylint: disable=C0415
+
+    call_command("migrate", verbosity=0)
+
+
+def selected(name: str, filters: list[str]) -> bool:
+    return not filters or any(
+        fnmatch.fnmatchcase(name, pattern) or pattern in name for pattern in filters
+    )
+
+
+def write_json(path: pathlib.Path, value: typing.Any):
+    path.write_text(json.dumps(value, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    setup_django()
+
+    from benchmarks import runner  # pylint: disable=C0415
+
+    # Benchmark modules require configured Django
+    for module in MODULES:
+        importlib.import_module(module)
+
+    names = [name for name in runner.benchmarks if selected(name, args.filter)]
+    if args.list:
+        sys.stdout.write("".join(f"{name}\n" for name in names))
+        return 0
+
+    results: dict[str, dict[str, typing.Any]] = {}
+    for name in names:
+        result = runner.run_benchmark(name, repeat=args.repeat, min_time=args.min_time)
+        results[name] = result.to_json()
+        sys.stdout.write(
+            f"{name:<45} {result.median * 1e6:>12.2f} us"
+            f" ± {result.stdev * 1e6:.2f} ({result.loops} loops)\n"
+        )
+
+    report = {
+        "created": datetime.datetime.now(datetime.UTC).isoformat(),
+        "environment": runner.environment(),
+        "results": results,
+    }
+
+    if args.output:
+        write_json(args.output, report)
+
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    comparisons = runner.compare(results, baseline["results"], tolerance=args.tolerance)
+
+    sys.stdout.write(
+        f"\nComparison with {args.baseline} (tolerance {args.tolerance:.0%}):\n"
+    )
+    for comparison in comparisons:
+        mark = "REGRESSION" if comparison.is_regression else "ok"
+        sys.stdout.write(f"{comparison.name:<45} {comparison.ratio:>8.2f}x  {mark}\n")
+
+    return 1 if any(comparison.is_regression for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
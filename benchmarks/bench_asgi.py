@@ -0,0 +1,155 @@
+"""Full in-process ASGI requests against SQLite database."""
+
+import asyncio
+import typing
+
+import orjson
+from django.core.asgi import get_asgi_application
+
+from benchmarks import data
+from benchmarks.runner import benchmark
+from chameleon.api import urls as api
+from chameleon.application.asgi import ChameleonAsgiApplication
+from chameleon.project.project.models import ChameleonProject
+
+LIST_SIZE = 50
+
+django_application = get_asgi_application()
+native_application = ChameleonAsgiApplication(
+    routes={"api": api.routes}, fallback=django_application
+)
+
+
+async def request(
+    method: str,
+    path: str,
+    body: bytes = b"",
+    *,
+    expect_status: int = 200,
+    application: typing.Any = django_application,
+) -> bytes:
+    """Call the ASGI application directly, without any server or network."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"accept", b"application/json"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 10000),
+        "server": ("testserver", 80),
+    }
+    messages: list[dict[str, typing.Any]] = [
+        {"type": "http.request", "body": body, "more_body": False}
+    ]
+    disconnected = asyncio.Event()
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, typing.Any]:
+        if messages:
+            return messages.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, typing.Any]):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await application(scope, receive, send)
+    finally:
+        disconnected.set()
+
+    if status != expect_status:
+        raise AssertionError(f"{method} {path}: expected {expect_status}, got {status}")
+
+    return b"".join(chunks)
+
+
+async def create_projects(count: int) -> list[ChameleonProject]:
+    projects = []
+    for _ in range(count):
+        project = ChameleonProject(**data.project_create)
+        await project.insert_with_history()
+        projects.append(project)
+    return projects
+
+
+def requester(
+    method: str,
+    path: str,
+    payload: typing.Any = None,
+    application: typing.Any = django_application,
+):
+    body = b"" if payload is None else orjson.dumps(payload)
+
+    async def call():
+        await request(method, path, body, application=application)
+
+    return call
+
+
+@benchmark("asgi.project.get")
+async def bench_project_get():
+    (project,) = await create_projects(1)
+    return requester("GET", f"/api/project/{project.id}")
+
+
+@benchmark("asgi.project.history")
+async def bench_project_history():
+    (project,) = await create_projects(1)
+    return requester("GET", f"/api/project/{project.id}/history")
+
+
+@benchmark("asgi.project.list")
+async def bench_project_list():
+    await ChameleonProject.objects.all().adelete()
+    await create_projects(LIST_SIZE)
+    return requester("GET", "/api/project")
+
+
+@benchmark("asgi.project.create")
+async def bench_project_create():
+    return requester("POST", "/api/project", data.project_create)
+
+
+@benchmark("asgi.project.update")
+async def bench_project_update():
+    (project,) = await create_projects(1)
+    return requester("POST", f"/api/project/{project.id}", data.project_update)
+
+
+@benchmark("asgi.project.not_found")
+async def bench_project_not_found():
+    async def call():
+        await request("GET", "/api/project/0", expect_status=404)
+
+    return call
+
+
+@benchmark("asgi_native.project.get")
+async def bench_native_project_get():
+    (project,) = await create_projects(1)
+    return requester(
+        "GET", f"/api/project/{project.id}", application=native_application
+    )
+
+
+@benchmark("asgi_native.project.create")
+async def bench_native_project_create():
+    return requester(
+        "POST", "/api/project", data.project_create, application=native_application
+    )
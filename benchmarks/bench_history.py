@@ -0,0 +1,50 @@
+"""History records generation from object differences."""
+
+from benchmarks import data
+from benchmarks.runner import benchmark
+from chameleon.history.utils import generate_history_objects
+from chameleon.project.project.models import ChameleonProject
+from chameleon.project.project.models import ChameleonProjectHistory
+
+
+def project() -> ChameleonProject:
+    return ChameleonProject(
+        id=1, creation_time=data.creation_time, **data.project_create
+    )
+
+
+@benchmark("history.generate.create")
+def bench_create():
+    target_object = project()
+
+    def call():
+        return list(
+            generate_history_objects(
+                source_object=None,
+                target_object=target_object,
+                history_model=ChameleonProjectHistory,
+                action="CREATE",
+                timestamp=data.creation_time,
+            )
+        )
+
+    return call
+
+
+@benchmark("history.generate.update")
+def bench_update():
+    source_object = project().to_dict()
+    target_object = {**source_object, **data.project_update}
+
+    def call():
+        return list(
+            generate_history_objects(
+                source_object=source_object,
+                target_object=target_object,
+                history_model=ChameleonProjectHistory,
+                action="UPDATE",
+                timestamp=data.creation_time,
+            )
+        )
+
+    return call
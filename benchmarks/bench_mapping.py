@@ -0,0 +1,111 @@
+"""Simple mappers over batches of 10k objects, and lists read from the database."""
+
+from benchmarks import data
+from benchmarks.runner import benchmark
+from chameleon.project.project.models import ChameleonProject
+from chameleon.project.project.models import ChameleonProjectHistory
+from chameleon.step import mapping
+from chameleon.step.mapping import simple
+
+BATCH_SIZE = 10_000
+LIST_SIZE = 1000
+
+
+def map_batch(type_id: str, action_id: str, values: list):
+    mapper = mapping.registry.get(type_id, action_id)
+    if mapper is None:
+        raise LookupError(f"No mapper registered for {type_id}:{action_id}")
+
+    return map_batch_function(mapper, values)
+
+
+def map_batch_function(mapper, values: list):
+    def call():
+        return [mapper(value) for value in values]
+
+    return call
+
+
+def projects() -> list[ChameleonProject]:
+    return [
+        ChameleonProject(id=i, creation_time=data.creation_time, **data.project_create)
+        for i in range(BATCH_SIZE)
+    ]
+
+
+@benchmark("mapping.project.from_dict.create")
+def bench_project_create():
+    return map_batch("project", "create", [data.project_create] * BATCH_SIZE)
+
+
+@benchmark("mapping.project.from_object.get")
+def bench_project_get():
+    return map_batch("project", "get", projects())
+
+
+@benchmark("mapping.project.from_object.list")
+def bench_project_list():
+    return map_batch("project", "list", projects())
+
+
+@benchmark("mapping.project.from_object.history")
+def bench_project_history():
+    history = [
+        ChameleonProjectHistory(
+            id=i,
+            object_id=1,
+            timestamp=data.creation_time,
+            action="UPDATE",
+            field="summary",
+            value_from=data.project_create["summary"],
+            value_to=data.project_update["summary"],
+        )
+        for i in range(BATCH_SIZE)
+    ]
+    return map_batch("project", "history", history)
+
+
+@benchmark("mapping.project.from_row.get")
+def bench_project_get_rows():
+    row_mapping = simple.get_row_mapping(mapping.registry.get("project", "get"))
+    if row_mapping is None:
+        raise LookupError("No row mapping registered for project:get")
+
+    rows = [
+        tuple(getattr(project, field) for field in row_mapping.fields)
+        for project in projects()
+    ]
+    return map_batch_function(row_mapping.mapping, rows)
+
+
+async def stored_projects():
+    """Store a batch of projects once to list them from the database."""
+    if await ChameleonProject.objects.acount() < LIST_SIZE:
+        await ChameleonProject.objects.abulk_create(
+            ChameleonProject(creation_time=data.creation_time, **data.project_create)
+            for _ in range(LIST_SIZE)
+        )
+
+
+@benchmark("mapping.project.list.objects")
+async def bench_project_list_objects():
+    await stored_projects()
+    mapper = mapping.registry.get("project", "get")
+
+    async def call():
+        return [mapper(project) for project in await ChameleonProject.query.all()]
+
+    return call
+
+
+@benchmark("mapping.project.list.rows")
+async def bench_project_list_rows():
+    await stored_projects()
+    row_mapping = simple.get_row_mapping(mapping.registry.get("project", "get"))
+    assert row_mapping is not None
+    query = ChameleonProject.query.values_rows(row_mapping.fields)
+
+    async def call():
+        return [row_mapping.mapping(row) for row in await query.all()]
+
+    return call
@@ -0,0 +1,40 @@
+"""URL resolution with Django regex patterns and with the route trie."""
+
+from django import urls
+from django.urls import resolvers
+
+from benchmarks.runner import benchmark
+from chameleon.api import urls as api
+from chameleon.step.core import router
+from chameleon.step.framework.django import router as django_router
+
+PATHS = (
+    "/api/project",
+    "/api/project/1",
+    "/api/project/1/history",
+    "/api/project/1/ticket",
+    "/api/ticket/1",
+    "/api/ticket/1/comment",
+    "/api/comment/1/history",
+)
+
+
+def resolver(url_patterns) -> resolvers.URLResolver:
+    url_resolver = resolvers.URLResolver(resolvers.RegexPattern(r"^/"), url_patterns)
+
+    def call():
+        for path in PATHS:
+            url_resolver.resolve(path)
+
+    return call
+
+
+@benchmark("routing.regex")
+def bench_regex():
+    return resolver([urls.re_path("^api", urls.include(api))])
+
+
+@benchmark("routing.trie")
+def bench_trie():
+    trie = router.RouteTrie({"api": api.routes})
+    return resolver([django_router.RouteTrieURLPattern(trie)])
@@ -0,0 +1,75 @@
+"""UrlHandler dispatch overhead with synthetic steps doing nothing."""
+
+import typing
+
+from benchmarks.runner import benchmark
+from chameleon.step import core
+from chameleon.step.core import tools
+
+step_names = (
+    "fill_request_info",
+    "check_authenticated",
+    "check_headers",
+    "check_access_pre_read",
+    "extract_body",
+    "deserialize",
+    "validate_input",
+    "check_access_post_read",
+    "map_input",
+    "business",
+    "map_output",
+    "serialize",
+    "response_headers",
+    "create_response",
+)
+
+
+def step(context: core.StepContext):
+    pass
+
+
+async def step_async(context: core.StepContext):
+    pass
+
+
+def synthetic_steps(handler: core.StepHandler) -> typing.Any:
+    """Every step defined with pre-, default and post- handlers."""
+    steps: dict[str, typing.Any] = {}
+    for step_name in step_names:
+        steps[f"{step_name}_pre"] = handler
+        steps[f"{step_name}_default"] = handler
+        steps[f"{step_name}_post"] = [handler, handler]
+    return steps
+
+
+def url_handler(*, compiled: bool, handler: core.StepHandler):
+    url_handler = tools.create_url_handler(
+        steps=synthetic_steps(handler),
+        error_status_to_http={},
+        compiled=compiled,
+    )
+
+    async def call():
+        await url_handler(None)
+
+    return call
+
+
+@benchmark("steps.url_handler.nested.sync")
+def bench_nested_sync():
+    return url_handler(compiled=False, handler=step)
+
+
+@benchmark("steps.url_handler.nested.async")
+def bench_nested_async():
+    return url_handler(compiled=False, handler=step_async)
+
+
+@benchmark("steps.url_handler.compiled.sync")
+def bench_compiled_sync():
+    return url_handler(compiled=True, handler=step)
+
+
+@benchmark("steps.url_handler.compiled.async")
+def bench_compiled_async():
+    return url_handler(compiled=True, handler=step_async)
@@ -0,0 +1,169 @@
+"""JSON Schema validation of realistic project, ticket and comment payloads."""
+
+import pathlib
+import tempfile
+
+from django.conf import settings
+
+from benchmarks import data
+from benchmarks.runner import benchmark
+from chameleon.step import validation
+from chameleon.step.validation import bundle
+from chameleon.step.validation import compiler
+from chameleon.step.validation import jsonschema
+
+
+def validate(type_id: str, action_id: str, value):
+    validator = validation.registry.get(type_id, action_id)
+    if validator is None:
+        raise LookupError(f"No validator registered for {type_id}:{action_id}")
+
+    def call():
+        return validator(value)
+
+    return call
+
+
+def validate_compiled(type_id: str, action_id: str, value):
+    """Compiled check first, like with `CHAMELEON_COMPILED_VALIDATION`."""
+    validator = jsonschema.get_validator((type_id, action_id))
+    check = compiler.compile_schema(
+        validator.schema["$ref"],
+        schema_registry=jsonschema.default_schema_registry,
+        format_checker=jsonschema.DefaultJsonMapping.FORMAT_CHECKER,
+    )
+
+    def call():
+        if check(value):
+            return None
+        return list(validator.iter_errors(value)) or None
+
+    return call
+
+
+@benchmark("validation.project.create")
+def bench_project_create():
+    return validate("project", "create", data.project_create)
+
+
+@benchmark("validation.project.update")
+def bench_project_update():
+    return validate("project", "update", data.project_update)
+
+
+@benchmark("validation.project.get")
+def bench_project_get():
+    return validate("project", "get", data.project_output)
+
+
+@benchmark("validation.project.create.invalid")
+def bench_project_create_invalid():
+    return validate("project", "create", data.project_create_invalid)
+
+
+@benchmark("validation.ticket.create")
+def bench_ticket_create():
+    return validate("ticket", "create", data.ticket_create)
+
+
+@benchmark("validation.comment.create")
+def bench_comment_create():
+    return validate("comment", "create", data.comment_create)
+
+
+@benchmark("validation.project.create.compiled")
+def bench_project_create_compiled():
+    return validate_compiled("project", "create", data.project_create)
+
+
+@benchmark("validation.project.update.compiled")
+def bench_project_update_compiled():
+    return validate_compiled("project", "update", data.project_update)
+
+
+@benchmark("validation.project.get.compiled")
+def bench_project_get_compiled():
+    return validate_compiled("project", "get", data.project_output)
+
+
+@benchmark("validation.project.create.invalid.compiled")
+def bench_project_create_invalid_compiled():
+    return validate_compiled("project", "create", data.project_create_invalid)
+
+
+@benchmark("validation.ticket.create.compiled")
+def bench_ticket_create_compiled():
+    return validate_compiled("ticket", "create", data.ticket_create)
+
+
+@benchmark("validation.comment.create.compiled")
+def bench_comment_create_compiled():
+    return validate_compiled("comment", "create", data.comment_create)
+
+
+@benchmark("validation.project.create.invalid.valid_mode")
+def bench_project_create_invalid_valid_mode():
+    def call():
+        return jsonschema.json_validation_processor(
+            data.project_create_invalid,
+            key=("project", "create"),
+            mode=jsonschema.ValidationMode.VALID,
+        )
+
+    return call
+
+
+def load_schemas(source=None, cache_path: pathlib.Path | None = None):
+    def call():
+        return (
+            jsonschema.SchemaRegistry()
+            .with_resources(
+                jsonschema.obtain_schema_data(
+                    source or settings.SCHEMAS_PATHS_OR_MODULES, {}, set(), cache_path
+                )
+            )
+            .crawl()
+        )
+
+    return call
+
+
+@benchmark("validation.load_schemas")
+def bench_load_schemas():
+    return load_schemas()
+
+
+@benchmark("validation.load_schemas.cached")
+def bench_load_schemas_cached():
+    cache_path = pathlib.Path(tempfile.mkdtemp(prefix="chameleon-benchmark-"))
+    call = load_schemas(cache_path=cache_path / "schemas.json")
+    call()  # build the cache
+    return call
+
+
+def write_bundle() -> str:
+    bundle_path = pathlib.Path(tempfile.mkdtemp(prefix="chameleon-benchmark-"))
+    bundle_path /= "bundle.json"
+    bundle.write_bundle(
+        bundle_path, bundle.bundle_schemas(settings.SCHEMAS_PATHS_OR_MODULES)
+    )
+    return f"bundle:{bundle_path}"
+
+
+@benchmark("validation.load_schemas.bundle")
+def bench_load_schemas_bundle():
+    return load_schemas(write_bundle())
+
+
+@benchmark("validation.project.create.bundled")
+def bench_project_create_bundled():
+    schema_registry = load_schemas(write_bundle())()
+    validator = jsonschema.get_validator(("project", "create")).evolve(
+        registry=schema_registry
+    )
+    value = data.project_create
+
+    def call():
+        return list(validator.iter_errors(value)) or None
+
+    return call
@@ -0,0 +1,45 @@
+"""Realistic payloads shared by benchmarks."""
+
+import datetime
+
+description = "\n\n".join(
+    f"Paragraph {i} of a reasonably long description with *markup* in it."
+    for i in range(20)
+)
+
+project_create = {
+    "name": "Chameleon",
+    "summary": "A ticket tracker which changes its colors",
+    "description": description,
+    "description_markup": "PLAIN",
+}
+
+project_update = {
+    "summary": "A ticket tracker which changes its colors again",
+    "description": description + "\n\nOne more paragraph.",
+    "description_markup": "PLAIN",
+}
+
+project_create_invalid = {
+    "name": "",
+    "summary": "s" * 300,
+    "description": description,
+    "unknown": True,
+}
+
+project_output = {
+    "id": "12345",
+    "creation_time": "2024-01-02T03:04:05.123456+00:00",
+    **project_create,
+}
+
+ticket_create = {
+    "title": "Colors do not change on a sunny day",
+}
+
+comment_create = {
+    "description": description,
+    "description_markup": "PLAIN",
+}
+
+creation_time = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
@@ -0,0 +1,185 @@
+"""Minimal benchmark runner based on the standard library only.
+
+A benchmark is a factory registered with `benchmark` decorator. The factory
+prepares everything required and returns a callable to measure. Both the
+factory and the callable may be either sync or async.
+"""
+
+import asyncio
+import dataclasses
+import inspect
+import platform
+import statistics
+import sys
+import time
+import typing
+from collections import abc
+
+__all__ = (
+    "BenchmarkResult",
+    "Comparison",
+    "benchmark",
+    "benchmarks",
+    "compare",
+    "run_benchmark",
+)
+
+BenchmarkFactory = abc.Callable[[], typing.Any]
+
+# Registered benchmark factories by name
+benchmarks: dict[str, BenchmarkFactory] = {}
+
+
+def benchmark(name: str) -> abc.Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """Register a benchmark factory under given name."""
+
+    def decorator(factory: BenchmarkFactory) -> BenchmarkFactory:
+        if name in benchmarks:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        benchmarks[name] = factory
+        return factory
+
+    return decorator
+
+
+@dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
+class BenchmarkResult:
+    """Timings of a single benchmark, seconds per call."""
+
+    loops: int
+    times: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_json(self) -> dict[str, typing.Any]:
+        return {
+            "loops": self.loops,
+            "min": self.min,
+            "median": self.median,
+            "stdev": self.stdev,
+            "times": list(self.times),
+        }
+
+
+@dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    tolerance: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    @property
+    def is_regression(self) -> bool:
+        return self.ratio > 1 + self.tolerance
+
+
+def measure_loops(function: abc.Callable[[], typing.Any], loops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        function()
+    return time.perf_counter() - started
+
+
+async def measure_loops_async(
+    function: abc.Callable[[], abc.Awaitable[typing.Any]], loops: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        await function()
+    return time.perf_counter() - started
+
+
+async def run_measurements(
+    function: abc.Callable[[], typing.Any], *, repeat: int, min_time: float
+) -> BenchmarkResult:
+    if inspect.iscoroutinefunction(function):
+
+        async def measure(loops: int) -> float:
+            return await measure_loops_async(function, loops)
+
+    else:
+
+        async def measure(loops: int) -> float:
+            return measure_loops(function, loops)
+
+    # Calibrate like timeit.Timer.autorange, it also serves as a warmup
+    loops = 1
+    while True:
+        elapsed = await measure(loops)
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    times = []
+    for _ in range(repeat):
+        times.append(await measure(loops) / loops)
+
+    return BenchmarkResult(loops=loops, times=tuple(times))
+
+
+def run_benchmark(
+    name: str, *, repeat: int = 5, min_time: float = 0.2
+) -> BenchmarkResult:
+    """Prepare and measure a registered benchmark.
+
+    Args:
+        name: Registered benchmark name.
+        repeat: Number of measurements to take.
+        min_time: Minimal time of a single measurement in seconds.
+    """
+    factory = benchmarks[name]
+
+    async def run() -> BenchmarkResult:
+        # Factories are called inside the event loop, so async code created
+        # by them is bound to the same loop as the measurements.
+        function = factory()
+        if inspect.isawaitable(function):
+            function = await function
+        return await run_measurements(function, repeat=repeat, min_time=min_time)
+
+    return asyncio.run(run())
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def compare(
+    results: abc.Mapping[str, abc.Mapping[str, typing.Any]],
+    baseline: abc.Mapping[str, abc.Mapping[str, typing.Any]],
+    *,
+    tolerance: float,
+) -> list[Comparison]:
+    """Compare median timings with the baseline ones.
+
+    Benchmarks missing in either results or the baseline are skipped.
+    """
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline[name]["median"],
+            current=result["median"],
+            tolerance=tolerance,
+        )
+        for name, result in results.items()
+        if name in baseline
+    ]
@@ -0,0 +1,25 @@
+"""Django settings for benchmarks: quiet logging and a throwaway database."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from chameleon.application.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get(
+            "CHAMELEON_BENCHMARK_DATABASE",
+            Path(tempfile.mkdtemp(prefix="chameleon-benchmark-")) / "db.sqlite3",
+        ),
+    }
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "root": {"level": "WARNING"},
+}
@@ -1,67 +1,95 @@
 import enum
+import functools
 import logging
+from collections import abc
 
 import orjson
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.utils.module_loading import import_string
 from referencing.exceptions import Unresolvable
 
+from chameleon.common import pagination
+from chameleon.common.django import cache as django_cache
 from chameleon.step import core
 from chameleon.step.framework import steps_django as django
+from chameleon.step.steps import cache
+from chameleon.step.steps import fieldsets
 from chameleon.step.steps.validation import ValidationError
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["chameleon_json_steps", "method_dispatcher"]
+__all__ = ["chameleon_json_steps", "method_dispatcher", "response_cache_steps"]
 
 
 class ChameleonErrors(enum.IntEnum):
     JSON_DESERIALIZE_ERROR = 1
     JSON_SERIALIZE_ERROR = 2
     JSON_VALIDATION_FAILED = 3
+    INVALID_PAGE_REQUEST = 4
+    INVALID_FIELDS_REQUEST = 5
     OBJECT_NOT_FOUND = 10
+    DEADLINE_EXCEEDED = 20
     INTERNAL_ERROR = 999
 
 
 error_status_to_http = {
     ChameleonErrors.JSON_DESERIALIZE_ERROR: 400,
     ChameleonErrors.JSON_VALIDATION_FAILED: 400,
+    ChameleonErrors.INVALID_PAGE_REQUEST: 400,
+    ChameleonErrors.INVALID_FIELDS_REQUEST: 400,
     ChameleonErrors.JSON_SERIALIZE_ERROR: 500,
     ChameleonErrors.OBJECT_NOT_FOUND: 404,
+    ChameleonErrors.DEADLINE_EXCEEDED: 504,
     ChameleonErrors.INTERNAL_ERROR: 500,
 }
 
 
-async def chameleon_validation_error_handler(context: core.StepContext):
-    if not isinstance(context.exception, (ValidationError, ValueError, Unresolvable)):
+def chameleon_validation_error_handler(context: core.StepContext):
+    exception = context.exception
+    if not isinstance(exception, (ValidationError, ValueError, Unresolvable)):
         return False
 
     context.error_status = ChameleonErrors.JSON_VALIDATION_FAILED
-    logger.exception("Validation Error", exc_info=context.exception)
-
-    # TODO: map validation error fields to output_raw
-    # TODO: define error_output object
-    # TODO: have better mechanism to map output
     context.output_raw = {
         "error": ChameleonErrors.JSON_VALIDATION_FAILED,
     }
 
+    if not isinstance(exception, ValidationError):
+        logger.exception("Validation Error", exc_info=exception)
+        return True
+
+    # invalid input is the client's fault, it isn't worth a stack trace
+    logger.info(
+        "Validation failed on %s %s", context.request_info.method, context.custom_info
+    )
+    # compact errors of `chameleon.step.validation.jsonschema` processors
+    if isinstance(exception.errors, list):
+        context.output_raw["errors"] = exception.errors
+
     return True
 
 
-async def chameleon_business_error_handler(context: core.StepContext) -> bool:
-    if not isinstance(context.exception, ObjectDoesNotExist):
+def chameleon_business_error_handler(context: core.StepContext) -> bool:
+    if isinstance(context.exception, ObjectDoesNotExist):
+        error = ChameleonErrors.OBJECT_NOT_FOUND
+    elif isinstance(context.exception, pagination.InvalidPageRequest):
+        error = ChameleonErrors.INVALID_PAGE_REQUEST
+    elif isinstance(context.exception, fieldsets.InvalidFieldsRequest):
+        error = ChameleonErrors.INVALID_FIELDS_REQUEST
+    else:
         return False
 
-    context.error_status = ChameleonErrors.OBJECT_NOT_FOUND
+    context.error_status = error
 
     context.output_raw = {
-        "error": ChameleonErrors.OBJECT_NOT_FOUND,
+        "error": error,
     }
 
     return True
 
 
-async def chameleon_json_deserialize(context: core.StepContext) -> bool:
+def chameleon_json_deserialize(context: core.StepContext) -> bool:
     if not isinstance(context.exception, orjson.JSONDecodeError):
         return False
 
@@ -74,10 +102,31 @@ async def chameleon_json_deserialize(context: core.StepContext) -> bool:
     return True
 
 
+def chameleon_deadline_error_handler(context: core.StepContext) -> bool:
+    if not isinstance(context.exception, core.DeadlineExceeded):
+        return False
+
+    context.error_status = ChameleonErrors.DEADLINE_EXCEEDED
+    logger.warning(
+        "Deadline exceeded on %s step of %s %s",
+        context.exception.step,
+        context.request_info.method,
+        context.custom_info,
+    )
+
+    context.output_raw = {
+        "error": ChameleonErrors.DEADLINE_EXCEEDED,
+    }
+
+    return True
+
+
 def chameleon_json_steps(**kwargs):
     return django.django_json_steps(
         json_loads=orjson.loads,
         json_dumps=orjson.dumps,
+        # deadline could be exceeded on any step
+        exception_handler_pre=chameleon_deadline_error_handler,
         exception_handler_default={
             "validate_input": chameleon_validation_error_handler,
             "business": chameleon_business_error_handler,
@@ -87,8 +136,50 @@ def chameleon_json_steps(**kwargs):
     )
 
 
-def method_dispatcher(**kwargs):
+@functools.cache
+def step_instrumentation() -> core.StepTimingSinkProtocol | None:
+    """Step timings sink configured by `CHAMELEON_STEP_INSTRUMENTATION` setting.
+
+    The setting is a dotted path to a sink class or factory, called without
+    arguments once; all routes share the same sink.
+    """
+    sink_path = getattr(settings, "CHAMELEON_STEP_INSTRUMENTATION", None)
+    if not sink_path:
+        return None
+
+    return import_string(sink_path)()
+
+
+def response_cache_steps(
+    *, route: str, tags: abc.Sequence[str]
+) -> core.StepsDefinitionDict:
+    """Response cache steps, no steps if `CHAMELEON_RESPONSE_CACHE` is disabled."""
+    response_cache = django_cache.response_cache()
+    if response_cache is None:
+        return {}
+
+    return cache.response_cache_steps(response_cache, route=route, tags=tags)
+
+
+def method_dispatcher(*, route: str = "", timeout: float | None = None, **kwargs):
+    """Create a Chameleon API handler dispatching requests by HTTP method.
+
+    WSGI entry point calls its sync pipeline, see `steps_django.sync_view`.
+
+    Args:
+        route: Route name to report step timings for, e.g. `project/{project_id}`.
+        timeout: Seconds to finish process steps in,
+            `CHAMELEON_REQUEST_TIMEOUT` setting is used if None.
+        **kwargs: Steps definitions by HTTP method name.
+    """
+    if timeout is None:
+        timeout = settings.CHAMELEON_REQUEST_TIMEOUT
+
     return django.method_dispatcher(
         error_status_to_http=error_status_to_http,
+        compiled=True,
+        route=route,
+        instrumentation=step_instrumentation(),
+        timeout=timeout,
         **kwargs,
     )
@@ -1,9 +1,11 @@
 import logging
 
-from django.urls import re_path
-
 from chameleon.api import chameleon
 from chameleon.project.comment import api
+from chameleon.step import steps
+from chameleon.step.framework.django import router
+from chameleon.step.steps import conditional
+from chameleon.step.steps import fieldsets
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,16 @@ processor_get = chameleon.chameleon_json_steps(
     type_id="comment",
     map_input=None,
     action_id_output="get",
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(type_id="comment"),
+        conditional.conditional_steps(
+            last_modified=api.comment_last_modified,
+            last_modified_sync=api.comment_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="comment/{comment_id}", tags=["comment:{comment_id}"]
+        ),
+    ),
 )
 
 processor_update = chameleon.chameleon_json_steps(
@@ -28,15 +40,24 @@ processor_history = chameleon.chameleon_json_steps(
     action_id_output="history",
     mapping_output_expect_list=True,
     business=api.comment_history,
+    **steps.merge_steps(
+        conditional.conditional_steps(
+            last_modified=api.comment_last_modified,
+            last_modified_sync=api.comment_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="comment/{comment_id}/history", tags=["comment:{comment_id}"]
+        ),
+    ),
 )
 
-urlpatterns = (
-    re_path(
-        "^/(?P<comment_id>[a-zA-Z0-9_-]+)$",
-        chameleon.method_dispatcher(get=processor_get, post=processor_update),
+routes = {
+    "{comment_id}": chameleon.method_dispatcher(
+        route="comment/{comment_id}", get=processor_get, post=processor_update
     ),
-    re_path(
-        "^/(?P<comment_id>[a-zA-Z0-9_-]+)/history$",
-        chameleon.method_dispatcher(get=processor_history),
+    "{comment_id}/history": chameleon.method_dispatcher(
+        route="comment/{comment_id}/history", get=processor_history
     ),
-)
+}
+
+urlpatterns = router.regex_urlpatterns(routes)
@@ -1,10 +1,14 @@
 import logging
 
-from django.urls import re_path
-
 from chameleon.api import chameleon
 from chameleon.project.project import api
 from chameleon.project.ticket import api as ticket_api
+from chameleon.step import steps
+from chameleon.step.framework.django import router
+from chameleon.step.steps import conditional
+from chameleon.step.steps import fieldsets
+from chameleon.step.steps import rows
+from chameleon.step.steps import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +24,13 @@ processor_list = chameleon.chameleon_json_steps(
     map_input=None,
     action_id_output="get",
     mapping_output_expect_list=True,
-    business=api.project_list_fun,
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(
+            type_id="project", mapping_output_expect_list=True
+        ),
+        rows.list_rows_steps(type_id="project", query=api.project_list_query),
+        chameleon.response_cache_steps(route="project", tags=["project"]),
+    ),
 )
 
 # path variables: `project_id` - project public ID
@@ -29,6 +39,17 @@ processor_get = chameleon.chameleon_json_steps(
     type_id="project",
     map_input=None,
     action_id_output="get",
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(type_id="project"),
+        conditional.conditional_steps(
+            last_modified=api.project_last_modified,
+            last_modified_sync=api.project_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="project/{project_id}", tags=["project:{project_id}"]
+        ),
+        single_flight.single_flight_steps(),
+    ),
 )
 
 processor_update = chameleon.chameleon_json_steps(
@@ -44,6 +65,24 @@ processor_history = chameleon.chameleon_json_steps(
     action_id_output="history",
     mapping_output_expect_list=True,
     business=api.project_history,
+    **steps.merge_steps(
+        conditional.conditional_steps(
+            last_modified=api.project_last_modified,
+            last_modified_sync=api.project_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="project/{project_id}/history", tags=["project:{project_id}"]
+        ),
+    ),
+)
+
+processor_activity = chameleon.chameleon_json_steps(
+    type_id="project",
+    map_input=None,
+    action_id_output="activity",
+    mapping_output_expect_list=True,
+    business=api.project_activity,
+    **conditional.conditional_steps(),
 )
 
 processor_ticket_create = chameleon.chameleon_json_steps(
@@ -58,26 +97,36 @@ processor_ticket_list = chameleon.chameleon_json_steps(
     map_input=None,
     action_id_output="get",
     mapping_output_expect_list=True,
-    business=ticket_api.ticket_list_fun,
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(
+            type_id="ticket", mapping_output_expect_list=True
+        ),
+        rows.list_rows_steps(type_id="ticket", query=ticket_api.ticket_list_query),
+        chameleon.response_cache_steps(
+            route="project/{project_id}/ticket", tags=["project:{project_id}:ticket"]
+        ),
+        single_flight.single_flight_steps(),
+    ),
 )
 
-urlpatterns = (
-    re_path(
-        "^$",
-        chameleon.method_dispatcher(get=processor_list, post=processor_create),
+routes = {
+    "": chameleon.method_dispatcher(
+        route="project", get=processor_list, post=processor_create
     ),
-    re_path(
-        "^/(?P<project_id>[a-zA-Z0-9_-]+)$",
-        chameleon.method_dispatcher(get=processor_get, post=processor_update),
+    "{project_id}": chameleon.method_dispatcher(
+        route="project/{project_id}", get=processor_get, post=processor_update
     ),
-    re_path(
-        "^/(?P<project_id>[a-zA-Z0-9_-]+)/history$",
-        chameleon.method_dispatcher(get=processor_history),
+    "{project_id}/history": chameleon.method_dispatcher(
+        route="project/{project_id}/history", get=processor_history
     ),
-    re_path(
-        "^/(?P<project_id>[a-zA-Z0-9_-]+)/ticket$",
-        chameleon.method_dispatcher(
-            get=processor_ticket_list, post=processor_ticket_create
-        ),
+    "{project_id}/activity": chameleon.method_dispatcher(
+        route="project/{project_id}/activity", get=processor_activity
     ),
-)
+    "{project_id}/ticket": chameleon.method_dispatcher(
+        route="project/{project_id}/ticket",
+        get=processor_ticket_list,
+        post=processor_ticket_create,
+    ),
+}
+
+urlpatterns = router.regex_urlpatterns(routes)
@@ -1,10 +1,13 @@
 import logging
 
-from django.urls import re_path
-
 from chameleon.api import chameleon
 from chameleon.project.comment import api as comment_api
 from chameleon.project.ticket import api
+from chameleon.step import steps
+from chameleon.step.framework.django import router
+from chameleon.step.steps import conditional
+from chameleon.step.steps import fieldsets
+from chameleon.step.steps import rows
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,16 @@ processor_get = chameleon.chameleon_json_steps(
     type_id="ticket",
     map_input=None,
     action_id_output="get",
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(type_id="ticket"),
+        conditional.conditional_steps(
+            last_modified=api.ticket_last_modified,
+            last_modified_sync=api.ticket_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="ticket/{ticket_id}", tags=["ticket:{ticket_id}"]
+        ),
+    ),
 )
 
 processor_update = chameleon.chameleon_json_steps(
@@ -29,6 +42,15 @@ processor_history = chameleon.chameleon_json_steps(
     action_id_output="history",
     mapping_output_expect_list=True,
     business=api.ticket_history,
+    **steps.merge_steps(
+        conditional.conditional_steps(
+            last_modified=api.ticket_last_modified,
+            last_modified_sync=api.ticket_last_modified_sync,
+        ),
+        chameleon.response_cache_steps(
+            route="ticket/{ticket_id}/history", tags=["ticket:{ticket_id}"]
+        ),
+    ),
 )
 
 processor_comment_create = chameleon.chameleon_json_steps(
@@ -43,22 +65,29 @@ processor_comment_list = chameleon.chameleon_json_steps(
     map_input=None,
     action_id_output="get",
     mapping_output_expect_list=True,
-    business=comment_api.comment_list_fun,
+    **steps.merge_steps(
+        fieldsets.sparse_fieldset_steps(
+            type_id="comment", mapping_output_expect_list=True
+        ),
+        rows.list_rows_steps(type_id="comment", query=comment_api.comment_list_query),
+        chameleon.response_cache_steps(
+            route="ticket/{ticket_id}/comment", tags=["ticket:{ticket_id}:comment"]
+        ),
+    ),
 )
 
-urlpatterns = (
-    re_path(
-        "^/(?P<ticket_id>[a-zA-Z0-9_-]+)$",
-        chameleon.method_dispatcher(get=processor_get, post=processor_update),
+routes = {
+    "{ticket_id}": chameleon.method_dispatcher(
+        route="ticket/{ticket_id}", get=processor_get, post=processor_update
     ),
-    re_path(
-        "^/(?P<ticket_id>[a-zA-Z0-9_-]+)/history$",
-        chameleon.method_dispatcher(get=processor_history),
+    "{ticket_id}/history": chameleon.method_dispatcher(
+        route="ticket/{ticket_id}/history", get=processor_history
     ),
-    re_path(
-        "^/(?P<ticket_id>[a-zA-Z0-9_-]+)/comment",
-        chameleon.method_dispatcher(
-            get=processor_comment_list, post=processor_comment_create
-        ),
+    "{ticket_id}/comment": chameleon.method_dispatcher(
+        route="ticket/{ticket_id}/comment",
+        get=processor_comment_list,
+        post=processor_comment_create,
     ),
-)
+}
+
+urlpatterns = router.regex_urlpatterns(routes)
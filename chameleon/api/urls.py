@@ -4,6 +4,12 @@ from chameleon.api import comment
 from chameleon.api import project
 from chameleon.api import ticket
 
+routes = {
+    "project": project.routes,
+    "ticket": ticket.routes,
+    "comment": comment.routes,
+}
+
 urlpatterns = (
     urls.re_path("project", urls.include(project)),
     urls.re_path("ticket", urls.include(ticket)),
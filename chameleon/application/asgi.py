@@ -8,8 +8,42 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
+from django.core import signals
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chameleon.settings")
+from chameleon.common.django import warmup
+from chameleon.step.framework import steps_asgi
 
-application = get_asgi_application()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chameleon.application.settings")
+
+django_application = get_asgi_application()
+
+
+class ChameleonAsgiApplication(steps_asgi.AsgiApplication):
+    """Native ASGI application keeping Django ORM connections healthy.
+
+    Django request signals close outdated database connections the same way
+    as Django ASGI handler does.
+    """
+
+    async def request_started(self, scope):
+        await signals.request_started.asend(sender=self.__class__, scope=scope)
+
+    async def request_finished(self, scope):
+        await signals.request_finished.asend(sender=self.__class__)
+
+
+if settings.CHAMELEON_ASGI_NATIVE:
+    from chameleon.api import urls as api  # pylint: disable=C0413
+
+    application = ChameleonAsgiApplication(
+        routes={"api": api.routes}, fallback=django_application
+    )
+else:
+    application = django_application
+
+if settings.CHAMELEON_WARMUP:
+    from chameleon.api import urls as api  # pylint: disable=C0413
+
+    warmup.warmup({"api": api.routes})
@@ -6,4 +6,9 @@ from chameleon.step.validation import jsonschema
 
 class SchemasAppConfig(ChameleonAppConfig):
     def ready(self):
-        jsonschema.load_schemas(settings.SCHEMAS_PATHS_OR_MODULES)
+        if getattr(settings, "CHAMELEON_COMPILED_VALIDATION", False):
+            jsonschema.enable_compiled_validation()
+        jsonschema.load_schemas(
+            settings.SCHEMAS_PATHS_OR_MODULES,
+            cache_path=getattr(settings, "CHAMELEON_SCHEMA_CACHE", None),
+        )
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chameleon.step.validation import bundle
+
+
+class Command(BaseCommand):
+    help = (
+        "Bundle schemas into a single file with references inlined. "
+        "Use it as `bundle:<path>` in SCHEMAS_PATHS_OR_MODULES setting."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Bundle file to write.")
+        parser.add_argument(
+            "--source",
+            action="append",
+            dest="sources",
+            help=(
+                "Schema path, `module:` prefixed module or `bundle:` prefixed "
+                "bundle, SCHEMAS_PATHS_OR_MODULES setting by default."
+            ),
+        )
+
+    def handle(self, *args, output, sources, **options):
+        entries = bundle.bundle_schemas(sources or settings.SCHEMAS_PATHS_OR_MODULES)
+        bundle.write_bundle(output, entries)
+        self.stdout.write(f"Bundled {len(entries)} schemas into {output}")
@@ -18,6 +18,8 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 DATABASE_DIR = Path(os.path.curdir).absolute()
 
+# Schema paths, "module:" prefixed modules or "bundle:" prefixed bundles made by
+# `bundle_schemas` command.
 SCHEMAS_PATHS_OR_MODULES: abc.Sequence[str | Path] | str | Path
 
 ALLOWED_HOSTS = ["*"]
@@ -110,3 +112,37 @@ LOGGING = {
         "propagate": True,
     },
 }
+
+# URL router: "regex" for Django regex patterns, "trie" to resolve all API
+# routes with a single segment trie lookup.
+CHAMELEON_URL_ROUTER = "regex"
+
+# Serve API routes by the native ASGI adapter without Django request and
+# response objects; other paths are served by Django.
+CHAMELEON_ASGI_NATIVE = False
+
+# Dotted path to a step timings sink, e.g.
+# "chameleon.step.core.instrumentation.StepTimingLogger"; None disables timings.
+CHAMELEON_STEP_INSTRUMENTATION: str | None = None
+
+# Default seconds for API routes to finish process steps in, None is unlimited.
+# Requesters could shorten it with "X-Request-Timeout" header.
+CHAMELEON_REQUEST_TIMEOUT: float | None = None
+
+# Django cache alias to cache serialized GET responses in, None disables it.
+# Responses are invalidated on history writes through the cache itself, so
+# "locmem" cache is suitable for a single process deployment only.
+CHAMELEON_RESPONSE_CACHE: str | None = None
+CHAMELEON_RESPONSE_CACHE_TIMEOUT = 300
+
+# Compile registered JSON Schemas into Python checks at startup, valid payloads
+# skip `jsonschema`, it reports errors of invalid ones only.
+CHAMELEON_COMPILED_VALIDATION = False
+
+# File to cache parsed and checked schemas in, they're reused on startup until
+# schema files change; None parses schema files on every start.
+CHAMELEON_SCHEMA_CACHE: str | Path | None = None
+
+# Create validators and mappers and send a GET request to every API route when
+# the ASGI or WSGI application is loaded, before it serves the first request.
+CHAMELEON_WARMUP = False
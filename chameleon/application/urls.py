@@ -15,7 +15,17 @@ Including another URLconf
 """
 
 from django import urls
+from django.conf import settings
 
 from chameleon.api import urls as api
+from chameleon.step.core import router
+from chameleon.step.framework.django import router as django_router
 
-urlpatterns = [urls.re_path("^api", urls.include(api))]
+urlpatterns: list[urls.URLPattern | urls.URLResolver]
+
+if settings.CHAMELEON_URL_ROUTER == "trie":
+    urlpatterns = [
+        django_router.RouteTrieURLPattern(router.RouteTrie({"api": api.routes}))
+    ]
+else:
+    urlpatterns = [urls.re_path("^api", urls.include(api))]
@@ -8,8 +8,37 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 
 import os
 
-from django.core.wsgi import get_wsgi_application
+import django
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chameleon.settings")
+from chameleon.common.django import warmup
+from chameleon.step.framework import steps_django
 
-application = get_wsgi_application()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chameleon.application.settings")
+
+
+class ChameleonWsgiHandler(WSGIHandler):
+    """WSGI handler calling API views by the sync step pipeline.
+
+    API views are async, Django would call them through `async_to_sync` with
+    an event loop per request otherwise.
+    """
+
+    def resolve_request(self, request):
+        resolver_match = super().resolve_request(request)
+        return (
+            steps_django.sync_view(resolver_match.func),
+            resolver_match.args,
+            resolver_match.kwargs,
+        )
+
+
+# the same as `get_wsgi_application()` with the handler replaced
+django.setup(set_prefix=False)
+application = ChameleonWsgiHandler()
+
+if settings.CHAMELEON_WARMUP:
+    from chameleon.api import urls as api  # pylint: disable=C0413
+
+    warmup.warmup({"api": api.routes}, sync=True)
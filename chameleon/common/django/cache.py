@@ -0,0 +1,44 @@
+import functools
+from collections import abc
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from chameleon.step.steps import cache
+
+__all__ = ["invalidate_on_commit", "ainvalidate_on_commit", "response_cache"]
+
+
+@functools.cache
+def response_cache() -> cache.ResponseCache | None:
+    """Response cache configured by `CHAMELEON_RESPONSE_CACHE` setting.
+
+    The setting is a Django cache alias, None disables the cache.
+    """
+    alias = getattr(settings, "CHAMELEON_RESPONSE_CACHE", None)
+    if not alias:
+        return None
+
+    return cache.ResponseCache(
+        backend=caches[alias],
+        timeout=settings.CHAMELEON_RESPONSE_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_on_commit(tags: abc.Collection[str]):
+    """Invalidate cached responses once the current transaction is committed."""
+    configured_cache = response_cache()
+    if configured_cache is None or not tags:
+        return
+
+    transaction.on_commit(functools.partial(configured_cache.invalidate, tags))
+
+
+async def ainvalidate_on_commit(tags: abc.Collection[str]):
+    if response_cache() is None or not tags:
+        return
+
+    # the transaction is bound to the thread of sync_to_async
+    await sync_to_async(invalidate_on_commit)(tags)
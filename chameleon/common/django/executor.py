@@ -0,0 +1,36 @@
+from asgiref.sync import sync_to_async
+
+from chameleon.step import core
+
+__all__ = ["sync_business_step"]
+
+
+def sync_business_step(
+    sync_handler: core.SyncStepHandlerProtocol,
+) -> core.StepHandler:
+    """Run a sync business step in a single thread switch from the event loop.
+
+    Async ORM calls and `aatomic` each switch to the database thread, so
+    a transactional write awaits several of them. The sync step is run whole
+    in one `sync_to_async` call instead and serves the sync pipeline as is.
+
+    The thread can't be interrupted, so the step is never cancelled by the
+    request deadline, see `core.uncancellable_step`.
+
+    Basic usage:
+
+    >>> def project_create_fun_sync(context): ...
+    >>> project_create_fun = sync_business_step(project_create_fun_sync)
+
+    """
+    run_in_thread = sync_to_async(sync_handler, thread_sensitive=True)
+
+    @core.uncancellable_step
+    @core.with_sync_variant(core.uncancellable_step(sync_handler))
+    async def sync_business(context: core.StepContext):
+        await run_in_thread(context)
+
+    sync_business.__name__ = sync_business.__qualname__ = getattr(
+        sync_handler, "__name__", sync_business.__name__
+    ).removesuffix("_sync")
+    return sync_business
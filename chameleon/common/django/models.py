@@ -45,6 +45,9 @@ class UpdatableModel(models.Model):
     async def insert(self):
         await self.asave(force_insert=True)
 
+    def insert_sync(self):
+        self.save(force_insert=True)
+
 
 class ChameleonBaseModel(PrintableModel, UpdatableModel):
     class Meta:
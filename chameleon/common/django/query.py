@@ -1,32 +1,381 @@
+import functools
+import heapq
+import itertools
+import operator
 import typing
 from collections import abc
 
+from asgiref.sync import sync_to_async
+from django.db import connections
 from django.db import models
+from django.db import transaction
 
+from chameleon.common import pagination
 from chameleon.common.query import AbstractModelQuery
+from chameleon.common.query import AbstractQuery
+
+ITERATOR_CHUNK_SIZE = 2000
+
+
+def take_chunk[T](iterator: abc.Iterator[T], size: int) -> list[T]:
+    return list(itertools.islice(iterator, size))
+
+
+async def iterate_in_chunks[T](rows: abc.Iterator[T]) -> abc.AsyncIterator[T]:
+    """Iterate rows of a Django iterator fetched in a thread by chunks."""
+    fetch_chunk = sync_to_async(
+        functools.partial(take_chunk, rows, ITERATOR_CHUNK_SIZE)
+    )
+    try:
+        while chunk := await fetch_chunk():
+            for row in chunk:
+                yield row
+    finally:
+        close = getattr(rows, "close", None)
+        if close is not None:
+            await sync_to_async(close)()
 
 
 class DjangoModelQuery[ModelType](AbstractModelQuery[models.Manager, ModelType]):
+    keyset_fields: tuple[str, str]
+    page_key: abc.Callable[[typing.Any], pagination.PageKey]
+
+    def __init__(
+        self,
+        query: models.Manager | models.QuerySet,
+        *,
+        keyset_fields: tuple[str, str] = pagination.KEYSET_FIELDS,
+        page_key: abc.Callable[[typing.Any], pagination.PageKey] | None = None,
+    ):
+        super().__init__(query)
+        self.keyset_fields = keyset_fields
+        self.page_key = page_key or operator.attrgetter(*keyset_fields)
+
+    def with_query(self, query: models.QuerySet) -> typing.Self:
+        """Query of the same objects and keyset."""
+        return DjangoModelQuery(
+            query, keyset_fields=self.keyset_fields, page_key=self.page_key
+        )
+
     async def first(self):
         return await self.query.aget()
 
+    def first_sync(self):
+        return self.query.get()
+
+    async def latest_value(self, field: str) -> typing.Any:
+        return await self.latest_values_query(field).afirst()
+
+    def latest_value_sync(self, field: str) -> typing.Any:
+        return self.latest_values_query(field).first()
+
+    def latest_values_query(self, field: str) -> models.QuerySet:
+        return self.query.order_by(f"-{field}").values_list(field, flat=True)
+
+    async def page(
+        self, page_request: pagination.PageRequest
+    ) -> pagination.Page[ModelType]:
+        items = [item async for item in self.page_query(page_request)]
+        return self.create_page(items, page_request)
+
+    def page_sync(
+        self, page_request: pagination.PageRequest
+    ) -> pagination.Page[ModelType]:
+        items = list(self.page_query(page_request))
+        return self.create_page(items, page_request)
+
+    def page_query(self, page_request: pagination.PageRequest) -> models.QuerySet:
+        time_field, pk_field = self.keyset_fields
+        query = self.query.order_by(time_field, pk_field)
+        if page_request.after is not None:
+            time, pk = pagination.check_key(page_request.after, 2)
+            query = query.filter(
+                models.Q(**{f"{time_field}__gt": time})
+                | models.Q(**{time_field: time, f"{pk_field}__gt": pk})
+            )
+        # one more object tells whether there's a next page
+        return query[: page_request.limit + 1]
+
+    def create_page(
+        self, items: list[ModelType], page_request: pagination.PageRequest
+    ) -> pagination.Page[ModelType]:
+        if len(items) <= page_request.limit:
+            return pagination.Page(items, None)
+
+        items = items[: page_request.limit]
+        return pagination.Page(items, self.page_key(items[-1]))
+
+    def in_time_range(self, time_range: pagination.TimeRange) -> typing.Self:
+        time_field = self.keyset_fields[0]
+        query = self.query
+        if time_range.since is not None:
+            query = query.filter(**{f"{time_field}__gte": time_range.since})
+        if time_range.until is not None:
+            query = query.filter(**{f"{time_field}__lt": time_range.until})
+        return self.with_query(query)
+
+    def only(self, fields: abc.Collection[str] | None) -> typing.Self:
+        if not fields:
+            return self
+        return self.with_query(self.query.only(*fields))
+
+    def values_rows(self, fields: abc.Sequence[str]) -> typing.Self:
+        row_fields = (
+            *fields,
+            *(field for field in self.keyset_fields if field not in fields),
+        )
+        key_indexes = (row_fields.index(field) for field in self.keyset_fields)
+        return DjangoModelQuery(
+            self.query.values_list(*row_fields),
+            keyset_fields=self.keyset_fields,
+            page_key=operator.itemgetter(*key_indexes),
+        )
+
+    # rows are fetched in chunks, so streamed queries aren't loaded at once
     def __aiter__(self):
-        return aiter(self.query.all())
+        # not `aiterator()`, it runs `values_list()` queries in the event loop
+        return iterate_in_chunks(self.query.iterator(chunk_size=ITERATOR_CHUNK_SIZE))
+
+    def __iter__(self):
+        return self.query.iterator(chunk_size=ITERATOR_CHUNK_SIZE)
 
     async def bulk_create(self, objects: abc.Iterable[ModelType]):
         await self.query.abulk_create(objects)
 
+    def bulk_create_sync(self, objects: abc.Iterable[ModelType]):
+        self.query.bulk_create(objects)
+
+    def update_returning_sync(
+        self, values: abc.Mapping[str, typing.Any]
+    ) -> tuple[dict[str, typing.Any], ModelType]:
+        """Update the single object of the query.
+
+        Only PostgreSQL updates it in one round-trip, see
+        `update_returning_postgresql`. Other backends, e.g. SQLite, still
+        select the object for update before updating it.
+        """
+        query = self.query.all()
+        if not values:
+            return {}, query.get()
+
+        connection = connections[query.db]
+        if connection.vendor == "postgresql":
+            return update_returning_postgresql(query, values, connection)
+
+        # RETURNING of other backends (e.g. SQLite) reports updated values only,
+        # so previous values are selected first, no round-trip is saved
+        with transaction.atomic(using=query.db):
+            instance = query.select_for_update().get()
+            previous = {name: getattr(instance, name) for name in values}
+            query.update(**values)
+        for name, value in values.items():
+            setattr(instance, name, value)
+        return previous, instance
+
     def by_id(self, pk) -> typing.Self:
-        return DjangoModelQuery(self.query.filter(pk=pk))
+        return self.with_query(self.query.filter(pk=pk))
 
     def by_public_id(self, public_id) -> typing.Self:
-        return DjangoModelQuery(self.query.filter(public_id=public_id))
+        return self.with_query(self.query.filter(public_id=public_id))
 
     def by_project_id(self, project_id) -> typing.Self:
-        return DjangoModelQuery(self.query.filter(project_id=project_id))
+        return self.with_query(self.query.filter(project_id=project_id))
 
     def by_ticket_id(self, ticket_id) -> typing.Self:
-        return DjangoModelQuery(self.query.filter(ticket_id=ticket_id))
+        return self.with_query(self.query.filter(ticket_id=ticket_id))
 
     def by_object_id(self, object_id) -> typing.Self:
-        return DjangoModelQuery(self.query.filter(object_id=object_id))
+        return self.with_query(self.query.filter(object_id=object_id))
+
+    def by_object_ids_of(self, objects: AbstractModelQuery) -> typing.Self:
+        return self.with_query(
+            self.query.filter(object_id__in=objects.query.values("pk"))
+        )
+
+    def by_ticket_project_id(self, project_id) -> typing.Self:
+        return self.with_query(self.query.filter(ticket__project_id=project_id))
+
+    def with_object_type(self, object_type: str) -> typing.Self:
+        return self.with_query(
+            self.query.annotate(
+                object_type=models.Value(object_type, output_field=models.TextField())
+            )
+        )
+
+
+def update_returning_sql(
+    query: models.QuerySet,
+    values: abc.Mapping[str, typing.Any],
+    connection,
+) -> tuple[str, tuple[typing.Any, ...]]:
+    """SQL updating the object of the query, previous values from a self-join.
+
+    `UPDATE t SET ... FROM (SELECT ... FOR UPDATE) AS previous
+    WHERE t.pk = previous.pk RETURNING previous.*, t.*`
+
+    Columns of the subquery are aliased, they're named by columns otherwise.
+    Values are prepared like `QuerySet.update()` does.
+    """
+    opts = query.model._meta
+    quote_name = connection.ops.quote_name
+    table = quote_name(opts.db_table)
+    updated_fields = [opts.get_field(name) for name in values]
+    aliases = [f"previous_{index}" for index in range(len(updated_fields))]
+
+    previous_query = (
+        query.select_for_update()
+        .order_by()
+        .values(
+            previous_pk=models.F("pk"),
+            **{
+                alias: models.F(field.attname)
+                for alias, field in zip(aliases, updated_fields)
+            },
+        )
+    )
+    previous_sql, previous_params = previous_query.query.get_compiler(
+        connection=connection
+    ).as_sql()
+    assignments = ", ".join(
+        f"{quote_name(field.column)} = %s" for field in updated_fields
+    )
+    returning = ", ".join(
+        (
+            *(f"previous.{quote_name(alias)}" for alias in aliases),
+            *(f"{table}.{quote_name(field.column)}" for field in opts.concrete_fields),
+        )
+    )
+    sql = (
+        f"UPDATE {table} SET {assignments} FROM ({previous_sql}) AS previous"
+        f" WHERE {table}.{quote_name(opts.pk.column)} ="
+        f" previous.{quote_name('previous_pk')} RETURNING {returning}"
+    )
+    params = (
+        *(
+            field.get_db_prep_save(value, connection)
+            for field, value in zip(updated_fields, values.values())
+        ),
+        *previous_params,
+    )
+    return sql, params
+
+
+def update_returning_postgresql[ModelType: models.Model](
+    query: models.QuerySet[ModelType],
+    values: abc.Mapping[str, typing.Any],
+    connection,
+) -> tuple[dict[str, typing.Any], ModelType]:
+    """Update the object in one round-trip, see `update_returning_sql`."""
+    model = query.model
+    opts = model._meta
+    updated_fields = [opts.get_field(name) for name in values]
+    fields = opts.concrete_fields
+
+    # `FOR UPDATE` needs a transaction, no savepoint is created in an outer one
+    with transaction.atomic(using=query.db, savepoint=False):
+        with connection.cursor() as cursor:
+            cursor.execute(*update_returning_sql(query, values, connection))
+            row = cursor.fetchone()
+    if row is None:
+        raise model.DoesNotExist(f"{opts.object_name} matching query does not exist.")
+
+    compiler = query.query.get_compiler(connection=connection)
+    columns = [field.get_col(opts.db_table) for field in (*updated_fields, *fields)]
+    (row,) = compiler.apply_converters([row], compiler.get_converters(columns))
+
+    previous = dict(zip(values, row[: len(updated_fields)]))
+    instance = model.from_db(
+        query.db, [field.attname for field in fields], row[len(updated_fields) :]
+    )
+    return previous, instance
+
+
+class DjangoMergedQuery[ModelType](
+    AbstractQuery[abc.Sequence[DjangoModelQuery[ModelType]], ModelType]
+):
+    """Queries with the same kind of keyset merged into one list, e.g. histories.
+
+    Keys of merged objects are `(time, source index, pk)`, so they're unique
+    across sources. A page is merged from a page of every source query.
+    """
+
+    def source_page_query(
+        self, index: int, page_request: pagination.PageRequest
+    ) -> models.QuerySet:
+        source = self.query[index]
+        time_field, pk_field = source.keyset_fields
+        query = source.query.order_by(time_field, pk_field)
+        if page_request.after is not None:
+            time, after_index, pk = pagination.check_key(page_request.after, 3)
+            if index < after_index:
+                query = query.filter(**{f"{time_field}__gt": time})
+            elif index > after_index:
+                query = query.filter(**{f"{time_field}__gte": time})
+            else:
+                query = query.filter(
+                    models.Q(**{f"{time_field}__gt": time})
+                    | models.Q(**{time_field: time, f"{pk_field}__gt": pk})
+                )
+        return query[: page_request.limit + 1]
+
+    def keyed(
+        self, index: int, items: abc.Iterable[ModelType]
+    ) -> abc.Iterator[tuple[pagination.PageKey, ModelType]]:
+        page_key = self.query[index].page_key
+        for item in items:
+            time, pk = page_key(item)
+            yield (time, index, pk), item
+
+    def merge(
+        self, sources: abc.Sequence[abc.Iterable[ModelType]]
+    ) -> abc.Iterator[tuple[pagination.PageKey, ModelType]]:
+        return heapq.merge(
+            *(self.keyed(index, items) for index, items in enumerate(sources)),
+            key=operator.itemgetter(0),
+        )
+
+    def create_page(
+        self,
+        sources: abc.Sequence[abc.Iterable[ModelType]],
+        page_request: pagination.PageRequest,
+    ) -> pagination.Page[ModelType]:
+        merged = list(itertools.islice(self.merge(sources), page_request.limit + 1))
+        items = [item for _, item in merged[: page_request.limit]]
+        if len(merged) <= page_request.limit:
+            return pagination.Page(items, None)
+        return pagination.Page(items, merged[page_request.limit - 1][0])
+
+    async def page(
+        self, page_request: pagination.PageRequest
+    ) -> pagination.Page[ModelType]:
+        sources = [
+            [item async for item in self.source_page_query(index, page_request)]
+            for index in range(len(self.query))
+        ]
+        return self.create_page(sources, page_request)
+
+    def page_sync(
+        self, page_request: pagination.PageRequest
+    ) -> pagination.Page[ModelType]:
+        sources = [
+            list(self.source_page_query(index, page_request))
+            for index in range(len(self.query))
+        ]
+        return self.create_page(sources, page_request)
+
+    def in_time_range(self, time_range: pagination.TimeRange) -> typing.Self:
+        return DjangoMergedQuery(
+            [source.in_time_range(time_range) for source in self.query]
+        )
+
+    def __aiter__(self):
+        return iterate_in_chunks(iter(self))
+
+    def __iter__(self):
+        sources = [
+            source.query.order_by(*source.keyset_fields).iterator(
+                chunk_size=ITERATOR_CHUNK_SIZE
+            )
+            for source in self.query
+        ]
+        return (item for _, item in self.merge(sources))
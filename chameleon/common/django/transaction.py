@@ -1,5 +1,8 @@
 from asgiref.sync import sync_to_async
 from django.db.transaction import Atomic
+from django.db.transaction import atomic
+
+__all__ = ["AsyncAtomicContextManager", "aatomic", "atomic"]
 
 
 class AsyncAtomicContextManager(Atomic):
@@ -0,0 +1,110 @@
+"""Warmup of a worker before it serves the first request.
+
+Validators, compiled checks and mappers are created lazily on first use. The
+warmup creates them all and sends one synthetic GET request to every route,
+so the first real requests don't pay for it. Routes get `0` for every path
+parameter, it's no object's public ID, requests don't change any data.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+import typing
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.test import RequestFactory
+
+from chameleon.step import mapping
+from chameleon.step import validation
+from chameleon.step.core import router
+from chameleon.step.framework import steps_django
+from chameleon.step.validation import jsonschema
+
+__all__ = ["warmup", "warmup_requests"]
+
+logger = logging.getLogger(__name__)
+
+WARMUP_PARAMETER = "0"
+
+
+class WarmupRequest(typing.NamedTuple):
+    path: str
+    handler: typing.Any
+    kwargs: dict[str, str]
+
+
+def warmup_requests(routes: router.Routes) -> list[WarmupRequest]:
+    """Synthetic requests to every route, parameters are `WARMUP_PARAMETER`."""
+    requests = []
+    for route, handler in router.RouteTrie(routes).routes():
+        segments = router.split_route(route)
+        parameters = [s[1:-1] for s in segments if router.is_parameter(s)]
+        path = "/".join(
+            WARMUP_PARAMETER if router.is_parameter(s) else s for s in segments
+        )
+        requests.append(
+            WarmupRequest(
+                path=f"/{path}",
+                handler=handler,
+                kwargs=dict.fromkeys(parameters, WARMUP_PARAMETER),
+            )
+        )
+    return sorted(requests, key=lambda request: request.path)
+
+
+def warmup(routes: router.Routes, *, sync: bool = False):
+    """Create validators and mappers and send a GET request to every route.
+
+    Requests are sent from a new thread with its own event loop, the caller
+    could have a running one, e.g. ASGI server importing the application.
+
+    Args:
+        routes: API routes to warm up.
+        sync: Warm up the sync pipeline of API views served by WSGI.
+    """
+    start = time.perf_counter()
+    jsonschema.warmup_validators()
+    validation.registry.warmup()
+    mapping.registry.warmup()
+
+    requests = warmup_requests(routes)
+    if sync:
+        requests = [
+            request._replace(handler=steps_django.sync_view(request.handler))
+            for request in requests
+        ]
+    thread = threading.Thread(
+        target=send_requests, args=(requests,), name="chameleon-warmup"
+    )
+    thread.start()
+    thread.join()
+
+    logger.info(
+        "Warmed up %d routes in %.1f ms",
+        len(requests),
+        (time.perf_counter() - start) * 1000,
+    )
+
+
+def send_requests(requests: list[WarmupRequest]):
+    loop = asyncio.new_event_loop()
+    try:
+        for request in requests:
+            send_request(loop, request)
+        # async handlers query the database from the sync thread
+        loop.run_until_complete(sync_to_async(connections.close_all)())
+    finally:
+        loop.close()
+        connections.close_all()
+
+
+def send_request(loop: asyncio.AbstractEventLoop, request: WarmupRequest):
+    try:
+        response = request.handler(RequestFactory().get(request.path), **request.kwargs)
+        if inspect.isawaitable(response):
+            loop.run_until_complete(response)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning("Warmup request to %s failed", request.path, exc_info=True)
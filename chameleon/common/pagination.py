@@ -0,0 +1,202 @@
+"""Keyset pagination with opaque cursors.
+
+Pages are ordered by `(creation_time, id)`, or another keyset like
+`(timestamp, id)` of history, and the cursor is the key of the last object
+of the previous page, so fetching a page costs the same no matter how deep
+it is, unlike offsets. Cursors are opaque to clients, they follow the `Link`
+response header. Clients wanting the whole list could ask for a stream instead
+with `stream=true`, rows are then serialized as they're fetched.
+
+Lists could be limited to a time range of the first keyset field with `since`
+(inclusive) and `until` (exclusive) ISO 8601 timestamps, e.g. `2024-05-01T12:00Z`.
+"""
+
+import base64
+import datetime
+import typing
+from collections import abc
+from urllib import parse
+
+import orjson
+
+from chameleon.step import core
+
+if typing.TYPE_CHECKING:
+    from chameleon.common.query import AbstractQuery
+
+__all__ = (
+    "InvalidPageRequest",
+    "Page",
+    "PageRequest",
+    "TimeRange",
+    "decode_cursor",
+    "encode_cursor",
+    "paginate",
+    "paginate_sync",
+)
+
+# `(time, pk)`, merged lists have more parts like `(time, source, pk)`
+type PageKey = tuple[datetime.datetime, *tuple[int, ...]]
+
+KEYSET_FIELDS = ("creation_time", "id")
+HISTORY_KEYSET_FIELDS = ("timestamp", "id")
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+LIMIT_PARAMETER = "limit"
+CURSOR_PARAMETER = "cursor"
+SINCE_PARAMETER = "since"
+UNTIL_PARAMETER = "until"
+STREAM_PARAMETER = "stream"
+STREAM_VALUES = frozenset(("1", "true"))
+LINK_HEADER = "Link"
+
+
+class InvalidPageRequest(ValueError):
+    """Invalid `limit`, `cursor`, `since` or `until` query parameter."""
+
+
+class Page[ModelType](typing.NamedTuple):
+    items: abc.Sequence[ModelType]
+    next_key: PageKey | None
+
+
+class PageRequest(typing.NamedTuple):
+    limit: int = DEFAULT_LIMIT
+    after: PageKey | None = None
+
+    @classmethod
+    def from_query(cls, query: abc.Mapping[str, str] | None) -> typing.Self:
+        if not query:
+            return cls()
+
+        limit = query.get(LIMIT_PARAMETER)
+        cursor = query.get(CURSOR_PARAMETER)
+        return cls(
+            limit=DEFAULT_LIMIT if limit is None else parse_limit(limit),
+            after=decode_cursor(cursor) if cursor else None,
+        )
+
+
+class TimeRange(typing.NamedTuple):
+    since: datetime.datetime | None = None
+    until: datetime.datetime | None = None
+
+    @classmethod
+    def from_query(cls, query: abc.Mapping[str, str] | None) -> typing.Self:
+        if not query:
+            return cls()
+
+        since = query.get(SINCE_PARAMETER)
+        until = query.get(UNTIL_PARAMETER)
+        return cls(
+            since=parse_timestamp(since) if since else None,
+            until=parse_timestamp(until) if until else None,
+        )
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """Parse ISO 8601 timestamp, UTC if it has no time zone."""
+    try:
+        timestamp = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise InvalidPageRequest(f"Invalid timestamp: {value!r}") from None
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.UTC)
+    return timestamp
+
+
+def parse_limit(value: str) -> int:
+    try:
+        limit = int(value)
+    except ValueError:
+        raise InvalidPageRequest(f"Invalid limit: {value!r}") from None
+
+    if not 1 <= limit <= MAX_LIMIT:
+        raise InvalidPageRequest(f"Limit must be between 1 and {MAX_LIMIT}")
+
+    return limit
+
+
+def encode_cursor(key: PageKey) -> str:
+    time, *parts = key
+    value = orjson.dumps((time.isoformat(), *parts))
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> PageKey:
+    try:
+        value = orjson.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        time, pk, *parts = value
+        return (
+            datetime.datetime.fromisoformat(time),
+            int(pk),
+            *(int(part) for part in parts),
+        )
+    except (orjson.JSONDecodeError, TypeError, ValueError):
+        raise InvalidPageRequest(f"Invalid cursor: {cursor!r}") from None
+
+
+def check_key(key: PageKey, size: int) -> PageKey:
+    """Reject keys of another list, e.g. a cursor of a merged list."""
+    if len(key) != size:
+        raise InvalidPageRequest("Cursor of another list")
+    return key
+
+
+def next_link(query: abc.Mapping[str, str] | None, key: PageKey) -> str:
+    """`Link` header value of the next page relative to the current URL."""
+    # not `{**query}`, it would expose lists of Django `QueryDict`
+    parameters = {name: query[name] for name in query or ()}
+    parameters[CURSOR_PARAMETER] = encode_cursor(key)
+    return f'<?{parse.urlencode(parameters)}>; rel="next"'
+
+
+def is_stream_requested(query: abc.Mapping[str, str] | None) -> bool:
+    return bool(query) and query.get(STREAM_PARAMETER, "").lower() in STREAM_VALUES
+
+
+def set_next_link[ModelType](context: core.StepContext, page: Page[ModelType]):
+    if page.next_key is None:
+        return
+
+    if context.response_headers is None:
+        context.response_headers = {}
+    context.response_headers[LINK_HEADER] = next_link(
+        context.request_info.query, page.next_key
+    )
+
+
+def paginate_sync[ModelType](
+    context: core.StepContext, query: "AbstractQuery[typing.Any, ModelType]"
+) -> abc.Iterable[ModelType]:
+    """Get the requested page of the query and link the next one.
+
+    The query itself is returned to be streamed if it's requested,
+    `limit` and `cursor` are ignored then.
+    """
+    if is_stream_requested(context.request_info.query):
+        return query
+
+    page = query.page_sync(PageRequest.from_query(context.request_info.query))
+    set_next_link(context, page)
+    return page.items
+
+
+async def paginate[ModelType](
+    context: core.StepContext, query: "AbstractQuery[typing.Any, ModelType]"
+) -> abc.Iterable[ModelType]:
+    """Get the requested page of the query and link the next one.
+
+    The query itself is returned to be streamed if it's requested,
+    `limit` and `cursor` are ignored then.
+    """
+    if is_stream_requested(context.request_info.query):
+        return query
+
+    page = await query.page(PageRequest.from_query(context.request_info.query))
+    set_next_link(context, page)
+    return page.items
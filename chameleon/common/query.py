@@ -1,6 +1,9 @@
 import typing
 from collections import abc
 
+if typing.TYPE_CHECKING:
+    from chameleon.common import pagination
+
 
 class AbstractQuery[QueryType, ModelType]:
     """Abstraction layer over a query/session object."""
@@ -14,16 +17,74 @@ class AbstractQuery[QueryType, ModelType]:
         """Get a single object from query."""
         raise NotImplementedError("Not implemented")
 
+    def first_sync(self) -> ModelType:
+        """Get a single object from query synchronously."""
+        raise NotImplementedError("Not implemented")
+
     async def all(self) -> abc.Sequence[ModelType]:
         """Get all objects from query."""
         return [value async for value in self]
 
+    def all_sync(self) -> abc.Sequence[ModelType]:
+        """Get all objects from query synchronously."""
+        return list(self)
+
+    async def latest_value(self, field: str) -> typing.Any:
+        """Get the greatest value of the field, None for empty query."""
+        raise NotImplementedError("Not implemented")
+
+    def latest_value_sync(self, field: str) -> typing.Any:
+        """Get the greatest value of the field synchronously."""
+        raise NotImplementedError("Not implemented")
+
+    async def page(
+        self, page_request: "pagination.PageRequest"
+    ) -> "pagination.Page[ModelType]":
+        """Get a page of objects ordered by keyset, e.g. `(creation_time, id)`."""
+        raise NotImplementedError("Not implemented")
+
+    def page_sync(
+        self, page_request: "pagination.PageRequest"
+    ) -> "pagination.Page[ModelType]":
+        """Get a page of objects synchronously."""
+        raise NotImplementedError("Not implemented")
+
+    def in_time_range(self, time_range: "pagination.TimeRange") -> typing.Self:
+        """Filter objects by the first keyset field, e.g. `timestamp`."""
+        raise NotImplementedError("Not implemented")
+
+    def only(self, fields: abc.Collection[str] | None) -> typing.Self:
+        """Load only given fields of objects, all of them if None."""
+        raise NotImplementedError("Not implemented")
+
+    def values_rows(self, fields: abc.Sequence[str]) -> typing.Self:
+        """Query tuples of field values instead of objects.
+
+        Keyset fields are appended if missing, so rows could be paginated.
+        """
+        raise NotImplementedError("Not implemented")
+
     async def __aiter__(self):
         raise NotImplementedError("Not implemented")
 
+    def __iter__(self):
+        raise NotImplementedError("Not implemented")
+
     async def bulk_create(self, objects: abc.Iterable[ModelType]):
         raise NotImplementedError("Not implemented")
 
+    def bulk_create_sync(self, objects: abc.Iterable[ModelType]):
+        raise NotImplementedError("Not implemented")
+
+    def update_returning_sync(
+        self, values: abc.Mapping[str, typing.Any]
+    ) -> tuple[dict[str, typing.Any], ModelType]:
+        """Update the single object of the query.
+
+        Returns previous values of updated fields and the updated object.
+        """
+        raise NotImplementedError("Not implemented")
+
 
 class AbstractModelQuery[QueryType, ModelType](AbstractQuery[QueryType, ModelType]):
     """Abstraction layer over query/session object to cover business logic."""
@@ -42,3 +103,14 @@ class AbstractModelQuery[QueryType, ModelType](AbstractQuery[QueryType, ModelTyp
 
     def by_ticket_id(self, ticket_id) -> typing.Self:
         raise NotImplementedError("Not implemented")
+
+    def by_object_ids_of(self, objects: "AbstractModelQuery") -> typing.Self:
+        """Filter history of given objects."""
+        raise NotImplementedError("Not implemented")
+
+    def by_ticket_project_id(self, project_id) -> typing.Self:
+        raise NotImplementedError("Not implemented")
+
+    def with_object_type(self, object_type: str) -> typing.Self:
+        """Add `object_type` attribute to objects, e.g. to merged histories."""
+        raise NotImplementedError("Not implemented")
@@ -10,3 +10,22 @@ def register_mapping_history_output(*, type_id: str, action_id: str | None):
         fields=("timestamp", "action", "field", "value_from", "value_to"),
         custom_converters={"timestamp": datetime.as_utc},
     )
+
+
+def register_mapping_activity_output(*, type_id: str, action_id: str | None):
+    """Histories of several object types merged, see `with_object_type`."""
+    mapping.register_simple_mapping_from_object(
+        type_id=type_id,
+        action_id=action_id,
+        target_object_type=dict,
+        fields=(
+            "timestamp",
+            "object_type",
+            "object_id",
+            "action",
+            "field",
+            "value_from",
+            "value_to",
+        ),
+        custom_converters={"timestamp": datetime.as_utc, "object_id": str},
+    )
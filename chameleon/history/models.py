@@ -4,6 +4,7 @@ from collections import abc
 
 from django.db import models
 
+from chameleon.common.django import cache
 from chameleon.common.django.models import ChameleonBaseModel
 from chameleon.history.utils import generate_history_objects
 from chameleon.step.mapping.datetime import utcnow
@@ -30,6 +31,22 @@ class ChameleonObjectWithHistoryBase(ChameleonBaseModel):
     history_class: typing.ClassVar[type[ChameleonHistoryBase]]
     creation_type: models.DateTimeField
 
+    # response cache tags: `{cache_type}`, `{cache_type}:{pk}` and
+    # `{parent}:{parent_id}:{cache_type}` for every parent foreign key
+    cache_type: typing.ClassVar[str]
+    cache_parents: typing.ClassVar[tuple[str, ...]] = ()
+
+    def cache_tags(self) -> tuple[str, ...]:
+        """Tags of cached responses to be invalidated on changes."""
+        return (
+            self.cache_type,
+            f"{self.cache_type}:{self.pk}",
+            *(
+                f"{parent}:{getattr(self, f'{parent}_id')}:{self.cache_type}"
+                for parent in self.cache_parents
+            ),
+        )
+
     async def insert_with_history(self):
         now = utcnow()
 
@@ -43,6 +60,22 @@ class ChameleonObjectWithHistoryBase(ChameleonBaseModel):
             action="CREATE",
             timestamp=now,
         )
+        await cache.ainvalidate_on_commit(self.cache_tags())
+
+    def insert_with_history_sync(self):
+        now = utcnow()
+
+        self.creation_time = now  # pylint: disable=attribute-defined-outside-init
+        self.insert_sync()
+
+        source_object = self.to_dict()
+        self.create_history_sync(
+            source_object=None,
+            target_object=source_object,
+            action="CREATE",
+            timestamp=now,
+        )
+        cache.invalidate_on_commit(self.cache_tags())
 
     async def update_with_history(self, **values: typing.Any):
         now = utcnow()
@@ -54,6 +87,29 @@ class ChameleonObjectWithHistoryBase(ChameleonBaseModel):
         await self.create_history(
             source_object=source, target_object=target, action="UPDATE", timestamp=now
         )
+        await cache.ainvalidate_on_commit(self.cache_tags())
+
+    @classmethod
+    def update_by_id_with_history_sync(cls, pk, **values: typing.Any) -> typing.Self:
+        """Update the object and derive history from previous values at once.
+
+        The object isn't loaded beforehand on PostgreSQL, other backends load
+        it in the same transaction, see `update_returning_sync`.
+        """
+        now = utcnow()
+
+        previous, instance = cls.query.by_id(pk).update_returning_sync(values)
+        instance.create_history_sync(
+            source_object={"id": instance.pk, **previous},
+            target_object=instance.updated_values(values),
+            action="UPDATE",
+            timestamp=now,
+        )
+        cache.invalidate_on_commit(instance.cache_tags())
+        return instance
+
+    def updated_values(self, values: abc.Mapping[str, typing.Any]) -> dict:
+        return {"id": self.pk, **{name: getattr(self, name) for name in values}}
 
     async def create_history(
         self,
@@ -71,3 +127,20 @@ class ChameleonObjectWithHistoryBase(ChameleonBaseModel):
             timestamp=timestamp,
         )
         await self.history_class.query.bulk_create(history_objects)
+
+    def create_history_sync(
+        self,
+        *,
+        source_object: abc.Mapping[str, typing.Any] | typing.Self | None,
+        target_object: abc.Mapping[str, typing.Any] | typing.Self | None,
+        action: str,
+        timestamp: datetime.datetime,
+    ):
+        history_objects = generate_history_objects(
+            source_object=source_object,
+            target_object=target_object,
+            history_model=self.history_class,
+            action=action,
+            timestamp=timestamp,
+        )
+        self.history_class.query.bulk_create_sync(history_objects)
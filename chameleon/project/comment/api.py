@@ -1,45 +1,96 @@
+import datetime
+
+from chameleon.common import pagination
+from chameleon.common.django import executor
 from chameleon.common.django import transaction
+from chameleon.common.query import AbstractModelQuery
 from chameleon.project.comment.models import ChameleonComment
 from chameleon.project.comment.models import ChameleonCommentHistory
 from chameleon.step import core
+from chameleon.step.steps import fieldsets
+
+
+def comment_history_query(context: core.StepContext) -> AbstractModelQuery:
+    comment_id = context.custom_info["comment_id"]
+    return ChameleonCommentHistory.query.by_object_id(
+        object_id=comment_id
+    ).in_time_range(pagination.TimeRange.from_query(context.request_info.query))
 
 
+def comment_history_sync(context: core.StepContext):
+    context.output_business = pagination.paginate_sync(
+        context, comment_history_query(context)
+    )
+
+
+@core.with_sync_variant(comment_history_sync)
 async def comment_history(context: core.StepContext):
+    context.output_business = await pagination.paginate(
+        context, comment_history_query(context)
+    )
+
+
+def comment_last_modified_sync(context: core.StepContext) -> datetime.datetime | None:
+    comment_id = context.custom_info["comment_id"]
+    return ChameleonCommentHistory.query.by_object_id(
+        object_id=comment_id
+    ).latest_value_sync("timestamp")
+
+
+async def comment_last_modified(context: core.StepContext) -> datetime.datetime | None:
     comment_id = context.custom_info["comment_id"]
-    history = await ChameleonCommentHistory.query.by_object_id(
+    return await ChameleonCommentHistory.query.by_object_id(
         object_id=comment_id
-    ).all()
-    context.output_business = history
+    ).latest_value("timestamp")
 
 
-async def comment_create_fun(context: core.StepContext):
+def comment_create_fun_sync(context: core.StepContext):
     comment: ChameleonComment = context.input_business
     ticket_id = context.custom_info["ticket_id"]
     comment.ticket_id = ticket_id
 
-    async with transaction.aatomic():
-        await comment.insert_with_history()
+    with transaction.atomic():
+        comment.insert_with_history_sync()
 
     context.output_business = comment
 
 
-async def comment_list_fun(context: core.StepContext):
+comment_create_fun = executor.sync_business_step(comment_create_fun_sync)
+
+
+def comment_list_query(context: core.StepContext) -> AbstractModelQuery:
     ticket_id = context.custom_info["ticket_id"]
-    context.output_business = await ChameleonComment.query.by_ticket_id(ticket_id).all()
+    return ChameleonComment.query.by_ticket_id(ticket_id)
 
 
+def comment_get_fun_sync(context: core.StepContext):
+    comment_id = context.custom_info["comment_id"]
+    context.output_business = (
+        ChameleonComment.query.by_id(comment_id)
+        .only(fieldsets.source_fields(context))
+        .first_sync()
+    )
+
+
+@core.with_sync_variant(comment_get_fun_sync)
 async def comment_get_fun(context: core.StepContext):
     comment_id = context.custom_info["comment_id"]
-    context.output_business = await ChameleonComment.query.by_id(comment_id).first()
+    context.output_business = (
+        await ChameleonComment.query.by_id(comment_id)
+        .only(fieldsets.source_fields(context))
+        .first()
+    )
 
 
-async def comment_update_fun(context: core.StepContext):
+def comment_update_fun_sync(context: core.StepContext):
     comment_id = context.custom_info["comment_id"]
     comment_data = context.input_business
-    async with transaction.aatomic():
-        comment: ChameleonComment = await ChameleonComment.query.by_id(
-            comment_id
-        ).first()
-        await comment.update_with_history(**comment_data)
+    with transaction.atomic():
+        comment = ChameleonComment.update_by_id_with_history_sync(
+            comment_id, **comment_data
+        )
 
     context.output_business = comment
+
+
+comment_update_fun = executor.sync_business_step(comment_update_fun_sync)
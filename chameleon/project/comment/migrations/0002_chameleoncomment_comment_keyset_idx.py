@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:20
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chameleon_project_comment", "0001_initial"),
+        ("chameleon_project_ticket", "0003_chameleonticket_ticket_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chameleoncomment",
+            index=models.Index(
+                fields=["ticket", "creation_time", "id"], name="comment_keyset_idx"
+            ),
+        ),
+    ]
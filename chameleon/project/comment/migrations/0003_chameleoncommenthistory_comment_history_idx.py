@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:35
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chameleon_project_comment", "0002_chameleoncomment_comment_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="chameleoncommenthistory",
+            options={"ordering": ["timestamp", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="chameleoncommenthistory",
+            index=models.Index(
+                fields=["object_id", "timestamp", "id"], name="comment_history_idx"
+            ),
+        ),
+    ]
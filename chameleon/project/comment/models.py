@@ -1,5 +1,6 @@
 from django.db import models
 
+from chameleon.common import pagination
 from chameleon.common.django.fields import markup_field
 from chameleon.common.django.query import DjangoModelQuery
 from chameleon.history.models import ChameleonHistoryBase
@@ -10,15 +11,32 @@ __all__ = ["ChameleonComment", "ChameleonCommentHistory"]
 
 
 class ChameleonCommentHistory(ChameleonHistoryBase):
+    class Meta:
+        ordering = ["timestamp", "id"]
+        # history of an object by time, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(
+                fields=["object_id", "timestamp", "id"], name="comment_history_idx"
+            )
+        ]
+
     objects = models.QuerySet.as_manager()
-    query = DjangoModelQuery(objects)
+    query = DjangoModelQuery(objects, keyset_fields=pagination.HISTORY_KEYSET_FIELDS)
 
 
 class ChameleonComment(ChameleonObjectWithHistoryBase):
     class Meta:
         ordering = ["creation_time"]
+        # keyset pagination, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(
+                fields=["ticket", "creation_time", "id"], name="comment_keyset_idx"
+            )
+        ]
 
     history_class = ChameleonCommentHistory
+    cache_type = "comment"
+    cache_parents = ("ticket",)
     objects = models.QuerySet.as_manager()
     query = DjangoModelQuery(objects)
 
@@ -1,43 +1,133 @@
+import datetime
+
+from chameleon.common import pagination
+from chameleon.common.django import executor
 from chameleon.common.django import transaction
+from chameleon.common.django.query import DjangoMergedQuery
+from chameleon.common.query import AbstractModelQuery
+from chameleon.common.query import AbstractQuery
+from chameleon.project.comment.models import ChameleonComment
+from chameleon.project.comment.models import ChameleonCommentHistory
 from chameleon.project.project.models import ChameleonProject
 from chameleon.project.project.models import ChameleonProjectHistory
+from chameleon.project.ticket.models import ChameleonTicket
+from chameleon.project.ticket.models import ChameleonTicketHistory
 from chameleon.step import core
+from chameleon.step.steps import fieldsets
+
+
+def project_history_query(context: core.StepContext) -> AbstractModelQuery:
+    project_id = context.custom_info["project_id"]
+    return ChameleonProjectHistory.query.by_object_id(
+        object_id=project_id
+    ).in_time_range(pagination.TimeRange.from_query(context.request_info.query))
+
+
+def project_history_sync(context: core.StepContext):
+    context.output_business = pagination.paginate_sync(
+        context, project_history_query(context)
+    )
 
 
+@core.with_sync_variant(project_history_sync)
 async def project_history(context: core.StepContext):
+    context.output_business = await pagination.paginate(
+        context, project_history_query(context)
+    )
+
+
+def project_activity_query(context: core.StepContext) -> AbstractQuery:
+    """History of the project, its tickets and their comments by time."""
     project_id = context.custom_info["project_id"]
-    history = await ChameleonProjectHistory.query.by_object_id(
+    tickets = ChameleonTicket.query.by_project_id(project_id)
+    comments = ChameleonComment.query.by_ticket_project_id(project_id)
+    return DjangoMergedQuery(
+        [
+            ChameleonProjectHistory.query.by_object_id(
+                object_id=project_id
+            ).with_object_type("project"),
+            ChameleonTicketHistory.query.by_object_ids_of(tickets).with_object_type(
+                "ticket"
+            ),
+            ChameleonCommentHistory.query.by_object_ids_of(comments).with_object_type(
+                "comment"
+            ),
+        ]
+    ).in_time_range(pagination.TimeRange.from_query(context.request_info.query))
+
+
+def project_activity_sync(context: core.StepContext):
+    context.output_business = pagination.paginate_sync(
+        context, project_activity_query(context)
+    )
+
+
+@core.with_sync_variant(project_activity_sync)
+async def project_activity(context: core.StepContext):
+    context.output_business = await pagination.paginate(
+        context, project_activity_query(context)
+    )
+
+
+def project_last_modified_sync(context: core.StepContext) -> datetime.datetime | None:
+    project_id = context.custom_info["project_id"]
+    return ChameleonProjectHistory.query.by_object_id(
         object_id=project_id
-    ).all()
-    context.output_business = history
+    ).latest_value_sync("timestamp")
 
 
-async def project_create_fun(context: core.StepContext):
+async def project_last_modified(context: core.StepContext) -> datetime.datetime | None:
+    project_id = context.custom_info["project_id"]
+    return await ChameleonProjectHistory.query.by_object_id(
+        object_id=project_id
+    ).latest_value("timestamp")
+
+
+def project_create_fun_sync(context: core.StepContext):
     project: ChameleonProject = context.input_business
 
-    async with transaction.aatomic():
-        await project.insert_with_history()
+    with transaction.atomic():
+        project.insert_with_history_sync()
 
     context.output_business = project
 
 
-async def project_list_fun(context: core.StepContext):
-    context.output_business = await ChameleonProject.query.all()
+project_create_fun = executor.sync_business_step(project_create_fun_sync)
+
 
+def project_list_query(context: core.StepContext) -> AbstractModelQuery:
+    return ChameleonProject.query
 
+
+def project_get_fun_sync(context: core.StepContext):
+    project_id = context.custom_info["project_id"]
+    context.output_business = (
+        ChameleonProject.query.by_id(project_id)
+        .only(fieldsets.source_fields(context))
+        .first_sync()
+    )
+
+
+@core.with_sync_variant(project_get_fun_sync)
 async def project_get_fun(context: core.StepContext):
     project_id = context.custom_info["project_id"]
-    context.output_business = await ChameleonProject.query.by_id(project_id).first()
+    context.output_business = (
+        await ChameleonProject.query.by_id(project_id)
+        .only(fieldsets.source_fields(context))
+        .first()
+    )
 
 
-async def project_update_fun(context: core.StepContext):
+def project_update_fun_sync(context: core.StepContext):
     project_id = context.custom_info["project_id"]
     project_data = context.input_business
 
-    async with transaction.aatomic():
-        project: ChameleonProject = await ChameleonProject.query.by_id(
-            project_id
-        ).first()
-        await project.update_with_history(**project_data)
+    with transaction.atomic():
+        project = ChameleonProject.update_by_id_with_history_sync(
+            project_id, **project_data
+        )
 
     context.output_business = project
+
+
+project_update_fun = executor.sync_business_step(project_update_fun_sync)
@@ -41,3 +41,4 @@ mapping.register_simple_mapping_from_dict(
 )
 
 history.register_mapping_history_output(type_id="project", action_id="history")
+history.register_mapping_activity_output(type_id="project", action_id="activity")
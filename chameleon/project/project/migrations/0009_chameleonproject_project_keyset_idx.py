@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:20
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chameleon_project_project", "0008_rename_title_chameleonproject_summary"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chameleonproject",
+            index=models.Index(
+                fields=["creation_time", "id"], name="project_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:35
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chameleon_project_project", "0009_chameleonproject_project_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="chameleonprojecthistory",
+            options={"ordering": ["timestamp", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="chameleonprojecthistory",
+            index=models.Index(
+                fields=["object_id", "timestamp", "id"], name="project_history_idx"
+            ),
+        ),
+    ]
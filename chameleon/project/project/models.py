@@ -1,5 +1,6 @@
 from django.db import models
 
+from chameleon.common import pagination
 from chameleon.common.django.fields import markup_field
 from chameleon.common.django.query import DjangoModelQuery
 from chameleon.history.models import ChameleonHistoryBase
@@ -9,15 +10,29 @@ __all__ = ["ChameleonProject", "ChameleonProjectHistory"]
 
 
 class ChameleonProjectHistory(ChameleonHistoryBase):
+    class Meta:
+        ordering = ["timestamp", "id"]
+        # history of an object by time, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(
+                fields=["object_id", "timestamp", "id"], name="project_history_idx"
+            )
+        ]
+
     objects = models.QuerySet.as_manager()
-    query = DjangoModelQuery(objects)
+    query = DjangoModelQuery(objects, keyset_fields=pagination.HISTORY_KEYSET_FIELDS)
 
 
 class ChameleonProject(ChameleonObjectWithHistoryBase):
     class Meta:
         ordering = ["creation_time"]
+        # keyset pagination, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(fields=["creation_time", "id"], name="project_keyset_idx")
+        ]
 
     history_class = ChameleonProjectHistory
+    cache_type = "project"
     objects = models.QuerySet.as_manager()
     query = DjangoModelQuery(objects)
 
@@ -1,43 +1,96 @@
+import datetime
+
+from chameleon.common import pagination
+from chameleon.common.django import executor
 from chameleon.common.django import transaction
+from chameleon.common.query import AbstractModelQuery
 from chameleon.project.ticket.models import ChameleonTicket
 from chameleon.project.ticket.models import ChameleonTicketHistory
 from chameleon.step import core
+from chameleon.step.steps import fieldsets
+
+
+def ticket_history_query(context: core.StepContext) -> AbstractModelQuery:
+    ticket_id = context.custom_info["ticket_id"]
+    return ChameleonTicketHistory.query.by_object_id(object_id=ticket_id).in_time_range(
+        pagination.TimeRange.from_query(context.request_info.query)
+    )
+
 
+def ticket_history_sync(context: core.StepContext):
+    context.output_business = pagination.paginate_sync(
+        context, ticket_history_query(context)
+    )
 
+
+@core.with_sync_variant(ticket_history_sync)
 async def ticket_history(context: core.StepContext):
+    context.output_business = await pagination.paginate(
+        context, ticket_history_query(context)
+    )
+
+
+def ticket_last_modified_sync(context: core.StepContext) -> datetime.datetime | None:
+    ticket_id = context.custom_info["ticket_id"]
+    return ChameleonTicketHistory.query.by_object_id(
+        object_id=ticket_id
+    ).latest_value_sync("timestamp")
+
+
+async def ticket_last_modified(context: core.StepContext) -> datetime.datetime | None:
     ticket_id = context.custom_info["ticket_id"]
-    history = await ChameleonTicketHistory.query.by_object_id(object_id=ticket_id).all()
-    context.output_business = history
+    return await ChameleonTicketHistory.query.by_object_id(
+        object_id=ticket_id
+    ).latest_value("timestamp")
 
 
-async def ticket_create_fun(context: core.StepContext):
+def ticket_create_fun_sync(context: core.StepContext):
     ticket: ChameleonTicket = context.input_business
     project_id = context.custom_info["project_id"]
     ticket.project_id = project_id
 
-    async with transaction.aatomic():
-        await ticket.insert_with_history()
+    with transaction.atomic():
+        ticket.insert_with_history_sync()
 
     context.output_business = ticket
 
 
-async def ticket_list_fun(context: core.StepContext):
+ticket_create_fun = executor.sync_business_step(ticket_create_fun_sync)
+
+
+def ticket_list_query(context: core.StepContext) -> AbstractModelQuery:
     project_id = context.custom_info["project_id"]
-    context.output_business = await ChameleonTicket.query.by_project_id(
-        project_id
-    ).all()
+    return ChameleonTicket.query.by_project_id(project_id)
 
 
+def ticket_get_fun_sync(context: core.StepContext):
+    ticket_id = context.custom_info["ticket_id"]
+    context.output_business = (
+        ChameleonTicket.query.by_id(ticket_id)
+        .only(fieldsets.source_fields(context))
+        .first_sync()
+    )
+
+
+@core.with_sync_variant(ticket_get_fun_sync)
 async def ticket_get_fun(context: core.StepContext):
     ticket_id = context.custom_info["ticket_id"]
-    context.output_business = await ChameleonTicket.query.by_id(ticket_id).first()
+    context.output_business = (
+        await ChameleonTicket.query.by_id(ticket_id)
+        .only(fieldsets.source_fields(context))
+        .first()
+    )
 
 
-async def ticket_update_fun(context: core.StepContext):
+def ticket_update_fun_sync(context: core.StepContext):
     ticket_id = context.custom_info["ticket_id"]
     ticket_data = context.input_business
-    async with transaction.aatomic():
-        ticket: ChameleonTicket = await ChameleonTicket.query.by_id(ticket_id).first()
-        await ticket.update_with_history(**ticket_data)
+    with transaction.atomic():
+        ticket = ChameleonTicket.update_by_id_with_history_sync(
+            ticket_id, **ticket_data
+        )
 
     context.output_business = ticket
+
+
+ticket_update_fun = executor.sync_business_step(ticket_update_fun_sync)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:20
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chameleon_project_project", "0009_chameleonproject_project_keyset_idx"),
+        ("chameleon_project_ticket", "0002_alter_chameleonticket_options"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chameleonticket",
+            index=models.Index(
+                fields=["project", "creation_time", "id"], name="ticket_keyset_idx"
+            ),
+        ),
+    ]
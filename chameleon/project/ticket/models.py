@@ -1,5 +1,6 @@
 from django.db import models
 
+from chameleon.common import pagination
 from chameleon.common.django.query import DjangoModelQuery
 from chameleon.history.models import ChameleonHistoryBase
 from chameleon.history.models import ChameleonObjectWithHistoryBase
@@ -9,15 +10,32 @@ __all__ = ["ChameleonTicket", "ChameleonTicketHistory"]
 
 
 class ChameleonTicketHistory(ChameleonHistoryBase):
+    class Meta:
+        ordering = ["timestamp", "id"]
+        # history of an object by time, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(
+                fields=["object_id", "timestamp", "id"], name="ticket_history_idx"
+            )
+        ]
+
     objects = models.QuerySet.as_manager()
-    query = DjangoModelQuery(objects)
+    query = DjangoModelQuery(objects, keyset_fields=pagination.HISTORY_KEYSET_FIELDS)
 
 
 class ChameleonTicket(ChameleonObjectWithHistoryBase):
     class Meta:
         ordering = ["creation_time"]
+        # keyset pagination, see `chameleon.common.pagination`
+        indexes = [
+            models.Index(
+                fields=["project", "creation_time", "id"], name="ticket_keyset_idx"
+            )
+        ]
 
     history_class = ChameleonTicketHistory
+    cache_type = "ticket"
+    cache_parents = ("project",)
     objects = models.QuerySet.as_manager()
     query = DjangoModelQuery(objects)
 
@@ -1,23 +1,51 @@
+from .compiled import CompiledUrlHandler
+from .concurrent import concurrent_step
 from .context import StepContext
 from .context import StepContextRequestInfo
+from .core import StepHandler
 from .core import StepHandlerProtocol
+from .core import StepTimingSinkProtocol
+from .core import StopProcessing
+from .core import SyncStepHandlerProtocol
 from .core import UrlHandler
 from .core import UrlHandlerSteps
+from .deadline import DeadlineExceeded
+from .deadline import uncancellable_step
 from .multi import StepHandlerMulti
 from .multi import StepsDefinitionDict
 from .registry import ProcessorProtocol
 from .registry import ProcessorRegistry
+from .router import RouteTrie
+from .sync import sync_method_dispatcher
+from .sync import SyncMethodDispatcher
+from .sync import SyncUrlHandler
+from .sync import with_sync_variant
 from .tools import method_dispatcher
+from .tools import MethodDispatcher
 
 __all__ = (
+    "CompiledUrlHandler",
+    "concurrent_step",
     "StepContext",
     "StepContextRequestInfo",
+    "DeadlineExceeded",
+    "uncancellable_step",
+    "StepHandler",
     "StepHandlerProtocol",
+    "StepTimingSinkProtocol",
+    "StopProcessing",
+    "SyncStepHandlerProtocol",
     "UrlHandler",
     "UrlHandlerSteps",
     "StepHandlerMulti",
     "StepsDefinitionDict",
     "ProcessorProtocol",
     "ProcessorRegistry",
+    "RouteTrie",
+    "MethodDispatcher",
     "method_dispatcher",
+    "SyncMethodDispatcher",
+    "SyncUrlHandler",
+    "sync_method_dispatcher",
+    "with_sync_variant",
 )
@@ -0,0 +1,224 @@
+import typing
+from collections import abc
+
+from chameleon.step.core import concurrent
+from chameleon.step.core import context as ctx
+from chameleon.step.core import core
+from chameleon.step.core import multi
+
+__all__ = ("CompiledUrlHandler", "compile_processor_steps")
+
+# Flat representation of a single step: handlers called one after another.
+# None means the step isn't defined, empty tuple means the step is defined,
+# but there's nothing to call for given step name (e.g. mapping without the key).
+FlatStep = tuple[core.StepHandler, ...]
+
+_step_names = core.UrlHandlerSteps()
+process_step_names = tuple(name for name, _ in _step_names.process_order())
+response_step_names = tuple(name for name, _ in _step_names.response_order())
+del _step_names
+
+
+class CompiledSteps(typing.NamedTuple):
+    process_steps: tuple[core.StepEntry, ...]
+    exception_handler: core.StepHandler
+    response_steps: tuple[core.StepEntry, ...]
+
+
+def fallback_step(
+    handler: core.StepHandler,
+    default_handler: core.StepHandler,
+) -> core.StepHandler:
+    """Call default handler only if the handler hasn't handled the context."""
+    handler_is_async = core.is_async_step(handler)
+    default_is_async = core.is_async_step(default_handler)
+
+    if not handler_is_async and not default_is_async:
+
+        def fallback_handler_sync(context: ctx.StepContext) -> bool:
+            return bool(handler(context)) or bool(default_handler(context))
+
+        return fallback_handler_sync
+
+    async def fallback_handler(context: ctx.StepContext) -> bool:
+        handled = handler(context)
+        if handler_is_async:
+            handled = await handled
+        if handled:
+            return True
+
+        handled = default_handler(context)
+        if default_is_async:
+            handled = await handled
+        return bool(handled)
+
+    return fallback_handler
+
+
+def flatten_step(
+    step_definition: multi.StepHandlerMulti | None,
+    step_name: str,
+    step_default: FlatStep | None,
+) -> FlatStep | None:
+    """Flatten step definition for a known step name.
+
+    Mirrors `multi.make_single_step`, but a mapping is resolved at compile time,
+    because the step name is already known.
+    """
+    if step_definition is None:
+        return step_default
+
+    if isinstance(step_definition, core.StepHandlerProtocol):
+        return (step_definition,)
+
+    if isinstance(step_definition, abc.Sequence):
+        return tuple(step for step in step_definition if step is not None) or None
+
+    if isinstance(step_definition, abc.Mapping):
+        steps = multi.clean_values(step_definition)
+        if not steps:
+            return step_default
+
+        handler = steps.get(step_name)
+        if handler is None:
+            return step_default or ()
+
+        if not step_default:
+            return (handler,)
+
+        default_handler = multi.list_step(step_default)
+        assert default_handler is not None, "Non-empty default must produce a step"
+        return (fallback_step(handler, default_handler),)
+
+    return None
+
+
+def flatten_steps(
+    *,
+    step_name: str,
+    step_base: multi.StepHandlerMulti | None,
+    step_default: multi.StepHandlerMulti | None,
+    step_pre: multi.StepHandlerMulti | None,
+    step_post: multi.StepHandlerMulti | None,
+) -> FlatStep | None:
+    """Flatten pre-, default, base and post- definitions for a known step name.
+
+    Mirrors `multi.ensure_single_step`.
+    """
+    flat_default = flatten_step(step_default, step_name, None)
+    flat_base = flatten_step(step_base, step_name, flat_default)
+
+    if flat_base is None:
+        flat_base = flat_default
+
+    if flat_base is None:
+        return None
+
+    flat_pre = flatten_step(step_pre, step_name, None) or ()
+    flat_post = flatten_step(step_post, step_name, None) or ()
+
+    return flat_pre + flat_base + flat_post
+
+
+def exception_dispatcher(
+    handlers: abc.Mapping[str, core.StepHandler],
+) -> core.StepHandler:
+    """Select exception handler by the failed step name."""
+    handlers_sync: abc.Mapping[str, core.StepHandler] = {
+        step_name: handler
+        for step_name, handler in handlers.items()
+        if not core.is_async_step(handler)
+    }
+
+    if len(handlers_sync) == len(handlers):
+
+        def exception_handler_sync(context: ctx.StepContext):
+            handler = handlers_sync.get(context.current_step)
+            return handler is not None and handler(context)
+
+        return exception_handler_sync
+
+    async def exception_handler(context: ctx.StepContext):
+        handler = handlers.get(context.current_step)
+        if handler is None:
+            return False
+        if context.current_step in handlers_sync:
+            return handler(context)
+        return await handler(context)
+
+    return exception_handler
+
+
+def compile_processor_steps(defined_steps: multi.StepsDefinitionDict) -> CompiledSteps:
+    """Compile step definitions to flat tuples of handlers.
+
+    Steps are flattened to a single ordered tuple with a handler per element,
+    so no nested list or mapping handlers are called in runtime.
+    The only exception is a mapping step with a default handler, which still
+    requires runtime decision if the default handler should be called.
+    """
+    base_steps: abc.MutableMapping[str, multi.StepHandlerMulti | None] = {}
+    default_steps: abc.MutableMapping[str, multi.StepHandlerMulti | None] = {}
+    pre_steps: abc.MutableMapping[str, multi.StepHandlerMulti | None] = {}
+    post_steps: abc.MutableMapping[str, multi.StepHandlerMulti | None] = {}
+
+    multi.split_steps(
+        defined_steps=defined_steps,
+        base_steps=base_steps,
+        default_steps=default_steps,
+        pre_steps=pre_steps,
+        post_steps=post_steps,
+    )
+
+    def flatten(step: str, step_name: str) -> FlatStep:
+        return (
+            flatten_steps(
+                step_name=step_name,
+                step_base=base_steps.get(step),
+                step_default=default_steps.get(step),
+                step_pre=pre_steps.get(step),
+                step_post=post_steps.get(step),
+            )
+            or ()
+        )
+
+    def flat_order(names: abc.Iterable[str]) -> tuple[core.StepEntry, ...]:
+        return tuple(
+            core.defined_steps(
+                (step_name, handler)
+                for step_name in names
+                for handler in flatten(step_name, step_name)
+            )
+        )
+
+    exception_handlers: dict[str, core.StepHandler | None] = {
+        step_name: multi.list_step(flatten("exception_handler", step_name))
+        for step_name in process_step_names
+    }
+
+    return CompiledSteps(
+        process_steps=flat_order(process_step_names),
+        exception_handler=exception_dispatcher(multi.clean_values(exception_handlers)),
+        response_steps=flat_order(response_step_names),
+    )
+
+
+class CompiledUrlHandler(core.UrlHandler):
+    """URL handler with steps compiled to flat tuples of handlers."""
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        *,
+        steps: multi.StepsDefinitionDict,
+        error_status_to_http: abc.Mapping[int, int],
+        route: str = "",
+        instrumentation: core.StepTimingSinkProtocol | None = None,
+        timeout: float | None = None,
+    ):
+        compiled = compile_processor_steps(steps)
+        self.error_status_to_http = error_status_to_http
+        self.timeout = timeout
+        self.process_steps = concurrent.group_concurrent_steps(compiled.process_steps)
+        self.set_exception_handler(compiled.exception_handler)
+        self.response_steps = compiled.response_steps
+        self.set_instrumentation(route=route, instrumentation=instrumentation)
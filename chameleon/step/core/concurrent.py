@@ -0,0 +1,130 @@
+"""Concurrent execution of independent steps before the request body is read.
+
+Access checks are usually independent I/O, e.g. token lookups and permission
+queries, so they don't need to wait for each other. Steps marked with
+`concurrent_step` are run together, the first failure cancels the others.
+"""
+
+import asyncio
+import typing
+
+from chameleon.step.core import context as ctx
+
+if typing.TYPE_CHECKING:
+    from chameleon.step.core import core
+
+__all__ = ("ConcurrentSteps", "concurrent_step", "group_concurrent_steps")
+
+CONCURRENT_ATTRIBUTE = "step_concurrent"
+
+# Only steps before the body is read are independent enough to be concurrent.
+CONCURRENT_STEP_NAMES = frozenset(
+    ("check_authenticated", "check_headers", "check_access_pre_read")
+)
+
+
+def concurrent_step[T](handler: T) -> T:
+    """Mark an async step handler as safe to run concurrently with others.
+
+    Consecutive marked handlers of `check_authenticated`, `check_headers` and
+    `check_access_pre_read` steps are run concurrently. Marked handlers must
+    not depend on context changes made by each other. Sync handlers and
+    handlers of other steps are run sequentially as usual.
+
+    Basic usage:
+
+    >>> @concurrent_step
+    ... async def check_token(context): ...
+
+    """
+    setattr(handler, CONCURRENT_ATTRIBUTE, True)
+    return handler
+
+
+def is_concurrent(entry: "core.StepEntry") -> bool:
+    name, handler, is_async = entry
+    return (
+        is_async
+        and name in CONCURRENT_STEP_NAMES
+        and getattr(handler, CONCURRENT_ATTRIBUTE, False)
+    )
+
+
+class ConcurrentSteps:
+    """Step handler running a group of async step handlers concurrently.
+
+    On the first failure the rest of handlers are cancelled, and
+    `context.current_step` is set to the failed step, so the exception handler
+    is selected the same way as for sequential steps.
+    """
+
+    steps: tuple["core.StepEntry", ...]
+
+    def __init__(self, steps: tuple["core.StepEntry", ...]):
+        self.steps = steps
+
+    @property
+    def name(self) -> str:
+        return "+".join(dict.fromkeys(name for name, _, _ in self.steps))
+
+    async def __call__(self, context: ctx.StepContext) -> None:
+        tasks = [
+            asyncio.ensure_future(handler(context)) for _, handler, _ in self.steps
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except asyncio.CancelledError:
+            # e.g. the deadline is exceeded, report the first step still running
+            context.current_step = next(
+                (
+                    name
+                    for (name, _, _), task in zip(self.steps, tasks)
+                    if not task.done()
+                ),
+                context.current_step,
+            )
+            raise
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        failed: tuple[str, BaseException] | None = None
+        for (name, _, _), task in zip(self.steps, tasks):
+            if task.cancelled():
+                continue
+            exception = task.exception()  # retrieve all to avoid warnings
+            if exception is not None and failed is None:
+                failed = name, exception
+
+        if failed is not None:
+            context.current_step, exception = failed
+            raise exception
+
+
+def group_concurrent_steps(
+    steps: tuple["core.StepEntry", ...],
+) -> tuple["core.StepEntry", ...]:
+    """Replace consecutive concurrent steps with a single `ConcurrentSteps`."""
+    result: list[core.StepEntry] = []
+    group: list[core.StepEntry] = []
+
+    def flush():
+        if len(group) > 1:
+            handler = ConcurrentSteps(tuple(group))
+            result.append((handler.name, handler, True))
+        else:
+            result.extend(group)
+        group.clear()
+
+    for entry in steps:
+        if is_concurrent(entry):
+            group.append(entry)
+            continue
+        flush()
+        result.append(entry)
+    flush()
+
+    return tuple(result)
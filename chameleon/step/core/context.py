@@ -27,6 +27,14 @@ class StepContextRequestInfo:
         doc="""Request content encoding.""",
     )  # type: ignore[assignment]
 
+    headers: abc.Mapping[str, str] = create_field(
+        doc="""Request headers, names are case-insensitive.""",
+    )  # type: ignore[assignment]
+
+    query: abc.Mapping[str, str] = create_field(
+        doc="""Query parameters, the last value is used for repeated ones.""",
+    )  # type: ignore[assignment]
+
 
 @dataclasses.dataclass(slots=True, kw_only=True)
 class StepContext:
@@ -53,6 +61,10 @@ class StepContext:
         doc="""Business output data based on business input."""
     )  # type: ignore[assignment]
 
+    output_fields: abc.Mapping[str, str] = create_field(
+        doc="""Requested output fields to their source fields, all if None."""
+    )  # type: ignore[assignment]
+
     exception: Exception = create_field(
         doc="""Exception occurred on previous steps.""",
     )  # type: ignore[assignment]
@@ -79,10 +91,19 @@ class StepContext:
         doc="""Serialized response body.""",
     )  # type: ignore[assignment]
 
+    response_stream: abc.AsyncIterable[bytes] | abc.Iterable[bytes] = create_field(
+        doc="""Serialized response body chunks instead of `response_body`.""",
+    )  # type: ignore[assignment]
+
     response_headers: abc.MutableMapping[str, str] = create_field(
         doc="""Additional response headers."""
     )  # type: ignore[assignment]
 
+    not_modified: bool = create_field(
+        doc="""Requester has the current representation, respond with 304.""",
+        default=False,
+    )  # type: ignore[assignment]
+
     response: typing.Any = create_field(
         doc="""Final response object.""",
     )  # type: ignore[assignment]
@@ -90,3 +111,7 @@ class StepContext:
     custom_info: abc.MutableMapping[str, typing.Any] = create_field(
         doc="""Custom information if needed."""
     )  # type: ignore[assignment]
+
+    deadline: float | None = create_field(
+        doc="""`time.monotonic()` value to finish process steps before."""
+    )  # type: ignore[assignment]
@@ -1,14 +1,24 @@
 import dataclasses
+import functools
+import inspect
+import time
 import typing
 from collections import abc
 
+from chameleon.step.core import concurrent
 from chameleon.step.core import context as ctx
+from chameleon.step.core import deadline
 from chameleon.step.core.doc import create_field
 
 __all__ = [
     "UrlHandlerSteps",
     "UrlHandler",
+    "StepHandler",
     "StepHandlerProtocol",
+    "SyncStepHandlerProtocol",
+    "StepTimingSinkProtocol",
+    "StopProcessing",
+    "is_async_step",
 ]
 
 
@@ -17,62 +27,82 @@ class StepHandlerProtocol(typing.Protocol):
     async def __call__(self, context: ctx.StepContext) -> bool | None: ...
 
 
+@typing.runtime_checkable
+class SyncStepHandlerProtocol(typing.Protocol):
+    def __call__(self, context: ctx.StepContext) -> bool | None: ...
+
+
+# Pure-CPU steps don't need to be coroutines, they're called directly.
+StepHandler = StepHandlerProtocol | SyncStepHandlerProtocol
+# Step name, step handler and if the handler must be awaited
+StepEntry = tuple[str, StepHandler, bool]
+
+
+@typing.runtime_checkable
+class StepTimingSinkProtocol(typing.Protocol):
+    """Receiver of step timings, e.g. a histogram, a logger or a callback."""
+
+    def __call__(
+        self, *, route: str, step: str, wall_time: float, cpu_time: float
+    ) -> None: ...
+
+
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class UrlHandlerProcessSteps:
     # framework-specific
-    fill_request_info: StepHandlerProtocol | None = create_field(
+    fill_request_info: StepHandler | None = create_field(
         doc="""Extracts basic request info to minimize dependency from framework."""
     )  # type: ignore[assignment]
 
     # framework-specific
-    check_authenticated: StepHandlerProtocol | None = create_field(
+    check_authenticated: StepHandler | None = create_field(
         doc="""Check if a user authenticated e.g. auth token is valid."""
     )  # type: ignore[assignment]
 
     # framework-specific
-    check_headers: StepHandlerProtocol | None = create_field(
+    check_headers: StepHandler | None = create_field(
         doc="""Check request headers are expected."""
     )  # type: ignore[assignment]
-    check_access_pre_read: StepHandlerProtocol | None = create_field(
+    check_access_pre_read: StepHandler | None = create_field(
         doc="""Check a requester has an access to that resource"
          "(body hasn't been read)."""
     )  # type: ignore[assignment]
 
     # framework-specific
-    extract_body: StepHandlerProtocol | None = create_field(
+    extract_body: StepHandler | None = create_field(
         doc="""Extract body from the request layer."""
     )  # type: ignore[assignment]
 
-    decrypt: StepHandlerProtocol | None = create_field(
+    decrypt: StepHandler | None = create_field(
         doc="""Optional decryption and/or signature check of the request_body."""
     )  # type: ignore[assignment]
 
     # could be generated from default impl
-    deserialize: StepHandlerProtocol | None = create_field(
+    deserialize: StepHandler | None = create_field(
         doc="""Deserialize request body to the input_raw."""
     )  # type: ignore[assignment]
 
     # could be generated from default impl
-    validate_input: StepHandlerProtocol | None = create_field(
+    validate_input: StepHandler | None = create_field(
         doc="""Validate input_raw and/or request body."""
     )  # type: ignore[assignment]
 
-    check_access_post_read: StepHandlerProtocol | None = create_field(
+    check_access_post_read: StepHandler | None = create_field(
         doc="""Check a requester has an access to that resource (body has been read)."""
     )  # type: ignore[assignment]
 
     # could be generated from default impl
-    map_input: StepHandlerProtocol | None = create_field(
+    map_input: StepHandler | None = create_field(
         doc="""Map input_raw to the internal representation to be processed."""
     )  # type: ignore[assignment]
 
-    business: StepHandlerProtocol | None = create_field(
+    business: StepHandler | None = create_field(
         doc="""Endpoint business part. Could be database handling and/or"""
         """sending another request somewhere else"""
     )  # type: ignore[assignment]
 
     # could be generated from default impl
-    map_output: StepHandlerProtocol | None = create_field(
+    map_output: StepHandler | None = create_field(
         doc="""Map output_business to the raw representation to be serialized."""
     )  # type: ignore[assignment]
 
@@ -96,24 +126,24 @@ class UrlHandlerProcessSteps:
 
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class UrlHandlerSteps(UrlHandlerProcessSteps):
-    exception_handler: StepHandlerProtocol | None = create_field(
-        doc="""Handle an exception."""
+    exception_handler: StepHandler | None = create_field(
+        doc="""Handle an exception occurred on process steps."""
     )  # type: ignore[assignment]
 
-    serialize: StepHandlerProtocol | None = create_field(
+    serialize: StepHandler | None = create_field(
         doc="""Serialize output_raw to be passed for transport layers."""
     )  # type: ignore[assignment]
 
-    encrypt: StepHandlerProtocol | None = create_field(
+    encrypt: StepHandler | None = create_field(
         doc="""Optional encryption, signing, etc."""
     )  # type: ignore[assignment]
 
-    response_headers: StepHandlerProtocol | None = create_field(
+    response_headers: StepHandler | None = create_field(
         doc="""Prepare additional response headers."""
     )  # type: ignore[assignment]
 
     # framework-specific
-    create_response: StepHandlerProtocol | None = create_field(
+    create_response: StepHandler | None = create_field(
         doc="""Create HTTP response to be returned."""
     )  # type: ignore[assignment]
 
@@ -127,36 +157,186 @@ class UrlHandlerSteps(UrlHandlerProcessSteps):
         )
 
 
+def is_async_step(handler: StepHandler) -> bool:
+    """Check if the step handler returns an awaitable to be awaited."""
+    # callable objects are checked by the `__call__` method of their class
+    return inspect.iscoroutinefunction(handler) or (
+        callable(handler) and inspect.iscoroutinefunction(type(handler).__call__)
+    )
+
+
 def defined_steps(
-    steps: abc.Sequence[tuple[str, StepHandlerProtocol | None]],
-) -> abc.Iterable[tuple[str, StepHandlerProtocol]]:
-    return (step for step in steps if step[1] is not None)  # type: ignore[misc]
+    steps: abc.Iterable[tuple[str, StepHandler | None]],
+) -> abc.Iterable[StepEntry]:
+    return (
+        (name, handler, is_async_step(handler))
+        for name, handler in steps
+        if handler is not None
+    )
+
 
+class StopProcessing(Exception):
+    """Raised by a process step to skip the rest of process steps.
 
-async def default_exception_handler(context: ctx.StepContext):
+    The response is prepared by response steps as usual, so the step is
+    expected to fill the context, e.g. `response_body` reused from elsewhere.
+    """
+
+
+def default_exception_handler(context: ctx.StepContext):
     return False
 
 
 async def call_steps(
-    context: ctx.StepContext, steps: tuple[tuple[str, StepHandlerProtocol], ...]
+    context: ctx.StepContext,
+    steps: tuple[StepEntry, ...],
+    *,
+    enforce_deadline: bool = False,
 ):
-    for current_step, step_handler in steps:
+    for current_step, step_handler, is_async in steps:
         context.current_step = current_step
-        await step_handler(context)
+        if enforce_deadline and context.deadline is not None:
+            await deadline.call_step(context, step_handler, is_async, context.deadline)
+        elif is_async:
+            await step_handler(context)
+        else:
+            step_handler(context)
+
+
+class StepTimer:
+    """Report wall and CPU time spent for each step name to the sink.
+
+    Consecutive handlers of the same step (e.g. pre-, base and post- handlers)
+    are reported as a single step. CPU time is the time of the current thread,
+    so it includes other coroutines running while the step awaits.
+    """
+
+    route: str
+    sink: StepTimingSinkProtocol
+    step: str | None
+    wall_start: float
+    cpu_start: float
+
+    def __init__(self, *, route: str, sink: StepTimingSinkProtocol):
+        self.route = route
+        self.sink = sink
+        self.step = None
+        self.wall_start = self.cpu_start = 0.0
+
+    def start(self, step: str):
+        """Start timing the step, the previous one is reported."""
+        if step == self.step:
+            return
+
+        self.stop()
+        self.step = step
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+
+    def stop(self):
+        if self.step is None:
+            return
+
+        self.sink(
+            route=self.route,
+            step=self.step,
+            wall_time=time.perf_counter() - self.wall_start,
+            cpu_time=time.thread_time() - self.cpu_start,
+        )
+        self.step = None
+
+
+async def call_steps_timed(
+    context: ctx.StepContext,
+    steps: tuple[StepEntry, ...],
+    *,
+    route: str,
+    sink: StepTimingSinkProtocol,
+    enforce_deadline: bool = False,
+):
+    """Call steps and report their timings, see `StepTimer`."""
+    timer = StepTimer(route=route, sink=sink)
+    try:
+        for current_step, step_handler, is_async in steps:
+            timer.start(current_step)
+            context.current_step = current_step
+            if enforce_deadline and context.deadline is not None:
+                await deadline.call_step(
+                    context, step_handler, is_async, context.deadline
+                )
+            elif is_async:
+                await step_handler(context)
+            else:
+                step_handler(context)
+    finally:
+        timer.stop()
 
 
 class UrlHandler:
-    process_steps: tuple[tuple[str, StepHandlerProtocol], ...]
+    process_steps: tuple[StepEntry, ...]
     error_status_to_http: abc.Mapping[int, int]
-    response_steps: tuple[tuple[str, StepHandlerProtocol], ...]
+    exception_handler: StepHandler
+    exception_handler_is_async: bool
+    response_steps: tuple[StepEntry, ...]
+    route: str
+    instrumentation: StepTimingSinkProtocol | None
+    timeout: float | None
 
     def __init__(
-        self, *, steps: UrlHandlerSteps, error_status_to_http: abc.Mapping[int, int]
+        self,
+        *,
+        steps: UrlHandlerSteps,
+        error_status_to_http: abc.Mapping[int, int],
+        route: str = "",
+        instrumentation: StepTimingSinkProtocol | None = None,
+        timeout: float | None = None,
     ):
         self.error_status_to_http = error_status_to_http
-        self.process_steps = tuple(defined_steps(steps.process_order()))
-        self.exception_handler = steps.exception_handler or default_exception_handler
+        self.timeout = timeout
+        self.process_steps = concurrent.group_concurrent_steps(
+            tuple(defined_steps(steps.process_order()))
+        )
+        self.set_exception_handler(steps.exception_handler or default_exception_handler)
         self.response_steps = tuple(defined_steps(steps.response_order()))
+        self.set_instrumentation(route=route, instrumentation=instrumentation)
+
+    def set_exception_handler(self, exception_handler: StepHandler):
+        self.exception_handler = exception_handler
+        self.exception_handler_is_async = is_async_step(exception_handler)
+
+    def set_instrumentation(
+        self, *, route: str, instrumentation: StepTimingSinkProtocol | None
+    ):
+        """Enable step timings reporting to the sink, or disable it if None.
+
+        Disabled instrumentation costs nothing, plain `call_steps` is used.
+        """
+        self.route = route
+        self.instrumentation = instrumentation
+
+        if instrumentation is None:
+            self.call_steps = call_steps
+        else:
+            self.call_steps = functools.partial(
+                call_steps_timed, route=route, sink=instrumentation
+            )
+
+    async def handle_exception(self, context: ctx.StepContext) -> bool:
+        if self.instrumentation is None:
+            handled = self.exception_handler(context)
+            if self.exception_handler_is_async:
+                handled = await handled
+            return bool(handled)
+
+        timer = StepTimer(route=self.route, sink=self.instrumentation)
+        timer.start("exception_handler")
+        try:
+            handled = self.exception_handler(context)
+            if self.exception_handler_is_async:
+                handled = await handled
+            return bool(handled)
+        finally:
+            timer.stop()
 
     async def __call__(
         self, request: typing.Any, **url_params: typing.Any
@@ -165,14 +345,17 @@ class UrlHandler:
             request_info=ctx.StepContextRequestInfo(request=request),
             custom_info=url_params,
             error_status_to_http=self.error_status_to_http,
+            deadline=None if self.timeout is None else time.monotonic() + self.timeout,
         )
 
         try:
-            await call_steps(context, self.process_steps)
+            await self.call_steps(context, self.process_steps, enforce_deadline=True)
+        except StopProcessing:
+            pass
         except Exception as e:  # pylint: disable=W0718
             context.exception = e
-            if not await self.exception_handler(context):
+            if not await self.handle_exception(context):
                 raise  # re-raise the exception if not handled
 
-        await call_steps(context, self.response_steps)
+        await self.call_steps(context, self.response_steps)
         return context.response
@@ -0,0 +1,122 @@
+"""Request deadlines enforced between and during process steps.
+
+A deadline is a `time.monotonic()` value stored in `StepContext.deadline`.
+It's set from the route timeout and could be shortened by a step, e.g. from
+a request header. Async steps are cancelled when the deadline is exceeded,
+sync steps are only checked before they're called, since they can't be
+interrupted. Response steps are never limited to respond with an error.
+
+Steps with effects, e.g. writes, are marked with `uncancellable_step`: a
+write running in a thread commits even if the awaiting coroutine is
+cancelled, and a timeout response would invite a retry repeating it.
+"""
+
+import asyncio
+import math
+import time
+
+from chameleon.step.core import context as ctx
+
+__all__ = (
+    "REQUEST_TIMEOUT_HEADER",
+    "DeadlineExceeded",
+    "limit_deadline",
+    "parse_timeout",
+    "uncancellable_step",
+)
+
+# Seconds a requester is going to wait for the response.
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+UNCANCELLABLE_ATTRIBUTE = "step_uncancellable"
+
+
+class DeadlineExceeded(TimeoutError):
+    """Request deadline exceeded before or during the step."""
+
+    step: str
+
+    def __init__(self, step: str):
+        super().__init__(f"Deadline exceeded on {step} step")
+        self.step = step
+
+
+def uncancellable_step[T](handler: T) -> T:
+    """Mark a step handler whose effects can't be undone, e.g. a write.
+
+    The deadline is checked before the handler is called, but the handler
+    isn't cancelled once started. The deadline isn't enforced for the rest of
+    process steps either, the requester gets the result of the write instead
+    of a timeout error.
+
+    Basic usage:
+
+    >>> @uncancellable_step
+    ... async def project_create(context): ...
+
+    """
+    setattr(handler, UNCANCELLABLE_ATTRIBUTE, True)
+    return handler
+
+
+def limit_deadline(context: ctx.StepContext, timeout: float):
+    """Shorten the context deadline to `timeout` seconds from now.
+
+    The deadline is never extended, so a requester can't exceed a route
+    timeout.
+    """
+    deadline = time.monotonic() + timeout
+    if context.deadline is None or deadline < context.deadline:
+        context.deadline = deadline
+
+
+def parse_timeout(value: str | bytes | None) -> float | None:
+    """Parse timeout in seconds from a header value, None if it's invalid."""
+    if value is None:
+        return None
+
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+
+    return timeout if math.isfinite(timeout) and timeout >= 0 else None
+
+
+def check_deadline(context: ctx.StepContext, deadline: float):
+    if time.monotonic() >= deadline:
+        raise DeadlineExceeded(context.current_step)
+
+
+def call_step_sync(context: ctx.StepContext, step_handler, deadline: float):
+    check_deadline(context, deadline)
+    step_handler(context)
+    if getattr(step_handler, UNCANCELLABLE_ATTRIBUTE, False):
+        context.deadline = None
+
+
+async def call_step(
+    context: ctx.StepContext, step_handler, is_async: bool, deadline: float
+):
+    check_deadline(context, deadline)
+
+    if getattr(step_handler, UNCANCELLABLE_ATTRIBUTE, False):
+        if is_async:
+            await step_handler(context)
+        else:
+            step_handler(context)
+        context.deadline = None
+        return
+
+    if not is_async:
+        step_handler(context)
+        return
+
+    timeout = asyncio.timeout(deadline - time.monotonic())
+    try:
+        async with timeout:
+            await step_handler(context)
+    except TimeoutError as e:
+        if timeout.expired():
+            raise DeadlineExceeded(context.current_step) from e
+        raise
@@ -0,0 +1,133 @@
+import bisect
+import dataclasses
+import logging
+import threading
+from collections import abc
+
+__all__ = ("StepTimingHistogram", "StepTimingLogger", "StepTimingStats")
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, from 50us to 10s; the last bucket is unbounded.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class StepTimingStats:
+    """Accumulated timings of a single step for a single route."""
+
+    buckets: tuple[float, ...]
+    count: int = 0
+    wall_time_total: float = 0.0
+    cpu_time_total: float = 0.0
+    wall_time_counts: list[int] = dataclasses.field(default_factory=list)
+    cpu_time_counts: list[int] = dataclasses.field(default_factory=list)
+
+    def __post_init__(self):
+        size = len(self.buckets) + 1
+        self.wall_time_counts = self.wall_time_counts or [0] * size
+        self.cpu_time_counts = self.cpu_time_counts or [0] * size
+
+    def add(self, *, wall_time: float, cpu_time: float):
+        self.count += 1
+        self.wall_time_total += wall_time
+        self.cpu_time_total += cpu_time
+        self.wall_time_counts[bisect.bisect_left(self.buckets, wall_time)] += 1
+        self.cpu_time_counts[bisect.bisect_left(self.buckets, cpu_time)] += 1
+
+    def quantile(self, value: float, *, cpu: bool = False) -> float:
+        """Upper bound of the bucket containing given quantile.
+
+        Args:
+            value: Quantile to find, e.g. 0.99 for p99.
+            cpu: Use CPU time instead of wall time.
+        """
+        if not 0 <= value <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {value!r}")
+
+        counts = self.cpu_time_counts if cpu else self.wall_time_counts
+        rank = value * self.count
+        accumulated = 0
+        for index, count in enumerate(counts):
+            accumulated += count
+            if count and accumulated >= rank:
+                return (
+                    self.buckets[index] if index < len(self.buckets) else float("inf")
+                )
+
+        return 0.0
+
+
+class StepTimingHistogram:
+    """In-process histogram of step timings by route and step name."""
+
+    buckets: tuple[float, ...]
+    _stats: dict[tuple[str, str], StepTimingStats]
+
+    def __init__(self, buckets: abc.Sequence[float] = DEFAULT_BUCKETS):
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Histogram buckets must be sorted")
+
+        self.buckets = tuple(buckets)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, *, route: str, step: str, wall_time: float, cpu_time: float):
+        key = (route, step)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StepTimingStats(buckets=self.buckets)
+            stats.add(wall_time=wall_time, cpu_time=cpu_time)
+
+    def snapshot(self) -> abc.Mapping[tuple[str, str], StepTimingStats]:
+        """Copy of the accumulated stats by (route, step)."""
+        with self._lock:
+            return {
+                key: dataclasses.replace(
+                    stats,
+                    wall_time_counts=list(stats.wall_time_counts),
+                    cpu_time_counts=list(stats.cpu_time_counts),
+                )
+                for key, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class StepTimingLogger:
+    """Log a line per step with its timings."""
+
+    def __init__(self, *, log: logging.Logger = logger, level: int = logging.DEBUG):
+        self.log = log
+        self.level = level
+
+    def __call__(self, *, route: str, step: str, wall_time: float, cpu_time: float):
+        self.log.log(
+            self.level,
+            "route=%r step=%s wall_time=%.6f cpu_time=%.6f",
+            route,
+            step,
+            wall_time,
+            cpu_time,
+        )
@@ -9,9 +9,9 @@ from chameleon.step.core import core
 __all__ = ("multi_processor_steps", "StepHandlerMulti", "StepsDefinitionDict")
 
 StepHandlerMulti = (
-    core.StepHandlerProtocol
-    | abc.Sequence[core.StepHandlerProtocol | None]
-    | abc.Mapping[str, core.StepHandlerProtocol | None]
+    core.StepHandler
+    | abc.Sequence[core.StepHandler | None]
+    | abc.Mapping[str, core.StepHandler | None]
 )
 
 
@@ -106,25 +106,50 @@ def clean_values(source: abc.Mapping[str, T | None]) -> abc.Mapping[str, T]:
 
 
 def multi_dict_step(
-    default_handler: core.StepHandlerProtocol | None,
-    steps_by_name: abc.Mapping[str, core.StepHandlerProtocol | None],
-) -> core.StepHandlerProtocol | None:
+    default_handler: core.StepHandler | None,
+    steps_by_name: abc.Mapping[str, core.StepHandler | None],
+) -> core.StepHandler | None:
     steps = clean_values(steps_by_name)
 
     if not steps:
         return default_handler
 
+    steps_async = {
+        step_name: core.is_async_step(handler) for step_name, handler in steps.items()
+    }
+    default_is_async = default_handler is not None and core.is_async_step(
+        default_handler
+    )
+
+    if not default_is_async and not any(steps_async.values()):
+
+        def multi_dict_handler_sync(context: ctx.StepContext) -> bool:
+            handler = steps.get(context.current_step)
+            handled = handler is not None and bool(handler(context))
+
+            if not handled and default_handler is not None:
+                handled = bool(default_handler(context))
+
+            return handled
+
+        return multi_dict_handler_sync
+
     async def multi_dict_handler(context: ctx.StepContext) -> bool:
         current_step = context.current_step
         handler = steps.get(current_step)
 
         if handler is None:
             handled = False
-        else:
+        elif steps_async[current_step]:
             handled = bool(await handler(context))
+        else:
+            handled = bool(handler(context))
 
         if not handled and default_handler is not None:
-            handled = bool(await default_handler(context))
+            if default_is_async:
+                handled = bool(await default_handler(context))
+            else:
+                handled = bool(default_handler(context))
 
         return handled
 
@@ -132,9 +157,9 @@ def multi_dict_step(
 
 
 def list_step(
-    steps: abc.Sequence[core.StepHandlerProtocol | None],
-) -> core.StepHandlerProtocol | None:
-    filtered_steps: tuple[core.StepHandlerProtocol, ...]
+    steps: abc.Sequence[core.StepHandler | None],
+) -> core.StepHandler | None:
+    filtered_steps: tuple[core.StepHandler, ...]
     filtered_steps = tuple(step for step in steps if step is not None)
 
     if not filtered_steps:
@@ -143,10 +168,25 @@ def list_step(
     if len(filtered_steps) == 1:
         return filtered_steps[0]
 
+    steps_async = tuple((step, core.is_async_step(step)) for step in filtered_steps)
+
+    if not any(is_async for _, is_async in steps_async):
+
+        def list_handler_sync(context: ctx.StepContext):
+            result = False
+            for step in filtered_steps:  # pylint disable: consider-using-any-or-all
+                result = step(context) or result
+            return result
+
+        return list_handler_sync
+
     async def list_handler(context: ctx.StepContext):
         result = False
-        for step in filtered_steps:  # pylint disable: consider-using-any-or-all
-            result = await step(context) or result
+        for step, is_async in steps_async:
+            if is_async:
+                result = await step(context) or result
+            else:
+                result = step(context) or result
         return result
 
     return list_handler
@@ -154,8 +194,8 @@ def list_step(
 
 def make_single_step(
     step_definition: StepHandlerMulti | None,
-    step_default: core.StepHandlerProtocol | None,
-) -> core.StepHandlerProtocol | None:
+    step_default: core.StepHandler | None,
+) -> core.StepHandler | None:
     if step_definition is None:
         return step_default
 
@@ -179,7 +219,7 @@ def ensure_single_step(
     step_default: StepHandlerMulti | None,
     step_pre: StepHandlerMulti | None,
     step_post: StepHandlerMulti | None,
-) -> core.StepHandlerProtocol | None:
+) -> core.StepHandler | None:
     single_default = make_single_step(step_definition=step_default, step_default=None)
     single_base = make_single_step(
         step_definition=step_base, step_default=single_default
@@ -260,7 +300,7 @@ def split_steps(
 
 def prepare_multi_handler_steps(
     defined_steps: StepsDefinitionDict,
-) -> abc.Mapping[str, core.StepHandlerProtocol]:
+) -> abc.Mapping[str, core.StepHandler]:
     base_steps: abc.MutableMapping[str, StepHandlerMulti | None] = {}
     default_steps: abc.MutableMapping[str, StepHandlerMulti | None] = {}
     pre_steps: abc.MutableMapping[str, StepHandlerMulti | None] = {}
@@ -275,7 +315,7 @@ def prepare_multi_handler_steps(
     )
 
     # Ensure all normal handlers become single function (with defaults)
-    result: dict[str, core.StepHandlerProtocol | None] = {}
+    result: dict[str, core.StepHandler | None] = {}
 
     for step in allowed_steps:
         # noinspection PyTypeChecker
@@ -14,10 +14,12 @@ class ProcessorProtocol(typing.Protocol):
 
 class ProcessorRegistry:
     _registry: abc.MutableMapping[str, ProcessorProtocol]
+    _factories: abc.MutableMapping[str, abc.Callable[[], ProcessorProtocol]]
     name: str
 
     def __init__(self, name: str):
         self._registry = {}
+        self._factories = {}
         self.name = name
 
     def register(
@@ -37,17 +39,57 @@ class ProcessorRegistry:
         if processor is None:
             raise ValueError("Processor can't be None")
 
+        self._registry[self._new_processor_id(type_id, action_id)] = processor
+
+    def register_factory(
+        self,
+        *,
+        type_id: str,
+        action_id: str | None = None,
+        factory: abc.Callable[[], ProcessorProtocol],
+    ):
+        """Register a processor created on first use or by `warmup`.
+
+        type_id - type id
+        action_id - action made on this type
+        factory - function creating the processor for this type_id and action_id
+
+        """
+        self._factories[self._new_processor_id(type_id, action_id)] = factory
+
+    def warmup(self):
+        """Create all processors registered by factories."""
+        for processor_id in list(self._factories):
+            self._create(processor_id)
+
+    def _new_processor_id(self, type_id: str, action_id: str | None) -> str:
         processor_id = _processor_id(type_id, action_id)
 
-        if processor_id in self._registry:
+        if processor_id in self._registry or processor_id in self._factories:
             raise ValueError(
                 f"{self.name.capitalize()} registry already contains {processor_id!r}"
             )
 
-        self._registry[processor_id] = processor
+        return processor_id
+
+    def _create(self, processor_id: str) -> ProcessorProtocol | None:
+        factory = self._factories.get(processor_id)
+        if factory is None:
+            # created by another thread meanwhile
+            return self._registry.get(processor_id)
+
+        # concurrent threads could create it twice, but never miss it
+        processor = self._registry.setdefault(processor_id, factory())
+        self._factories.pop(processor_id, None)
+        return processor
 
     def __getitem__(self, item):
-        return self._registry[item]
+        processor = self._registry.get(item)
+        if processor is None:
+            processor = self._create(item)
+        if processor is None:
+            raise KeyError(item)
+        return processor
 
     def get(
         self,
@@ -56,7 +98,10 @@ class ProcessorRegistry:
         default: ProcessorProtocol | None = None,
     ):
         processor_id = _processor_id(type_id, action_id)
-        return self._registry.get(processor_id, default)
+        processor = self._registry.get(processor_id)
+        if processor is None:
+            processor = self._create(processor_id)
+        return default if processor is None else processor
 
 
 def _processor_id(type_id: str, action_id: str | None = None):
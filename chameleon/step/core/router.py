@@ -0,0 +1,146 @@
+import dataclasses
+import string
+import typing
+from collections import abc
+
+__all__ = ("RouteMatch", "RouteTrie", "Routes")
+
+# Route definitions: route template to a handler or nested route definitions.
+# Route template is a sequence of segments separated with `/`, a segment in
+# curly braces is a parameter, e.g. `project/{project_id}/history`.
+type Routes = abc.Mapping[str, typing.Any]
+
+# Characters allowed in parameter values, same as `PARAMETER_REGEX`.
+PARAMETER_CHARACTERS = string.ascii_letters + string.digits + "_-"
+PARAMETER_REGEX = "[a-zA-Z0-9_-]+"
+
+
+class RouteMatch(typing.NamedTuple):
+    handler: typing.Any
+    kwargs: dict[str, str]
+    route: str
+
+
+@dataclasses.dataclass(slots=True)
+class RouteNode:
+    static: dict[str, "RouteNode"] = dataclasses.field(default_factory=dict)
+    parameter: str | None = None
+    parameter_node: "RouteNode | None" = None
+    handler: typing.Any = None
+    route: str = ""
+
+
+def is_parameter(segment: str) -> bool:
+    return len(segment) > 2 and segment[0] == "{" and segment[-1] == "}"
+
+
+def is_parameter_value(segment: str) -> bool:
+    # strip() removes every allowed character, so anything left is not allowed
+    return bool(segment) and not segment.strip(PARAMETER_CHARACTERS)
+
+
+def split_route(route: str) -> list[str]:
+    route = route.strip("/")
+    return route.split("/") if route else []
+
+
+def join_route(prefix: str, route: str) -> str:
+    return "/".join(part for part in (prefix.strip("/"), route.strip("/")) if part)
+
+
+class RouteTrie:
+    """Segment trie to resolve a path to a handler without regular expressions.
+
+    Resolution cost depends on the path length only, not on the number
+    of the routes. Static segments take precedence over parameters, there's
+    no backtracking to a parameter if a static segment has matched.
+    """
+
+    _root: RouteNode
+
+    def __init__(self, routes: Routes | None = None):
+        self._root = RouteNode()
+        if routes:
+            self.add_routes(routes)
+
+    def add(self, route: str, handler: typing.Any):
+        """Add a handler for given route template.
+
+        Args:
+            route: Route template, e.g. `project/{project_id}`.
+            handler: Handler to return on resolution.
+        """
+        if handler is None:
+            raise ValueError(f"Handler for route {route!r} can't be None")
+
+        node = self._root
+        for segment in split_route(route):
+            if not is_parameter(segment):
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+
+            parameter = segment[1:-1]
+            if node.parameter_node is None:
+                node.parameter = parameter
+                node.parameter_node = RouteNode()
+            elif node.parameter != parameter:
+                raise ValueError(
+                    f"Route {route!r} parameter {parameter!r} conflicts"
+                    f" with already defined {node.parameter!r}"
+                )
+            node = node.parameter_node
+
+        if node.handler is not None:
+            raise ValueError(f"Route {route!r} is already defined")
+
+        node.handler = handler
+        node.route = route
+
+    def add_routes(self, routes: Routes, prefix: str = ""):
+        """Add nested route definitions.
+
+        Args:
+            routes: Route templates to handlers or nested route definitions.
+            prefix: Route template prefix for all routes.
+        """
+        for route, handler in routes.items():
+            full_route = join_route(prefix, route)
+            if isinstance(handler, abc.Mapping):
+                self.add_routes(handler, full_route)
+            else:
+                self.add(full_route, handler)
+
+    def resolve(self, path: str) -> RouteMatch | None:
+        """Find a handler and parameter values for given path.
+
+        Args:
+            path: Path to resolve, a leading slash is ignored.
+        """
+        node = self._root
+        kwargs: dict[str, str] = {}
+
+        path = path.removeprefix("/")
+        for segment in path.split("/") if path else ():
+            next_node = node.static.get(segment)
+            if next_node is None:
+                if node.parameter_node is None or not is_parameter_value(segment):
+                    return None
+                kwargs[typing.cast(str, node.parameter)] = segment
+                next_node = node.parameter_node
+            node = next_node
+
+        if node.handler is None:
+            return None
+
+        return RouteMatch(node.handler, kwargs, node.route)
+
+    def routes(self) -> abc.Iterator[tuple[str, typing.Any]]:
+        """Iterate over defined route templates and handlers."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.handler is not None:
+                yield node.route, node.handler
+            nodes.extend(node.static.values())
+            if node.parameter_node is not None:
+                nodes.append(node.parameter_node)
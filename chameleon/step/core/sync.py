@@ -0,0 +1,265 @@
+"""Synchronous pipeline running the same steps definitions without event loop.
+
+Async step handlers are replaced with their sync variants linked by
+`with_sync_variant` decorator, so one definition serves both ASGI and WSGI.
+"""
+
+import functools
+import time
+import typing
+from collections import abc
+
+from chameleon.step.core import compiled
+from chameleon.step.core import context as ctx
+from chameleon.step.core import core
+from chameleon.step.core import deadline
+from chameleon.step.core import multi
+
+__all__ = (
+    "SyncMethodDispatcher",
+    "SyncUrlHandler",
+    "sync_method_dispatcher",
+    "with_sync_variant",
+)
+
+SYNC_VARIANT_ATTRIBUTE = "sync_variant"
+
+
+def with_sync_variant[T](sync_handler: core.SyncStepHandlerProtocol):
+    """Link a sync variant to an async step handler.
+
+    Basic usage:
+
+    >>> def project_get_sync(context): ...
+    >>> @with_sync_variant(project_get_sync)
+    ... async def project_get(context): ...
+
+    """
+
+    def decorator(handler: T) -> T:
+        setattr(handler, SYNC_VARIANT_ATTRIBUTE, sync_handler)
+        return handler
+
+    return decorator
+
+
+def sync_step(handler: core.StepHandler) -> core.SyncStepHandlerProtocol:
+    """Get sync variant of a step handler, sync handler is returned as is."""
+    if not core.is_async_step(handler):
+        return typing.cast(core.SyncStepHandlerProtocol, handler)
+
+    sync_handler = getattr(handler, SYNC_VARIANT_ATTRIBUTE, None)
+    if sync_handler is None:
+        raise TypeError(f"Async step {handler!r} has no sync variant")
+
+    return sync_handler
+
+
+def sync_step_multi(
+    definition: multi.StepHandlerMulti | None,
+) -> multi.StepHandlerMulti | None:
+    if definition is None:
+        return None
+
+    if isinstance(definition, core.StepHandlerProtocol):
+        return sync_step(definition)
+
+    if isinstance(definition, abc.Sequence):
+        return [None if step is None else sync_step(step) for step in definition]
+
+    if isinstance(definition, abc.Mapping):
+        return {
+            key: None if step is None else sync_step(step)
+            for key, step in definition.items()
+        }
+
+    raise TypeError(f"Unsupported step definition {definition!r}")
+
+
+def sync_steps(steps: multi.StepsDefinitionDict) -> multi.StepsDefinitionDict:
+    """Replace async step handlers with their sync variants."""
+    return typing.cast(
+        multi.StepsDefinitionDict,
+        {key: sync_step_multi(value) for key, value in steps.items()},
+    )
+
+
+def call_steps(
+    context: ctx.StepContext,
+    steps: tuple[core.StepEntry, ...],
+    *,
+    enforce_deadline: bool = False,
+):
+    for current_step, step_handler, _ in steps:
+        context.current_step = current_step
+        if enforce_deadline and context.deadline is not None:
+            deadline.call_step_sync(context, step_handler, context.deadline)
+        else:
+            step_handler(context)
+
+
+def call_steps_timed(
+    context: ctx.StepContext,
+    steps: tuple[core.StepEntry, ...],
+    *,
+    route: str,
+    sink: core.StepTimingSinkProtocol,
+    enforce_deadline: bool = False,
+):
+    """Sync counterpart of `core.call_steps_timed`."""
+    timer = core.StepTimer(route=route, sink=sink)
+    try:
+        for current_step, step_handler, _ in steps:
+            timer.start(current_step)
+            context.current_step = current_step
+            if enforce_deadline and context.deadline is not None:
+                deadline.call_step_sync(context, step_handler, context.deadline)
+            else:
+                step_handler(context)
+    finally:
+        timer.stop()
+
+
+class SyncUrlHandler:
+    """URL handler calling compiled sync steps without an event loop."""
+
+    process_steps: tuple[core.StepEntry, ...]
+    error_status_to_http: abc.Mapping[int, int]
+    exception_handler: core.SyncStepHandlerProtocol
+    response_steps: tuple[core.StepEntry, ...]
+    route: str
+    instrumentation: core.StepTimingSinkProtocol | None
+    timeout: float | None
+
+    def __init__(
+        self,
+        *,
+        steps: multi.StepsDefinitionDict,
+        error_status_to_http: abc.Mapping[int, int],
+        route: str = "",
+        instrumentation: core.StepTimingSinkProtocol | None = None,
+        timeout: float | None = None,
+    ):
+        compiled_steps = compiled.compile_processor_steps(sync_steps(steps))
+        self.error_status_to_http = error_status_to_http
+        self.timeout = timeout
+        self.process_steps = compiled_steps.process_steps
+        self.exception_handler = sync_step(compiled_steps.exception_handler)
+        self.response_steps = compiled_steps.response_steps
+        self.route = route
+        self.instrumentation = instrumentation
+
+        if instrumentation is None:
+            self.call_steps = call_steps
+        else:
+            self.call_steps = functools.partial(
+                call_steps_timed, route=route, sink=instrumentation
+            )
+
+    def handle_exception(self, context: ctx.StepContext) -> bool:
+        if self.instrumentation is None:
+            return bool(self.exception_handler(context))
+
+        timer = core.StepTimer(route=self.route, sink=self.instrumentation)
+        timer.start("exception_handler")
+        try:
+            return bool(self.exception_handler(context))
+        finally:
+            timer.stop()
+
+    def __call__(self, request: typing.Any, **url_params: typing.Any) -> typing.Any:
+        context: ctx.StepContext = ctx.StepContext(
+            request_info=ctx.StepContextRequestInfo(request=request),
+            custom_info=url_params,
+            error_status_to_http=self.error_status_to_http,
+            deadline=None if self.timeout is None else time.monotonic() + self.timeout,
+        )
+
+        try:
+            self.call_steps(context, self.process_steps, enforce_deadline=True)
+        except core.StopProcessing:
+            pass
+        except Exception as e:  # pylint: disable=W0718
+            context.exception = e
+            if not self.handle_exception(context):
+                raise  # re-raise the exception if not handled
+
+        self.call_steps(context, self.response_steps)
+        return context.response
+
+
+class SyncMethodDispatcher:
+    """Sync counterpart of `MethodDispatcher`."""
+
+    steps: abc.Mapping[str, multi.StepsDefinitionDict]
+    handlers: abc.Mapping[str, SyncUrlHandler]
+    invalid_method: abc.Callable[..., typing.Any]
+    error_status_to_http: abc.Mapping[int, int]
+    route: str
+    instrumentation: core.StepTimingSinkProtocol | None
+    timeout: float | None
+
+    def __init__(
+        self,
+        *,
+        invalid_method: abc.Callable[..., typing.Any],
+        error_status_to_http: abc.Mapping[int, int] | None = None,
+        route: str = "",
+        instrumentation: core.StepTimingSinkProtocol | None = None,
+        timeout: float | None = None,
+        **kwargs: multi.StepsDefinitionDict,
+    ):
+        error_status_to_http = error_status_to_http or {}
+        self.steps = {key.upper(): value for key, value in kwargs.items()}
+        self.handlers = {
+            key: SyncUrlHandler(
+                steps=value,
+                error_status_to_http=error_status_to_http,
+                route=f"{key} {route}",
+                instrumentation=instrumentation,
+                timeout=timeout,
+            )
+            for key, value in self.steps.items()
+        }
+        self.invalid_method = invalid_method
+        self.error_status_to_http = error_status_to_http
+        self.route = route
+        self.instrumentation = instrumentation
+        self.timeout = timeout
+
+    def __call__(self, request, *url_args, **url_kwargs):
+        handler = self.handlers.get(request.method, self.invalid_method)
+        return handler(request, *url_args, **url_kwargs)
+
+
+def sync_method_dispatcher(
+    *,
+    invalid_method: abc.Callable[..., typing.Any],
+    error_status_to_http: abc.Mapping[int, int] | None = None,
+    route: str = "",
+    instrumentation: core.StepTimingSinkProtocol | None = None,
+    timeout: float | None = None,
+    **kwargs: multi.StepsDefinitionDict,
+) -> SyncMethodDispatcher:
+    """Create a sync handler dispatching requests by HTTP method.
+
+    Steps are always compiled, async steps are replaced with their sync
+    variants, see `with_sync_variant`. The timeout is only checked between
+    steps, sync steps can't be interrupted.
+
+    Args:
+        invalid_method: Handler for methods without steps defined.
+        error_status_to_http: Mapping from application errors to HTTP errors.
+        route: Route name to report step timings for, e.g. `project/{project_id}`.
+        instrumentation: Sink to report step timings to, disabled if None.
+        timeout: Seconds to finish process steps in, unlimited if None.
+        **kwargs: Steps definitions by HTTP method name.
+    """
+    return SyncMethodDispatcher(
+        invalid_method=invalid_method,
+        error_status_to_http=error_status_to_http,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
+        **kwargs,
+    )
@@ -1,33 +1,152 @@
+import inspect
 import typing
 from collections import abc
 
+from chameleon.step.core import compiled as compiled_steps
 from chameleon.step.core import core
 from chameleon.step.core import multi
 
-__all__ = ("method_dispatcher",)
+__all__ = ("MethodDispatcher", "method_dispatcher")
 
 
 class InvalidHandlerProtocol(typing.Protocol):
     async def __call__(self, *args, **kwargs): ...
 
 
+class MethodDispatcher:
+    """Handler dispatching requests by HTTP method.
+
+    HTTP methods are kept upper-cased as frameworks provide them,
+    so the dispatching is a single dictionary lookup.
+    """
+
+    steps: abc.Mapping[str, multi.StepsDefinitionDict]
+    handlers: abc.Mapping[str, core.UrlHandler]
+    invalid_method: InvalidHandlerProtocol
+    error_status_to_http: abc.Mapping[int, int]
+    compiled: bool
+    route: str
+    instrumentation: core.StepTimingSinkProtocol | None
+    timeout: float | None
+
+    def __init__(
+        self,
+        *,
+        invalid_method: InvalidHandlerProtocol,
+        error_status_to_http: abc.Mapping[int, int] | None = None,
+        compiled: bool = False,
+        route: str = "",
+        instrumentation: core.StepTimingSinkProtocol | None = None,
+        timeout: float | None = None,
+        **kwargs: multi.StepsDefinitionDict,
+    ):
+        error_status_to_http = error_status_to_http or {}
+        self.steps = {key.upper(): value for key, value in kwargs.items()}
+        self.handlers = {
+            key: create_url_handler(
+                steps=value,
+                error_status_to_http=error_status_to_http,
+                compiled=compiled,
+                route=f"{key} {route}",
+                instrumentation=instrumentation,
+                timeout=timeout,
+            )
+            for key, value in self.steps.items()
+        }
+        self.invalid_method = invalid_method
+        self.error_status_to_http = error_status_to_http
+        self.compiled = compiled
+        self.route = route
+        self.instrumentation = instrumentation
+        self.timeout = timeout
+        # Let frameworks (e.g. Django) detect the instance as an async view
+        inspect.markcoroutinefunction(self)
+
+    async def __call__(self, request, *url_args, **url_kwargs):
+        handler = self.handlers.get(request.method, self.invalid_method)
+        return await handler(request, *url_args, **url_kwargs)
+
+    def replace_steps(
+        self,
+        *,
+        invalid_method: InvalidHandlerProtocol,
+        **steps: typing.Unpack[multi.StepsDefinitionDict],
+    ) -> "MethodDispatcher":
+        """Create a dispatcher with given steps replaced for every HTTP method.
+
+        It allows to serve the same definitions with another framework
+        by replacing framework-specific steps, e.g. `create_response_default`.
+
+        Args:
+            invalid_method: Handler for methods without steps defined.
+            **steps: Steps to replace in every definition.
+        """
+        return MethodDispatcher(
+            invalid_method=invalid_method,
+            error_status_to_http=self.error_status_to_http,
+            compiled=self.compiled,
+            route=self.route,
+            instrumentation=self.instrumentation,
+            timeout=self.timeout,
+            **{key: {**value, **steps} for key, value in self.steps.items()},
+        )
+
+
 def method_dispatcher(
     *,
     invalid_method: InvalidHandlerProtocol,
     error_status_to_http: abc.Mapping[int, int] | None = None,
+    compiled: bool = False,
+    route: str = "",
+    instrumentation: core.StepTimingSinkProtocol | None = None,
+    timeout: float | None = None,
     **kwargs: multi.StepsDefinitionDict,
-):
-    error_status_to_http = error_status_to_http or {}
-    table = {
-        key.lower(): core.UrlHandler(
-            steps=multi.multi_processor_steps(**value),
+) -> MethodDispatcher:
+    """Create a handler dispatching requests by HTTP method.
+
+    Args:
+        invalid_method: Handler for methods without steps defined.
+        error_status_to_http: Mapping from application errors to HTTP errors.
+        compiled: Compile steps to flat tuples of handlers once, instead of
+            calling nested list and mapping handlers on every request.
+        route: Route name to report step timings for, e.g. `project/{project_id}`.
+        instrumentation: Sink to report step timings to, disabled if None.
+        timeout: Seconds to finish process steps in, unlimited if None.
+        **kwargs: Steps definitions by HTTP method name.
+    """
+    return MethodDispatcher(
+        invalid_method=invalid_method,
+        error_status_to_http=error_status_to_http,
+        compiled=compiled,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
+        **kwargs,
+    )
+
+
+def create_url_handler(
+    *,
+    steps: multi.StepsDefinitionDict,
+    error_status_to_http: abc.Mapping[int, int],
+    compiled: bool = False,
+    route: str = "",
+    instrumentation: core.StepTimingSinkProtocol | None = None,
+    timeout: float | None = None,
+) -> core.UrlHandler:
+    if compiled:
+        return compiled_steps.CompiledUrlHandler(
+            steps=steps,
             error_status_to_http=error_status_to_http,
+            route=route,
+            instrumentation=instrumentation,
+            timeout=timeout,
         )
-        for key, value in kwargs.items()
-    }
-
-    async def process(request, *url_args, **url_kwargs):
-        handler = table.get(request.method.lower(), invalid_method)
-        return await handler(request, *url_args, **url_kwargs)
 
-    return process
+    return core.UrlHandler(
+        steps=multi.multi_processor_steps(**steps),
+        error_status_to_http=error_status_to_http,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
+    )
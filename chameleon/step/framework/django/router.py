@@ -0,0 +1,66 @@
+import re
+
+from django import urls
+from django.urls import resolvers
+
+from chameleon.step.core import router
+
+__all__ = ("RouteTrieURLPattern", "regex_urlpatterns")
+
+
+class RouteTrieURLPattern(urls.URLPattern):
+    """URL pattern resolving all routes of a route trie with a single lookup.
+
+    Basic usage in ROOT_URLCONF module:
+
+    >>> urlpatterns = [RouteTrieURLPattern(router.RouteTrie({"api": routes}))]
+
+    """
+
+    trie: router.RouteTrie
+
+    def __init__(self, trie: router.RouteTrie, name: str | None = None):
+        super().__init__(resolvers.RegexPattern("^", name=name), trie)
+        self.trie = trie
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(list(self.trie.routes()))} routes>"
+
+    def resolve(self, path: str) -> resolvers.ResolverMatch | None:
+        match = self.trie.resolve(path)
+        if match is None:
+            return None
+
+        return resolvers.ResolverMatch(
+            match.handler,
+            (),
+            match.kwargs,
+            self.pattern.name,
+            route=match.route,
+            captured_kwargs=match.kwargs,
+            extra_kwargs={},
+        )
+
+
+def route_regex(route: str) -> str:
+    """Convert route template to an anchored regex relative to its prefix."""
+    segments = (
+        (
+            f"(?P<{segment[1:-1]}>{router.PARAMETER_REGEX})"
+            if router.is_parameter(segment)
+            else re.escape(segment)
+        )
+        for segment in router.split_route(route)
+    )
+    return "^" + "".join(f"/{segment}" for segment in segments) + "$"
+
+
+def regex_urlpatterns(routes: router.Routes) -> tuple[urls.URLPattern, ...]:
+    """Create regex URL patterns from flat route definitions.
+
+    The patterns are relative to the including prefix, e.g. `{project_id}`
+    route is `^/(?P<project_id>[a-zA-Z0-9_-]+)$` regex.
+    """
+    return tuple(
+        urls.re_path(route_regex(route), handler) for route, handler in routes.items()
+    )
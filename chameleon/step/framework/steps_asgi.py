@@ -0,0 +1,307 @@
+"""Native ASGI adapter running step handlers on an ASGI scope directly.
+
+No framework request or response objects are created: request information
+is taken from the scope, and the response is sent as two ASGI messages.
+"""
+
+import dataclasses
+import logging
+import typing
+from collections import abc
+from urllib import parse
+
+from chameleon.step import core
+from chameleon.step.core import deadline
+from chameleon.step.core import router
+from chameleon.step.steps import steps_json
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "AsgiApplication",
+    "AsgiHeaders",
+    "AsgiRequest",
+    "AsgiResponse",
+    "asgi_json_steps",
+    "asgi_method_dispatcher",
+    "asgi_routes",
+)
+
+type Scope = abc.MutableMapping[str, typing.Any]
+type Message = abc.MutableMapping[str, typing.Any]
+type Receive = abc.Callable[[], abc.Awaitable[Message]]
+type Send = abc.Callable[[Message], abc.Awaitable[None]]
+
+JSON_MEDIA_RANGES = frozenset((b"application/json", b"application/*", b"*/*"))
+HTTP_METHODS_WITH_INPUT = {"POST", "PUT"}
+BODILESS_STATUSES = frozenset((204, 304))
+REQUEST_TIMEOUT_HEADER = deadline.REQUEST_TIMEOUT_HEADER.lower().encode("latin1")
+
+
+class AsgiHeaders(abc.Mapping[str, str]):
+    """Case-insensitive read-only view of ASGI scope headers.
+
+    Values are looked up on access, no dictionary is built per request.
+    """
+
+    __slots__ = ("headers",)
+
+    headers: abc.Sequence[tuple[bytes, bytes]]
+
+    def __init__(self, headers: abc.Sequence[tuple[bytes, bytes]]):
+        self.headers = headers
+
+    def __getitem__(self, name: str) -> str:
+        key = name.lower().encode("latin1")
+        for header, value in self.headers:
+            if header == key:
+                return value.decode("latin1")
+        raise KeyError(name)
+
+    def __iter__(self) -> abc.Iterator[str]:
+        return iter(dict.fromkeys(key.decode("latin1") for key, _ in self.headers))
+
+    def __len__(self) -> int:
+        return len({key for key, _ in self.headers})
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class AsgiRequest:
+    scope: Scope
+    receive: Receive
+
+    @property
+    def method(self) -> str:
+        return self.scope["method"]
+
+    def header(self, name: bytes) -> bytes | None:
+        """Get the first header value by lower-cased name."""
+        for key, value in self.scope["headers"]:
+            if key == name:
+                return value
+        return None
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class AsgiResponse:
+    status: int
+    body: bytes = b""
+    headers: abc.Mapping[str, str] | None = None
+    content_type: bytes | None = b"application/json"
+    stream: abc.AsyncIterable[bytes] | None = None
+
+    async def send(self, send: Send):
+        headers = []
+        if self.content_type is not None:
+            headers.append((b"content-type", self.content_type))
+        if self.status not in BODILESS_STATUSES and self.stream is None:
+            headers.append((b"content-length", str(len(self.body)).encode("latin1")))
+        if self.headers:
+            headers.extend(
+                (key.lower().encode("latin1"), value.encode("latin1"))
+                for key, value in self.headers.items()
+            )
+
+        await send(
+            {"type": "http.response.start", "status": self.status, "headers": headers}
+        )
+
+        if self.stream is not None:
+            async for chunk in self.stream:
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def asgi_fill_request_info(context: core.StepContext):
+    request: AsgiRequest = context.request_info.request
+    context.request_info.method = request.method
+    context.request_info.headers = AsgiHeaders(request.scope["headers"])
+    query_string = request.scope.get("query_string")
+    context.request_info.query = (
+        dict(parse.parse_qsl(query_string.decode(), keep_blank_values=True))
+        if query_string
+        else {}
+    )
+
+    timeout = deadline.parse_timeout(request.header(REQUEST_TIMEOUT_HEADER))
+    if timeout is not None:
+        deadline.limit_deadline(context, timeout)
+
+    content_type = request.header(b"content-type")
+    if content_type is None:
+        return
+
+    media_type, _, parameters = content_type.decode("latin1").partition(";")
+    context.request_info.content_type = media_type.strip()
+    for parameter in parameters.split(";"):
+        key, _, value = parameter.partition("=")
+        if key.strip().lower() == "charset":
+            context.request_info.content_encoding = value.strip().strip('"')
+
+
+def asgi_check_accepts_json(context: core.StepContext):
+    request: AsgiRequest = context.request_info.request
+    accept = request.header(b"accept")
+    if accept is None:
+        return
+
+    for media_range in accept.split(b","):
+        media_type, _, parameters = media_range.partition(b";")
+        if media_type.strip().lower() not in JSON_MEDIA_RANGES:
+            continue
+        if not is_q_zero(parameters):
+            return
+
+    raise ValueError("Requester doesn't accept json")
+
+
+def is_q_zero(parameters: bytes) -> bool:
+    for parameter in parameters.split(b";"):
+        key, _, value = parameter.partition(b"=")
+        if key.strip() == b"q":
+            try:
+                return float(value) == 0
+            except ValueError:
+                return False
+    return False
+
+
+async def asgi_extract_body(context: core.StepContext):
+    if context.request_info.method not in HTTP_METHODS_WITH_INPUT:
+        return
+
+    request: AsgiRequest = context.request_info.request
+    chunks: list[bytes] = []
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            raise ConnectionError("Client disconnected before sending the body")
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+
+    context.request_body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def asgi_create_response_json(context: core.StepContext):
+    if context.not_modified:
+        context.response = AsgiResponse(
+            status=304, headers=context.response_headers, content_type=None
+        )
+        return
+
+    content = context.response_body
+    error_status = context.error_status
+    stream = context.response_stream
+
+    if stream is not None and not error_status:
+        context.response = AsgiResponse(
+            status=200,
+            headers=context.response_headers,
+            stream=typing.cast(abc.AsyncIterable[bytes], stream),
+        )
+        return
+
+    if error_status:
+        http_status = context.error_status_to_http.get(error_status, 500)
+    elif not content or context.request_info.method == "DELETE":
+        http_status = 204
+    else:
+        http_status = 200
+
+    context.response = AsgiResponse(
+        status=http_status,
+        body=b"" if http_status == 204 else content,
+        headers=context.response_headers,
+    )
+
+
+def asgi_json_steps() -> core.StepsDefinitionDict:
+    """Framework-specific default steps replacing Django ones."""
+    return {
+        "fill_request_info_default": asgi_fill_request_info,
+        "check_headers_default": [
+            asgi_check_accepts_json,
+            steps_json.check_content_type_json,
+        ],
+        "extract_body_default": asgi_extract_body,
+        "create_response_default": asgi_create_response_json,
+    }
+
+
+def asgi_method_dispatcher(
+    dispatcher: core.MethodDispatcher,
+) -> core.MethodDispatcher:
+    """Create the same dispatcher running steps on ASGI scope."""
+    allow = ", ".join(dispatcher.steps)
+
+    async def invalid_method(*_args, **_kwargs):
+        return AsgiResponse(status=405, headers={"Allow": allow})
+
+    return dispatcher.replace_steps(invalid_method=invalid_method, **asgi_json_steps())
+
+
+def asgi_routes(routes: router.Routes) -> router.Routes:
+    """Convert nested route definitions to ASGI method dispatchers."""
+    return {
+        route: (
+            asgi_routes(handler)
+            if isinstance(handler, abc.Mapping)
+            else asgi_method_dispatcher(handler)
+        )
+        for route, handler in routes.items()
+    }
+
+
+class AsgiApplication:
+    """ASGI application serving route definitions without a framework.
+
+    Requests not matching any route are passed to the fallback application,
+    e.g. Django one, or get 404 response if there's no fallback.
+    Override `request_started` and `request_finished` to manage resources
+    around each request, e.g. database connections.
+    """
+
+    trie: router.RouteTrie
+    fallback: abc.Callable[[Scope, Receive, Send], abc.Awaitable[None]] | None
+
+    def __init__(
+        self,
+        *,
+        routes: router.Routes,
+        fallback: abc.Callable[[Scope, Receive, Send], abc.Awaitable[None]]
+        | None = None,
+    ):
+        self.trie = router.RouteTrie(asgi_routes(routes))
+        self.fallback = fallback
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        match = self.trie.resolve(scope["path"]) if scope["type"] == "http" else None
+
+        if match is None:
+            if self.fallback is not None:
+                await self.fallback(scope, receive, send)
+            elif scope["type"] == "http":
+                await AsgiResponse(status=404).send(send)
+            return
+
+        await self.request_started(scope)
+        try:
+            request = AsgiRequest(scope=scope, receive=receive)
+            try:
+                response = await match.handler(request, **match.kwargs)
+            except Exception:  # pylint: disable=W0718
+                logger.exception("Unhandled exception on %s", scope["path"])
+                response = AsgiResponse(status=500)
+            await response.send(send)
+        finally:
+            await self.request_finished(scope)
+
+    async def request_started(self, scope: Scope):
+        pass
+
+    async def request_finished(self, scope: Scope):
+        pass
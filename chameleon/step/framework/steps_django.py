@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing
 from collections import abc
@@ -5,55 +6,169 @@ from collections import abc
 from django import http
 
 from chameleon.step import core
+from chameleon.step.core import deadline
 from chameleon.step.steps import steps_default as default
 from chameleon.step.steps import steps_json as json
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("method_dispatcher", "django_json_steps")
+__all__ = (
+    "method_dispatcher",
+    "sync_method_dispatcher",
+    "sync_view",
+    "django_json_steps",
+)
+
+SYNC_DISPATCHER_ATTRIBUTE = "sync_dispatcher"
 
 
 def method_dispatcher(
     *,
     error_status_to_http: abc.Mapping[int, int] | None = None,
+    compiled: bool = False,
+    route: str = "",
+    instrumentation: core.StepTimingSinkProtocol | None = None,
+    timeout: float | None = None,
     **kwargs: core.StepsDefinitionDict,
 ):
+    """Create an async view dispatching requests by HTTP method.
+
+    The sync pipeline of the same steps is created on first `sync_view` call,
+    so WSGI handlers could call it without an event loop.
+    """
+
     async def invalid_method(*_args, **_kwargs):
-        return http.HttpResponseNotAllowed(kwargs.keys())
+        return http.HttpResponseNotAllowed([key.upper() for key in kwargs])
+
+    dispatcher = core.method_dispatcher(
+        invalid_method=invalid_method,
+        error_status_to_http=error_status_to_http,
+        compiled=compiled,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
+        **kwargs,
+    )
+    create_sync_dispatcher = functools.partial(
+        sync_method_dispatcher,
+        error_status_to_http=error_status_to_http,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
+        **kwargs,
+    )
+    setattr(
+        dispatcher, SYNC_DISPATCHER_ATTRIBUTE, functools.cache(create_sync_dispatcher)
+    )
+    return dispatcher
+
+
+def sync_method_dispatcher(
+    *,
+    error_status_to_http: abc.Mapping[int, int] | None = None,
+    route: str = "",
+    instrumentation: core.StepTimingSinkProtocol | None = None,
+    timeout: float | None = None,
+    **kwargs: core.StepsDefinitionDict,
+):
+    def invalid_method(*_args, **_kwargs):
+        return http.HttpResponseNotAllowed([key.upper() for key in kwargs])
 
-    return core.method_dispatcher(
+    return core.sync_method_dispatcher(
         invalid_method=invalid_method,
         error_status_to_http=error_status_to_http,
+        route=route,
+        instrumentation=instrumentation,
+        timeout=timeout,
         **kwargs,
     )
 
 
-async def django_fill_request_info(context: core.StepContext):
+def sync_view(view: typing.Any) -> typing.Any:
+    """Sync pipeline of a view made by `method_dispatcher`, other views as is."""
+    create_sync_dispatcher = getattr(view, SYNC_DISPATCHER_ATTRIBUTE, None)
+    if create_sync_dispatcher is None:
+        return view
+
+    return create_sync_dispatcher()
+
+
+def django_fill_request_info(context: core.StepContext):
     request: http.HttpRequest = context.request_info.request
     if request.method is None:
         raise ValueError("Invalid request method.")
     context.request_info.method = request.method
     context.request_info.content_type = request.content_type
     context.request_info.content_encoding = request.encoding
+    context.request_info.headers = request.headers
+    context.request_info.query = request.GET
+
+    timeout = deadline.parse_timeout(
+        request.headers.get(deadline.REQUEST_TIMEOUT_HEADER)
+    )
+    if timeout is not None:
+        deadline.limit_deadline(context, timeout)
 
 
 HTTP_METHODS_WITH_INPUT = {"POST", "PUT"}
 
 
-async def extract_body(context: core.StepContext):
+def extract_body(context: core.StepContext):
     request_method = context.request_info.method
 
     if request_method in HTTP_METHODS_WITH_INPUT:
         context.request_body = context.request_info.request.body
 
 
-async def django_check_accepts_json(context: core.StepContext):
+def django_check_accepts_json(context: core.StepContext):
     request: http.HttpRequest = context.request_info.request
     if not request.accepts("application/json"):
         raise ValueError("Requester doesn't accept json")
 
 
+def create_response_json_stream(
+    context: core.StepContext,
+    streaming_content: abc.AsyncIterable[bytes] | abc.Iterable[bytes],
+) -> http.StreamingHttpResponse:
+    return http.StreamingHttpResponse(
+        streaming_content,
+        status=200,
+        headers=context.response_headers,
+        content_type="application/json",
+    )
+
+
+def create_response_json_sync(context: core.StepContext):
+    stream = context.response_stream
+    if stream is not None and not context.error_status:
+        # WSGI consumes a sync iterator
+        stream_sync = typing.cast(abc.Iterable[bytes], stream)
+        context.response = create_response_json_stream(context, iter(stream_sync))
+        return
+
+    create_response_json_body(context)
+
+
+@core.with_sync_variant(create_response_json_sync)
 async def create_response_json(context: core.StepContext):
+    stream = context.response_stream
+    if stream is not None and not context.error_status:
+        # Django prefers sync iteration if both are supported, it would need
+        # a thread per chunk under ASGI
+        stream_async = typing.cast(abc.AsyncIterable[bytes], stream)
+        context.response = create_response_json_stream(context, aiter(stream_async))
+        return
+
+    create_response_json_body(context)
+
+
+def create_response_json_body(context: core.StepContext):
+    if context.not_modified:
+        context.response = http.HttpResponseNotModified(
+            headers=context.response_headers
+        )
+        return
+
     content = context.response_body
 
     error_status = context.error_status
@@ -1,9 +1,13 @@
+import functools
 import typing
 from collections import abc
 
 from chameleon.step.mapping import registry
 
 __all__ = (
+    "RowMapping",
+    "get_row_mapping",
+    "registered_row_mapping",
     "register_simple_mapping",
     "register_simple_mapping_from_dict",
     "register_simple_mapping_from_object",
@@ -16,6 +20,97 @@ __all__ = (
 GetattrProtocol = abc.Callable[[typing.Any, str], typing.Any]
 FieldConverterProtocol = abc.Callable[[typing.Any], typing.Any]
 
+ROW_MAPPING_ATTRIBUTE = "row_mapping"
+
+
+class RowMapping:
+    """Mapping from a row of source field values, e.g. a database row.
+
+    Rows are sequences of values of `fields` in the same order, extra values
+    at the end are ignored.
+    """
+
+    __slots__ = (
+        "target_object_type",
+        "include_none",
+        "field_mapping",
+        "custom_converters",
+        "mapping",
+    )
+
+    target_object_type: typing.Any
+    include_none: bool
+    field_mapping: abc.Mapping[str, str]
+    custom_converters: abc.Mapping[str, FieldConverterProtocol]
+    mapping: abc.Callable[[abc.Sequence[typing.Any]], typing.Any]
+
+    def __init__(
+        self,
+        *,
+        target_object_type: typing.Any,
+        include_none: bool,
+        field_mapping: abc.Mapping[str, str],
+        custom_converters: abc.Mapping[str, FieldConverterProtocol],
+    ):
+        self.target_object_type = target_object_type
+        self.include_none = include_none
+        self.field_mapping = field_mapping
+        self.custom_converters = custom_converters
+        self.mapping = create_row_mapping_function(
+            target_object_type=target_object_type,
+            include_none=include_none,
+            target_fields=tuple(field_mapping),
+            custom_converters=custom_converters,
+        )
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Source fields in the row order."""
+        return tuple(self.field_mapping.values())
+
+    @property
+    def target_fields(self) -> tuple[str, ...]:
+        return tuple(self.field_mapping)
+
+    def select(self, target_fields: abc.Collection[str]) -> "RowMapping":
+        """Row mapping producing only given target fields."""
+        return RowMapping(
+            target_object_type=self.target_object_type,
+            include_none=self.include_none,
+            field_mapping={
+                target: source
+                for target, source in self.field_mapping.items()
+                if target in target_fields
+            },
+            custom_converters=self.custom_converters,
+        )
+
+
+def get_row_mapping(processor: typing.Any) -> RowMapping | None:
+    """Get the row mapping of a simple mapping function, if it has one."""
+    return getattr(processor, ROW_MAPPING_ATTRIBUTE, None)
+
+
+def registered_row_mapping(
+    type_id: str, action_id: str | None = None
+) -> abc.Callable[[], tuple[typing.Any, RowMapping]]:
+    """Get a registered simple mapping and its row mapping on the first call.
+
+    Mappings are looked up when the returned function is first called, not
+    when it's created, so routes don't create lazily registered mappings when
+    they're defined.
+    """
+
+    @functools.cache
+    def get() -> tuple[typing.Any, RowMapping]:
+        processor = registry.get(type_id, action_id)
+        row_mapping = get_row_mapping(processor)
+        if row_mapping is None:
+            raise ValueError(f"No row mapping registered for {type_id}:{action_id}")
+        return processor, row_mapping
+
+    return get
+
 
 def register_simple_mapping(
     *,
@@ -28,7 +123,7 @@ def register_simple_mapping(
     custom_mapping: abc.Mapping[str, str] | None = None,
     custom_converters: abc.Mapping[str, FieldConverterProtocol] | None = None,
 ):
-    """Register simple mapping function.
+    """Register simple mapping function, created on first use.
 
     type_id & action_id define target processor name
     target_object_type is object_type
@@ -55,6 +150,27 @@ def register_simple_mapping(
     if unknown_converters:
         raise ValueError(f"Unknown field converters provided: {unknown_converters}")
 
+    registry.register_factory(
+        type_id=type_id,
+        action_id=action_id,
+        factory=lambda: create_mapping_function(
+            target_object_type=target_object_type,
+            get_field_fun=get_field_fun,
+            include_none=include_none,
+            field_mapping=field_mapping,
+            custom_converters=custom_converters,
+        ),
+    )
+
+
+def create_mapping_function(
+    *,
+    target_object_type: typing.Any,
+    get_field_fun: GetattrProtocol,
+    include_none: bool,
+    field_mapping: abc.Mapping[str, str],
+    custom_converters: abc.Mapping[str, FieldConverterProtocol],
+) -> abc.Callable[[typing.Any], typing.Any]:
     def mapping(source):
         kwargs = {}
         for target_field, source_field in field_mapping.items():
@@ -69,7 +185,40 @@ def register_simple_mapping(
 
         return target_object_type(**kwargs)
 
-    registry.register(type_id=type_id, action_id=action_id, processor=mapping)
+    # nested fields can't be read as a single column
+    if not any("." in source_field for source_field in field_mapping.values()):
+        row_mapping = RowMapping(
+            target_object_type=target_object_type,
+            include_none=include_none,
+            field_mapping=field_mapping,
+            custom_converters=custom_converters,
+        )
+        setattr(mapping, ROW_MAPPING_ATTRIBUTE, row_mapping)
+
+    return mapping
+
+
+def create_row_mapping_function(
+    *,
+    target_object_type: typing.Any,
+    include_none: bool,
+    target_fields: tuple[str, ...],
+    custom_converters: abc.Mapping[str, FieldConverterProtocol],
+) -> abc.Callable[[abc.Sequence[typing.Any]], typing.Any]:
+    converters = tuple(custom_converters.get(field) for field in target_fields)
+
+    def mapping_row(row: abc.Sequence[typing.Any]):
+        kwargs = {}
+        for target_field, converter, value in zip(target_fields, converters, row):
+            if converter is not None:
+                value = converter(value)
+
+            if value is not None or include_none:
+                kwargs[target_field] = value
+
+        return target_object_type(**kwargs)
+
+    return mapping_row
 
 
 def register_simple_mapping_from_dict(
@@ -5,6 +5,7 @@ from .steps_default import DefaultJsonSteps
 from .steps_json import check_content_type_json
 from .steps_json import default_deserialize_json
 from .steps_json import default_serialize_json
+from .tools import merge_steps
 from .validation import default_validation_steps
 
 __all__ = (
@@ -14,5 +15,6 @@ __all__ = (
     "default_serialize_json",
     "default_validation_steps",
     "default_deserialize_json",
+    "merge_steps",
     "DefaultJsonSteps",
 )
@@ -0,0 +1,242 @@
+"""Server-side cache of serialized GET responses invalidated by tags.
+
+Every tag, e.g. `ticket:1` or `project:1:ticket`, has a random version token
+in the backend. An entry stores the tokens it has been created with, and it's
+valid while all of them are current. Invalidation replaces tokens of the tags,
+so no entry has to be found and deleted. An entry and token lookup is
+a single `get_many` call.
+
+The backend is any object with Django cache-like API, e.g. a Django cache.
+Async steps use its async methods (`aget_many`, `aadd`, `aset`), so a network
+or file based backend doesn't block the event loop; the sync pipeline uses
+the sync ones.
+"""
+
+import hashlib
+import secrets
+import typing
+from collections import abc
+
+from chameleon.step import core
+
+__all__ = ("CacheBackendProtocol", "ResponseCache", "response_cache_steps")
+
+CACHE_INFO_KEY = "response_cache"
+
+
+class CacheBackendProtocol(typing.Protocol):
+    def get_many(self, keys: abc.Iterable[str]) -> dict[str, typing.Any]: ...
+
+    def set(self, key: str, value: typing.Any, timeout: float | None = ...): ...
+
+    def set_many(
+        self, data: abc.Mapping[str, typing.Any], timeout: float | None = ...
+    ): ...
+
+    def add(self, key: str, value: typing.Any, timeout: float | None = ...) -> bool: ...
+
+    async def aget_many(self, keys: abc.Iterable[str]) -> dict[str, typing.Any]: ...
+
+    async def aset(self, key: str, value: typing.Any, timeout: float | None = ...): ...
+
+    async def aadd(
+        self, key: str, value: typing.Any, timeout: float | None = ...
+    ) -> bool: ...
+
+
+class CacheEntry(typing.NamedTuple):
+    tokens: tuple[str, ...]
+    response_body: bytes
+    response_headers: dict[str, str] | None = None
+
+
+def new_tokens(
+    values: dict[str, typing.Any], tag_keys: abc.Iterable[str]
+) -> abc.Iterator[tuple[str, str]]:
+    """Create tokens of tags without one, they're added to `values`."""
+    for tag_key in tag_keys:
+        if values.get(tag_key) is None:
+            values[tag_key] = secrets.token_hex(8)
+            yield tag_key, values[tag_key]
+
+
+def valid_entry(
+    values: abc.Mapping[str, typing.Any], entry_key: str, tag_keys: list[str]
+) -> tuple[CacheEntry | None, tuple[str, ...]]:
+    tokens = tuple(values[tag_key] for tag_key in tag_keys)
+    entry: CacheEntry | None = values.get(entry_key)
+    if entry is not None and entry.tokens == tokens:
+        return entry, tokens
+
+    return None, tokens
+
+
+class ResponseCache:
+    """Response cache on top of a backend with tag based invalidation.
+
+    Args:
+        backend: Cache backend, e.g. `django.core.cache.caches["default"]`.
+        timeout: Seconds to keep responses for, forever if None.
+        prefix: Prefix of all keys in the backend.
+    """
+
+    backend: CacheBackendProtocol
+    timeout: float | None
+    prefix: str
+
+    def __init__(
+        self,
+        *,
+        backend: CacheBackendProtocol,
+        timeout: float | None = 300,
+        prefix: str = "chameleon",
+    ):
+        self.backend = backend
+        self.timeout = timeout
+        self.prefix = prefix
+
+    def tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    def entry_key(self, path: str, query: abc.Mapping[str, str] | None) -> str:
+        value = path
+        if query:
+            value += repr(sorted(query.items()))
+        digest = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+        return f"{self.prefix}:response:{digest}"
+
+    def get(
+        self, entry_key: str, tags: abc.Sequence[str]
+    ) -> tuple[CacheEntry | None, tuple[str, ...] | None]:
+        """Get a valid entry and current tag tokens.
+
+        Tokens are None if a tag has just got a token concurrently, so
+        the response must not be stored.
+        """
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        values = self.backend.get_many([entry_key, *tag_keys])
+        for tag_key, token in new_tokens(values, tag_keys):
+            if not self.backend.add(tag_key, token, timeout=None):
+                return None, None
+        return valid_entry(values, entry_key, tag_keys)
+
+    async def aget(
+        self, entry_key: str, tags: abc.Sequence[str]
+    ) -> tuple[CacheEntry | None, tuple[str, ...] | None]:
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        values = await self.backend.aget_many([entry_key, *tag_keys])
+        for tag_key, token in new_tokens(values, tag_keys):
+            if not await self.backend.aadd(tag_key, token, timeout=None):
+                return None, None
+        return valid_entry(values, entry_key, tag_keys)
+
+    def set(self, entry_key: str, entry: CacheEntry):
+        self.backend.set(entry_key, entry, timeout=self.timeout)
+
+    async def aset(self, entry_key: str, entry: CacheEntry):
+        await self.backend.aset(entry_key, entry, timeout=self.timeout)
+
+    def invalidate(self, tags: abc.Iterable[str]):
+        """Invalidate all responses cached with any of the tags."""
+        self.backend.set_many(
+            {self.tag_key(tag): secrets.token_hex(8) for tag in tags}, timeout=None
+        )
+
+
+def response_cache_steps(
+    cache: ResponseCache,
+    *,
+    route: str,
+    tags: abc.Sequence[str],
+) -> core.StepsDefinitionDict:
+    """Create steps serving GET responses from the cache.
+
+    Route and tags are formatted with URL parameters. Only successful responses
+    are stored along with headers set so far, e.g. pagination links; a cached
+    response skips the rest of process steps and `serialize`.
+
+    Basic usage:
+
+    >>> processor_get = chameleon_json_steps(
+    ...     business=ticket_get_fun,
+    ...     **response_cache_steps(
+    ...         cache, route="ticket/{ticket_id}", tags=["ticket:{ticket_id}"]
+    ...     ),
+    ... )
+
+    Args:
+        cache: Response cache.
+        route: Route to build the cache key with, e.g. `ticket/{ticket_id}`.
+        tags: Tags to invalidate responses by, e.g. `project:{project_id}:ticket`.
+    """
+
+    def lookup(context: core.StepContext) -> tuple[str, list[str]] | None:
+        if context.request_info.method != "GET":
+            return None
+
+        url_params = context.custom_info
+        entry_key = cache.entry_key(
+            route.format_map(url_params), context.request_info.query
+        )
+        return entry_key, [tag.format_map(url_params) for tag in tags]
+
+    def response_cache_get_sync(context: core.StepContext):
+        key = lookup(context)
+        if key is not None:
+            use_entry(context, key[0], *cache.get(*key))
+
+    @core.with_sync_variant(response_cache_get_sync)
+    async def response_cache_get(context: core.StepContext):
+        key = lookup(context)
+        if key is not None:
+            use_entry(context, key[0], *await cache.aget(*key))
+
+    def response_cache_set_sync(context: core.StepContext):
+        entry = new_entry(context)
+        if entry is not None:
+            cache.set(*entry)
+
+    @core.with_sync_variant(response_cache_set_sync)
+    async def response_cache_set(context: core.StepContext):
+        entry = new_entry(context)
+        if entry is not None:
+            await cache.aset(*entry)
+
+    return {
+        "business_pre": response_cache_get,
+        "serialize_post": response_cache_set,
+    }
+
+
+def use_entry(
+    context: core.StepContext,
+    entry_key: str,
+    entry: CacheEntry | None,
+    tokens: tuple[str, ...] | None,
+):
+    """Respond with the cached entry, or remember the key to store one."""
+    if entry is not None:
+        context.response_body = entry.response_body
+        if entry.response_headers:
+            context.response_headers = {
+                **entry.response_headers,
+                **(context.response_headers or {}),
+            }
+        raise core.StopProcessing()
+
+    if tokens is not None:
+        context.custom_info[CACHE_INFO_KEY] = (entry_key, tokens)
+
+
+def new_entry(context: core.StepContext) -> tuple[str, CacheEntry] | None:
+    info = context.custom_info.pop(CACHE_INFO_KEY, None)
+    if info is None or context.error_status or context.response_body is None:
+        return None
+
+    entry_key, tokens = info
+    response_headers = context.response_headers
+    return entry_key, CacheEntry(
+        tokens,
+        context.response_body,
+        dict(response_headers) if response_headers else None,
+    )
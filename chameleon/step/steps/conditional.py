@@ -0,0 +1,222 @@
+"""Conditional GET requests with ETag / Last-Modified validators.
+
+The ETag is computed from the serialized response body, or before the
+business step from the object last modification time, e.g. the latest history
+timestamp. The latter skips the business, mapping and serialization entirely
+for not modified objects. Framework steps respond with 304 for
+`StepContext.not_modified`.
+"""
+
+import datetime
+import hashlib
+import typing
+from collections import abc
+from email import utils
+
+from chameleon.step import core
+from chameleon.step.core.core import is_async_step
+
+__all__ = ("conditional_steps", "etag_from_body", "etag_matches")
+
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+
+CONDITIONAL_METHODS = frozenset(("GET", "HEAD"))
+
+# validators computed before the business step, set as headers of successful
+# responses only
+VALIDATORS_INFO_KEY = "conditional_validators"
+
+
+class LastModifiedProtocol(typing.Protocol):
+    """Get the last modification time of the requested object, None if unknown."""
+
+    async def __call__(self, context: core.StepContext) -> datetime.datetime | None: ...
+
+
+class SyncLastModifiedProtocol(typing.Protocol):
+    def __call__(self, context: core.StepContext) -> datetime.datetime | None: ...
+
+
+def etag_from_body(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_from_timestamp(
+    timestamp: datetime.datetime, query: abc.Mapping[str, str] | None
+) -> str:
+    """Strong ETag for a representation of the object modified at `timestamp`.
+
+    Query parameters could change the representation, so they're included.
+    """
+    value = timestamp.isoformat()
+    if query:
+        value += repr(sorted(query.items()))
+    return f'"{hashlib.blake2b(value.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of the ETag to `If-None-Match` header value."""
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def modified_since(if_modified_since: str, last_modified: datetime.datetime) -> bool:
+    try:
+        since = utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return True  # invalid date is ignored
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.UTC)
+
+    # HTTP dates have seconds precision
+    return last_modified.replace(microsecond=0) > since
+
+
+def is_not_modified(
+    context: core.StepContext,
+    *,
+    etag: str | None,
+    last_modified: datetime.datetime | None,
+) -> bool:
+    headers = context.request_info.headers
+    if not headers:
+        return False
+
+    # If-Modified-Since is ignored if If-None-Match is present
+    if_none_match = headers.get(IF_NONE_MATCH_HEADER)
+    if if_none_match is not None:
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get(IF_MODIFIED_SINCE_HEADER)
+    if if_modified_since is not None and last_modified is not None:
+        return not modified_since(if_modified_since, last_modified)
+
+    return False
+
+
+def set_validators(
+    context: core.StepContext,
+    *,
+    etag: str,
+    last_modified: datetime.datetime | None = None,
+):
+    if context.response_headers is None:
+        context.response_headers = {}
+
+    context.response_headers[ETAG_HEADER] = etag
+    if last_modified is not None:
+        context.response_headers[LAST_MODIFIED_HEADER] = utils.format_datetime(
+            last_modified.astimezone(datetime.UTC), usegmt=True
+        )
+
+
+def conditional_response_headers(context: core.StepContext):
+    """Set validators of a successful response.
+
+    Validators computed from the last modification time are used, otherwise
+    ETag is computed from the response body.
+    """
+    validators = context.custom_info.pop(VALIDATORS_INFO_KEY, None)
+    if context.error_status or context.request_info.method not in CONDITIONAL_METHODS:
+        return
+
+    if validators is not None:
+        etag, last_modified = validators
+        set_validators(context, etag=etag, last_modified=last_modified)
+        return
+
+    if context.not_modified or not context.response_body:
+        return
+
+    etag = etag_from_body(context.response_body)
+    set_validators(context, etag=etag)
+    context.not_modified = is_not_modified(context, etag=etag, last_modified=None)
+
+
+def check_not_modified_from(
+    context: core.StepContext, last_modified: datetime.datetime | None
+):
+    if last_modified is None:
+        return
+
+    etag = etag_from_timestamp(last_modified, context.request_info.query)
+    context.custom_info[VALIDATORS_INFO_KEY] = (etag, last_modified)
+
+    if is_not_modified(context, etag=etag, last_modified=last_modified):
+        context.not_modified = True
+        raise core.StopProcessing()
+
+
+def check_not_modified_step(
+    last_modified: LastModifiedProtocol | SyncLastModifiedProtocol,
+    last_modified_sync: SyncLastModifiedProtocol | None,
+) -> core.StepHandler:
+    if not is_async_step(last_modified):
+        last_modified_sync = typing.cast(SyncLastModifiedProtocol, last_modified)
+    elif last_modified_sync is None:
+        raise TypeError(f"Async {last_modified!r} has no sync variant")
+    sync_last_modified = last_modified_sync
+
+    def check_not_modified_sync(context: core.StepContext):
+        if context.request_info.method in CONDITIONAL_METHODS:
+            check_not_modified_from(context, sync_last_modified(context))
+
+    if not is_async_step(last_modified):
+        return check_not_modified_sync
+
+    async_last_modified = typing.cast(LastModifiedProtocol, last_modified)
+
+    @core.with_sync_variant(check_not_modified_sync)
+    async def check_not_modified(context: core.StepContext):
+        if context.request_info.method in CONDITIONAL_METHODS:
+            check_not_modified_from(context, await async_last_modified(context))
+
+    return check_not_modified
+
+
+def conditional_steps(
+    *,
+    last_modified: LastModifiedProtocol | SyncLastModifiedProtocol | None = None,
+    last_modified_sync: SyncLastModifiedProtocol | None = None,
+) -> core.StepsDefinitionDict:
+    """Create steps answering conditional GET requests with 304.
+
+    Basic usage:
+
+    >>> processor_get = chameleon_json_steps(
+    ...     business=ticket_get_fun,
+    ...     **conditional_steps(
+    ...         last_modified=ticket_last_modified,
+    ...         last_modified_sync=ticket_last_modified_sync,
+    ...     ),
+    ... )
+
+    Args:
+        last_modified: Step-like function to get the last modification time
+            of the requested object. If it's given, validators are checked
+            before the business step; the object must not change without
+            updating the time. Otherwise, the ETag is computed from
+            the serialized response body.
+        last_modified_sync: Sync variant of async `last_modified` for the
+            sync pipeline. It isn't a step, so it isn't linked by
+            `with_sync_variant`.
+    """
+    steps: core.StepsDefinitionDict = {
+        "response_headers": conditional_response_headers,
+    }
+
+    if last_modified is not None:
+        steps["business_pre"] = check_not_modified_step(
+            last_modified, last_modified_sync
+        )
+
+    return steps
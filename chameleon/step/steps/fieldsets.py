@@ -0,0 +1,100 @@
+"""Sparse fieldsets requested with `fields` query parameter.
+
+Requested fields are validated against the fields of a registered simple
+mapping and stored in `StepContext.output_fields`. Business steps could load
+only their source fields, and only them are read by the output mapping, so
+deferred fields aren't loaded one by one.
+"""
+
+import operator
+from collections import abc
+
+from chameleon.step import core
+from chameleon.step.mapping import simple
+
+__all__ = ("InvalidFieldsRequest", "sparse_fieldset_steps", "source_fields")
+
+FIELDS_PARAMETER = "fields"
+
+
+class InvalidFieldsRequest(ValueError):
+    """Unknown or empty `fields` query parameter."""
+
+
+def parse_fields(
+    value: str, field_mapping: abc.Mapping[str, str]
+) -> abc.Mapping[str, str]:
+    requested = {field.strip() for field in value.split(",")} - {""}
+    if not requested:
+        raise InvalidFieldsRequest("No fields requested")
+
+    unknown = requested - field_mapping.keys()
+    if unknown:
+        raise InvalidFieldsRequest(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    # mapping order, so outputs don't depend on the parameter order
+    return {
+        target: source
+        for target, source in field_mapping.items()
+        if target in requested
+    }
+
+
+def source_fields(context: core.StepContext) -> abc.Collection[str] | None:
+    """Source fields of requested output fields to load, all if None."""
+    if context.output_fields is None:
+        return None
+    return context.output_fields.values()
+
+
+def sparse_fieldset_steps(
+    *,
+    type_id: str,
+    action_id: str = "get",
+    mapping_output_expect_list: bool = False,
+) -> core.StepsDefinitionDict:
+    """Create steps selecting output fields requested with `fields` parameter.
+
+    Single objects are mapped with requested fields only. Lists are expected
+    to be created by `list_rows_steps`, which fetches and maps requested
+    fields only.
+
+    Basic usage:
+
+    >>> processor_get = chameleon_json_steps(
+    ...     business=ticket_get_fun,
+    ...     **sparse_fieldset_steps(type_id="ticket"),
+    ... )
+
+    Args:
+        type_id: Object type ID of the registered simple output mapping.
+        action_id: Action ID of the registered simple output mapping.
+        mapping_output_expect_list: Output is a list, mapped by `list_rows_steps`.
+    """
+    registered = simple.registered_row_mapping(type_id, action_id)
+
+    def select_output_fields(context: core.StepContext):
+        _, row_mapping = registered()
+        query = context.request_info.query
+        value = query.get(FIELDS_PARAMETER) if query else None
+        if value is not None:
+            context.output_fields = parse_fields(value, row_mapping.field_mapping)
+
+    steps: core.StepsDefinitionDict = {"business_pre": select_output_fields}
+    if mapping_output_expect_list:
+        return steps
+
+    def map_selected_output(context: core.StepContext):
+        object_mapping, row_mapping = registered()
+        if context.output_fields is None:
+            context.output_raw = object_mapping(context.output_business)
+            return
+
+        selected = row_mapping.select(context.output_fields)
+        row = operator.attrgetter(*selected.fields)(context.output_business)
+        context.output_raw = selected.mapping(
+            (row,) if len(selected.fields) == 1 else row
+        )
+
+    steps["map_output"] = map_selected_output
+    return steps
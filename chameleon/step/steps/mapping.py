@@ -5,6 +5,7 @@ import typing
 
 from chameleon.step import core
 from chameleon.step import mapping
+from chameleon.step.steps import streaming
 
 __all__ = ("default_mapping_steps",)
 
@@ -35,7 +36,14 @@ class MappingContext:
     expect_list: bool | None
 
 
-async def mapper_handler_runtime(
+def map_list(mapping_function: core.ProcessorProtocol, values):
+    """Map a list, lazy rows to stream are mapped on iteration."""
+    if streaming.is_lazy_rows(values):
+        return streaming.MappedRows(values, mapping_function)
+    return list(map(mapping_function, values))
+
+
+def mapper_handler_runtime(
     context: core.StepContext, *, mapping_context: MappingContext
 ):
     input_value = mapper_get_input(context, mapping_context.is_input)
@@ -47,39 +55,39 @@ async def mapper_handler_runtime(
         return
 
     if mapping_context.expect_list:
-        output_value = list(map(mapper_function, input_value))
+        output_value = map_list(mapper_function, input_value)
     else:
         output_value = mapper_function(input_value)
 
     mapping_set_output(context, output_value, mapping_context.is_input)
 
 
-async def mapper_handler_single_input(
+def mapper_handler_single_input(
     context: core.StepContext, *, mapping_function: core.ProcessorProtocol
 ):
     context.input_business = mapping_function(context.input_raw)
 
 
-async def mapper_handler_single_output(
+def mapper_handler_single_output(
     context: core.StepContext, *, mapping_function: core.ProcessorProtocol
 ):
     context.output_raw = mapping_function(context.output_business)
 
 
-async def mapper_handler_list_input(
+def mapper_handler_list_input(
     context: core.StepContext, *, mapping_function: core.ProcessorProtocol
 ):
     context.input_business = list(map(mapping_function, context.input_raw))
 
 
-async def mapper_handler_list_output(
+def mapper_handler_list_output(
     context: core.StepContext, *, mapping_function: core.ProcessorProtocol
 ):
-    context.output_raw = list(map(mapping_function, context.output_business))
+    context.output_raw = map_list(mapping_function, context.output_business)
 
 
 class MapperHandlerProtocol(typing.Protocol):
-    async def __call__(
+    def __call__(
         self, context: core.StepContext, *, mapping_function: core.ProcessorProtocol
     ): ...
 
@@ -101,7 +109,7 @@ def generic_mapper_handler(
     expect_list: bool,
     check_runtime: bool = False,
     **_kwargs,
-) -> core.StepHandlerProtocol | None:
+) -> core.StepHandler | None:
     if check_runtime:
         mapping_context = MappingContext(
             type_id=type_id,
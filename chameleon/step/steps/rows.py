@@ -0,0 +1,73 @@
+"""List outputs read as rows of field values instead of model instances.
+
+Simple mappings declare the exact fields they output, so a list could be
+fetched as tuples of those columns and mapped straight from them. Neither
+model instances nor per-field attribute lookups are created then.
+"""
+
+import typing
+from collections import abc
+
+from chameleon.common import pagination
+from chameleon.common.query import AbstractQuery
+from chameleon.step import core
+from chameleon.step.mapping import simple
+from chameleon.step.steps import mapping as mapping_steps
+
+__all__ = ("list_rows_steps",)
+
+type ListQueryProtocol = abc.Callable[
+    [core.StepContext], AbstractQuery[typing.Any, typing.Any]
+]
+
+
+def list_rows_steps(
+    *,
+    type_id: str,
+    action_id: str = "get",
+    query: ListQueryProtocol,
+) -> core.StepsDefinitionDict:
+    """Create business and output mapping steps of a paginated list of rows.
+
+    Only requested `StepContext.output_fields` are queried and mapped.
+
+    Basic usage:
+
+    >>> processor_list = chameleon_json_steps(
+    ...     type_id="ticket",
+    ...     **list_rows_steps(type_id="ticket", query=ticket_list_query),
+    ... )
+
+    Args:
+        type_id: Object type ID of the registered simple output mapping.
+        action_id: Action ID of the registered simple output mapping.
+        query: Function to get the query of listed objects.
+    """
+    registered = simple.registered_row_mapping(type_id, action_id)
+
+    def selected_row_mapping(context: core.StepContext) -> simple.RowMapping:
+        _, row_mapping = registered()
+        if context.output_fields is None:
+            return row_mapping
+        return row_mapping.select(context.output_fields)
+
+    def list_rows_sync(context: core.StepContext):
+        fields = selected_row_mapping(context).fields
+        rows = query(context).values_rows(fields)
+        context.output_business = pagination.paginate_sync(context, rows)
+
+    @core.with_sync_variant(list_rows_sync)
+    async def list_rows(context: core.StepContext):
+        fields = selected_row_mapping(context).fields
+        rows = query(context).values_rows(fields)
+        context.output_business = await pagination.paginate(context, rows)
+
+    def map_rows(context: core.StepContext):
+        context.output_raw = mapping_steps.map_list(
+            selected_row_mapping(context).mapping, context.output_business
+        )
+
+    return {
+        "business": list_rows,
+        "map_output": map_rows,
+    }
@@ -0,0 +1,170 @@
+"""Coalescing of identical concurrent GET requests (single-flight).
+
+The first request (leader) is processed as usual and publishes its serialized
+response body, requests with the same key arriving meanwhile (followers) wait
+for it instead of repeating database queries, mapping and serialization.
+Every request passes its own access checks, requests are joined right before
+the business step.
+"""
+
+import asyncio
+import dataclasses
+import typing
+from collections import abc
+
+from chameleon.step import core
+
+__all__ = ("SingleFlight", "single_flight_steps")
+
+type SingleFlightKey = abc.Hashable
+
+DEFAULT_KEY_HEADERS = ("authorization", "cookie")
+LEADER_INFO_KEY = "single_flight_leader"
+
+
+class LeaderFailed(Exception):
+    """The leader request finished without a response to share."""
+
+
+class SingleFlightResult(typing.NamedTuple):
+    response_body: bytes
+    error_status: int
+    response_headers: dict[str, str] | None
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class SingleFlight:
+    """In-flight GET requests by key, one instance per processor.
+
+    Args:
+        headers: Request headers the response depends on, e.g. authorization
+            for responses filtered by a user.
+        key: Custom key function to replace the default one built from URL
+            parameters, query parameters and headers.
+    """
+
+    headers: abc.Sequence[str] = DEFAULT_KEY_HEADERS
+    key: abc.Callable[[core.StepContext], SingleFlightKey] | None = None
+    in_flight: dict[SingleFlightKey, asyncio.Future[SingleFlightResult]] = (
+        dataclasses.field(default_factory=dict)
+    )
+
+    def request_key(self, context: core.StepContext) -> SingleFlightKey:
+        if self.key is not None:
+            return self.key(context)
+
+        request_info = context.request_info
+        headers = request_info.headers or {}
+        return (
+            frozenset(context.custom_info.items()) if context.custom_info else None,
+            frozenset(request_info.query.items()) if request_info.query else None,
+            tuple(headers.get(name) for name in self.headers),
+        )
+
+    async def join(self, context: core.StepContext):
+        """Wait for the leader's result, or become the leader."""
+        if context.request_info.method != "GET":
+            return
+
+        key = self.request_key(context)
+        future = self.in_flight.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            context.custom_info[LEADER_INFO_KEY] = key
+            task = asyncio.current_task()
+            if task is not None:
+                # followers proceed on their own if the leader fails
+                task.add_done_callback(lambda _: self.abandon(key, future))
+            return
+
+        try:
+            result = await asyncio.shield(future)
+        except LeaderFailed:
+            return
+
+        context.response_body = result.response_body
+        context.error_status = result.error_status
+        if result.response_headers:
+            context.response_headers = {
+                **result.response_headers,
+                **(context.response_headers or {}),
+            }
+        raise core.StopProcessing()
+
+    def publish(self, context: core.StepContext):
+        """Share the leader's serialized response with followers."""
+        key = context.custom_info.pop(LEADER_INFO_KEY, None)
+        if key is None:
+            return
+
+        future = self.in_flight[key]
+        if (
+            isinstance(context.exception, core.DeadlineExceeded)
+            or context.response_body is None
+        ):
+            # followers may have more time left, don't share the timeout;
+            # a stream can't be shared, it's consumed by the leader's response
+            self.abandon(key, future)
+            return
+
+        del self.in_flight[key]
+        response_headers = context.response_headers
+        future.set_result(
+            SingleFlightResult(
+                response_body=context.response_body,
+                error_status=context.error_status,
+                response_headers=dict(response_headers) if response_headers else None,
+            )
+        )
+
+    def abandon(self, key: SingleFlightKey, future: asyncio.Future[SingleFlightResult]):
+        if future.done():
+            return
+
+        if self.in_flight.get(key) is future:
+            del self.in_flight[key]
+        future.set_exception(LeaderFailed())
+        future.exception()  # followers may be absent, mark it retrieved
+
+
+def noop_sync(context: core.StepContext):
+    pass
+
+
+def single_flight_steps(
+    *,
+    headers: abc.Sequence[str] = DEFAULT_KEY_HEADERS,
+    key: abc.Callable[[core.StepContext], SingleFlightKey] | None = None,
+) -> core.StepsDefinitionDict:
+    """Create steps coalescing identical concurrent GET requests.
+
+    Requests are joined before `business` and the result is published after
+    `serialize`, followers skip the rest of process steps and `serialize`.
+    Requests are coalesced within one event loop only, the sync pipeline
+    doesn't coalesce them.
+
+    Basic usage:
+
+    >>> processor_get = chameleon_json_steps(
+    ...     business=project_get_fun,
+    ...     **single_flight_steps(),
+    ... )
+
+    Args:
+        headers: Request headers the response depends on, e.g. authorization
+            for responses filtered by a user.
+        key: Custom key function to replace the default one built from URL
+            parameters, query parameters and headers.
+    """
+    single_flight = SingleFlight(headers=headers, key=key)
+
+    @core.with_sync_variant(noop_sync)
+    async def single_flight_join(context: core.StepContext):
+        await single_flight.join(context)
+
+    return {
+        "business_pre": single_flight_join,
+        "serialize_post": single_flight.publish,
+    }
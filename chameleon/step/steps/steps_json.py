@@ -1,6 +1,8 @@
+import functools
 import json
 
 from chameleon.step import core
+from chameleon.step.steps import streaming
 
 # File named steps_json.py because of blackd integration in my editor.
 # Files named json.py or types.py are not welcome there.
@@ -8,7 +10,7 @@ from chameleon.step import core
 HTTP_METHODS_WITH_INPUT = {"POST", "PUT"}
 
 
-async def check_content_type_json(context: core.StepContext):
+def check_content_type_json(context: core.StepContext):
     request_method: str = context.request_info.method
 
     if request_method in HTTP_METHODS_WITH_INPUT:
@@ -17,7 +19,7 @@ async def check_content_type_json(context: core.StepContext):
 
 
 def default_deserialize_json(loads=json.loads):
-    async def deserialize_json(context: core.StepContext):
+    def deserialize_json(context: core.StepContext):
         request_method = context.request_info.method
 
         if request_method in HTTP_METHODS_WITH_INPUT:
@@ -26,19 +28,32 @@ def default_deserialize_json(loads=json.loads):
     return deserialize_json
 
 
-def default_serialize_json(dumps=json.dumps):
-    async def serialize_json(context: core.StepContext):
-        if context.output_raw is None:
-            response_body = b""
+def dumps_bytes(value, *, dumps=json.dumps) -> bytes:
+    result = dumps(value)
+    if isinstance(result, bytes):
+        return result
+    if isinstance(result, str):
+        return result.encode("utf-8")
+    raise ValueError("Dump function must return bytes or str")
+
+
+def default_serialize_json(
+    dumps=json.dumps, *, chunk_size: int = streaming.DEFAULT_CHUNK_SIZE
+):
+    def serialize_json(context: core.StepContext):
+        if context.response_body is not None:
+            return  # already serialized, e.g. reused from another request
+
+        output_raw = context.output_raw
+        if output_raw is None:
+            context.response_body = b""
+        elif streaming.is_lazy_rows(output_raw):
+            context.response_stream = streaming.JsonArrayStream(
+                output_raw,
+                dumps=functools.partial(dumps_bytes, dumps=dumps),
+                chunk_size=chunk_size,
+            )
         else:
-            value = dumps(context.output_raw)
-            if isinstance(value, bytes):
-                response_body = value
-            elif isinstance(value, str):
-                response_body = value.encode("utf-8")
-            else:
-                raise ValueError("Dump function must return bytes or str")
-
-        context.response_body = response_body
+            context.response_body = dumps_bytes(output_raw, dumps=dumps)
 
     return serialize_json
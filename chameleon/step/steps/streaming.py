@@ -0,0 +1,107 @@
+"""Streaming of large list outputs row by row.
+
+A business step could output a lazy iterable of rows, e.g. a query, instead
+of a list. The list mapper then maps rows lazily, and the JSON serializer
+produces `StepContext.response_stream` with chunks of the array, so memory
+use depends on the chunk size, not the number of rows. Streams are iterable
+both synchronously and asynchronously, the framework picks one.
+"""
+
+import typing
+from collections import abc
+
+__all__ = ("JsonArrayStream", "MappedRows", "is_lazy_rows")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+type Rows = abc.AsyncIterable[typing.Any] | abc.Iterable[typing.Any]
+
+
+def is_lazy_rows(value: typing.Any) -> bool:
+    """Check if the value is an iterable of rows to stream, not a JSON value."""
+    return isinstance(value, (MappedRows, abc.AsyncIterable)) or (
+        isinstance(value, abc.Iterable)
+        and not isinstance(value, (abc.Sequence, abc.Mapping, abc.Set))
+    )
+
+
+class MappedRows:
+    """Rows mapped on iteration."""
+
+    __slots__ = ("rows", "mapping_function")
+
+    rows: Rows
+    mapping_function: abc.Callable[[typing.Any], typing.Any]
+
+    def __init__(
+        self, rows: Rows, mapping_function: abc.Callable[[typing.Any], typing.Any]
+    ):
+        self.rows = rows
+        self.mapping_function = mapping_function
+
+    def __iter__(self) -> abc.Iterator[typing.Any]:
+        return map(self.mapping_function, typing.cast(abc.Iterable, self.rows))
+
+    async def __aiter__(self) -> abc.AsyncIterator[typing.Any]:
+        mapping_function = self.mapping_function
+        if not isinstance(self.rows, abc.AsyncIterable):
+            for row in self.rows:
+                yield mapping_function(row)
+            return
+
+        async for row in self.rows:
+            yield mapping_function(row)
+
+
+class JsonArrayStream:
+    """JSON array serialized row by row in chunks of about `chunk_size` bytes."""
+
+    __slots__ = ("rows", "dumps", "chunk_size")
+
+    rows: Rows
+    dumps: abc.Callable[[typing.Any], bytes]
+    chunk_size: int
+
+    def __init__(
+        self,
+        rows: Rows,
+        *,
+        dumps: abc.Callable[[typing.Any], bytes],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.rows = rows
+        self.dumps = dumps
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> abc.Iterator[bytes]:
+        buffer = bytearray(b"[")
+        for row in typing.cast(abc.Iterable, self.rows):
+            if self.append(buffer, row):
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]"
+        yield bytes(buffer)
+
+    async def __aiter__(self) -> abc.AsyncIterator[bytes]:
+        if not isinstance(self.rows, abc.AsyncIterable):
+            for chunk in self:
+                yield chunk
+            return
+
+        buffer = bytearray(b"[")
+        async for row in self.rows:
+            if self.append(buffer, row):
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]"
+        yield bytes(buffer)
+
+    def append(self, buffer: bytearray, row: typing.Any) -> bool:
+        """Append the row to the buffer, True if the chunk is complete."""
+        # the buffer is empty only after a chunk, so it isn't the first row
+        if not buffer or len(buffer) > 1:
+            buffer += b","
+        buffer += self.dumps(row)
+        return len(buffer) >= self.chunk_size
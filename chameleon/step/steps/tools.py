@@ -0,0 +1,39 @@
+from collections import abc
+
+from chameleon.step import core
+
+__all__ = ("merge_steps",)
+
+
+def merge_steps(*definitions: core.StepsDefinitionDict) -> core.StepsDefinitionDict:
+    """Merge steps definitions, handlers of the same step are called in order.
+
+    Basic usage:
+
+    >>> merge_steps(conditional_steps(), single_flight_steps())
+
+    Mapping definitions, e.g. exception handlers by step name, aren't merged.
+    """
+    result: dict[str, core.StepHandlerMulti | None] = {}
+
+    for definition in definitions:
+        for name, step in definition.items():
+            defined = result.get(name)
+            if defined is None or step is None:
+                result[name] = step if defined is None else defined
+                continue
+
+            if isinstance(defined, abc.Mapping) or isinstance(step, abc.Mapping):
+                raise ValueError(f"Mapping step `{name}` can't be merged")
+
+            result[name] = [*as_list(defined), *as_list(step)]
+
+    return result  # type: ignore[return-value]
+
+
+def as_list(
+    step: core.StepHandler | abc.Sequence[core.StepHandler | None],
+) -> list[core.StepHandler | None]:
+    if isinstance(step, core.StepHandlerProtocol):
+        return [step]
+    return list(step)
@@ -9,13 +9,16 @@ __all__ = ("default_validation_steps", "ValidationError")
 def noop_validator(value: typing.Any): ...
 
 
-class ValidationError(ValueError): ...
+class ValidationError(ValueError):
+    """Invalid input, the validator result is the first argument."""
 
+    @property
+    def errors(self) -> typing.Any:
+        return self.args[0] if self.args else None
 
-def generic_validation_step(
-    *, type_id, action_id=None, **_kwargs
-) -> core.StepHandlerProtocol:
-    async def validation_step(context: core.StepContext):
+
+def generic_validation_step(*, type_id, action_id=None, **_kwargs) -> core.StepHandler:
+    def validation_step(context: core.StepContext):
         value = context.input_raw
         validator_function: core.ProcessorProtocol
         validator_function = validation.registry.get(type_id, action_id, noop_validator)
@@ -0,0 +1,159 @@
+"""Bundling of schemas into a single file with references inlined.
+
+Schemas referencing each other are resolved through the schema registry on
+every validation. A bundle has every acyclic `$ref` replaced by the schema
+it references, so validators built from it don't resolve references except
+the root one. `$ref` with sibling keywords is inlined as an `allOf` item,
+they're equivalent in draft 2020-12. Cyclic references are kept, made
+absolute to be resolvable from any schema they're inlined into.
+
+A bundle is loaded by `load_schemas` as a `bundle:` prefixed source.
+"""
+
+import pathlib
+import typing
+from collections import abc
+from urllib import parse
+
+import orjson
+from referencing.jsonschema import SchemaRegistry
+
+from chameleon.step.validation import jsonschema
+
+__all__ = ("bundle_schemas", "write_bundle")
+
+# draft 2020-12 keywords by kind of their subschemas
+SCHEMA_KEYWORDS = frozenset(
+    (
+        "additionalProperties",
+        "contains",
+        "contentSchema",
+        "else",
+        "if",
+        "items",
+        "not",
+        "propertyNames",
+        "then",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    )
+)
+SCHEMA_LIST_KEYWORDS = frozenset(("allOf", "anyOf", "oneOf", "prefixItems"))
+SCHEMA_MAP_KEYWORDS = frozenset(
+    ("$defs", "dependentSchemas", "patternProperties", "properties")
+)
+# keywords of a referenced schema root, not needed once references are inlined
+RESOURCE_KEYWORDS = frozenset(
+    ("$id", "$schema", "$anchor", "$dynamicAnchor", "$defs", "$comment")
+)
+
+
+def join_uri(base_uri: str, ref: str) -> str:
+    """Resolve the reference like `referencing` does, `urn:` bases included."""
+    if ref.startswith("#"):
+        return f"{parse.urldefrag(base_uri).url}{ref}"
+    return parse.urljoin(base_uri, ref)
+
+
+class RefInliner:
+    """Inline references of schemas, each referenced schema is inlined once."""
+
+    schema_registry: SchemaRegistry
+    inlined: dict[str, typing.Any]
+    inlining: set[str]
+
+    def __init__(self, schema_registry: SchemaRegistry):
+        self.schema_registry = schema_registry
+        self.inlined = {}
+        self.inlining = set()
+
+    def schema(self, schema: typing.Any, base_uri: str) -> typing.Any:
+        if not isinstance(schema, abc.Mapping):
+            return schema
+
+        if isinstance(schema.get("$id"), str):
+            base_uri = join_uri(base_uri, schema["$id"])
+
+        result: dict[str, typing.Any] = {}
+        for keyword, value in schema.items():
+            if keyword in SCHEMA_KEYWORDS:
+                value = self.schema(value, base_uri)
+            elif keyword in SCHEMA_LIST_KEYWORDS:
+                value = [self.schema(s, base_uri) for s in value]
+            elif keyword in SCHEMA_MAP_KEYWORDS:
+                value = {k: self.schema(s, base_uri) for k, s in value.items()}
+            elif keyword == "$ref":
+                continue
+            result[keyword] = value
+
+        ref = schema.get("$ref")
+        if ref is None:
+            return result
+
+        uri = join_uri(base_uri, ref)
+        target = self.target(uri)
+        if target is None:
+            result["$ref"] = uri
+        elif not result:
+            return target
+        else:
+            result["allOf"] = [*result.get("allOf", ()), target]
+        return result
+
+    def target(self, uri: str) -> typing.Any | None:
+        """Inlined referenced schema, None if the reference is cyclic."""
+        if uri in self.inlined:
+            return self.inlined[uri]
+        if uri in self.inlining:
+            return None
+
+        self.inlining.add(uri)
+        contents = self.schema_registry.resolver().lookup(uri).contents
+        target = self.schema(contents, parse.urldefrag(uri).url)
+        if isinstance(target, abc.Mapping):
+            target = {k: v for k, v in target.items() if k not in RESOURCE_KEYWORDS}
+        self.inlining.discard(uri)
+
+        self.inlined[uri] = target
+        return target
+
+
+def bundle_schemas(
+    paths_or_modules: abc.Sequence[str | pathlib.Path] | str | pathlib.Path,
+    aliases: abc.Mapping[str, str] | None = None,
+) -> list[jsonschema.SchemaEntry]:
+    """Read and check schemas and inline their references.
+
+    Args:
+        paths_or_modules: Paths to read schema files from, `module:` prefixed
+            modules and `bundle:` prefixed schema bundles.
+        aliases: Schema id aliases to use.
+    """
+    entries = list(
+        jsonschema.parse_schemas(
+            jsonschema.read_schema_sources(paths_or_modules), aliases or {}
+        )
+    )
+    for bundle in jsonschema.split_sources(paths_or_modules)[2]:
+        entries.extend(jsonschema.read_bundle(bundle))
+
+    schema_registry = (
+        SchemaRegistry()
+        .with_resources(jsonschema.schema_resources(entries, set()))
+        .crawl()
+    )
+    inliner = RefInliner(schema_registry)
+    return [
+        (schema_ids, inliner.schema(schema_data, schema_ids[0]))
+        for schema_ids, schema_data in entries
+    ]
+
+
+def write_bundle(path: str | pathlib.Path, entries: list[jsonschema.SchemaEntry]):
+    jsonschema.write_atomic(
+        path,
+        orjson.dumps(
+            {"bundle": jsonschema.SCHEMA_BUNDLE_VERSION, "schemas": entries},
+            option=orjson.OPT_INDENT_2,
+        ),
+    )
@@ -0,0 +1,375 @@
+"""Compiler of JSON Schemas into specialized Python check functions.
+
+A compiled check answers only whether a value is valid. Keyword checks are
+inlined into generated functions, one per subschema, and `$ref`s are
+resolved once at compile time. Checks are used as a fast path, errors are
+reported by the regular `jsonschema` validator.
+
+Only a subset of draft 2020-12 is supported, schemas using other keywords
+aren't compiled at all, so a compiled check accepts exactly the values the
+`jsonschema` validator accepts.
+"""
+
+import re
+import typing
+from collections import abc
+
+import jsonschema
+from referencing.jsonschema import DRAFT202012
+from referencing.jsonschema import SchemaRegistry
+
+if typing.TYPE_CHECKING:
+    from referencing._core import Resolver
+
+__all__ = ("CheckFunction", "Uncompilable", "compile_schema")
+
+type CheckFunction = abc.Callable[[typing.Any], bool]
+
+ANNOTATION_KEYWORDS = frozenset(
+    (
+        "$schema",
+        "$id",
+        "$anchor",
+        "$defs",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "contentEncoding",
+        "contentMediaType",
+        "contentSchema",
+    )
+)
+COMPILED_KEYWORDS = frozenset(
+    (
+        "type",
+        "enum",
+        "const",
+        "format",
+        "minLength",
+        "maxLength",
+        "pattern",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "required",
+        "properties",
+        "additionalProperties",
+        "dependentRequired",
+        "dependentSchemas",
+        "minProperties",
+        "maxProperties",
+        "unevaluatedProperties",
+        "items",
+        "minItems",
+        "maxItems",
+        "$ref",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+    )
+)
+# same as the type checker of `jsonschema.Draft202012Validator`
+TYPE_EXPRESSIONS = {
+    "object": "isinstance(value, dict)",
+    "array": "isinstance(value, list)",
+    "string": "isinstance(value, str)",
+    "boolean": "isinstance(value, bool)",
+    "null": "value is None",
+    "number": "isinstance(value, (int, float)) and not isinstance(value, bool)",
+    "integer": (
+        "isinstance(value, int) and not isinstance(value, bool)"
+        " or isinstance(value, float) and value.is_integer()"
+    ),
+}
+STRING_TYPES = frozenset(("string",))
+NUMBER_TYPES = frozenset(("number", "integer"))
+OBJECT_TYPES = frozenset(("object",))
+ARRAY_TYPES = frozenset(("array",))
+# keywords of subschemas making evaluated properties depend on the value
+CONDITIONAL_APPLICATORS = ("anyOf", "oneOf", "dependentSchemas")
+
+
+class Uncompilable(Exception):
+    """Schema uses keywords the compiler doesn't support."""
+
+
+class SchemaCompiler:
+    """Generate source code of check functions of schemas and their references."""
+
+    format_checker: jsonschema.FormatChecker
+    namespace: dict[str, typing.Any]
+    functions: dict[int, str]
+    sources: list[str]
+    schemas: list[typing.Any]
+
+    def __init__(self, *, format_checker: jsonschema.FormatChecker):
+        self.format_checker = format_checker
+        self.namespace = {"format_checker": format_checker}
+        self.functions = {}
+        self.sources = []
+        self.schemas = []  # keeps ids of compiled schemas unique
+
+    def constant(self, value: typing.Any) -> str:
+        name = f"c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def function(self, schema: typing.Any, resolver: "Resolver") -> str:
+        """Name of the check function of the schema, compiled once."""
+        key = id(schema)
+        name = self.functions.get(key)
+        if name is not None:
+            return name
+
+        name = f"check_{len(self.functions)}"
+        self.functions[key] = name
+        self.schemas.append(schema)
+
+        if isinstance(schema, bool):
+            lines = [f"return {schema}"]
+        else:
+            lines = [*self.schema_lines(schema, resolver), "return True"]
+        body = "\n".join(f"    {line}" for line in lines)
+        self.sources.append(f"def {name}(value):\n{body}\n")
+        return name
+
+    def build(self, name: str) -> CheckFunction:
+        exec("\n".join(self.sources), self.namespace)  # noqa: S102
+        return self.namespace[name]
+
+    def schema_lines(
+        self, schema: abc.Mapping[str, typing.Any], resolver: "Resolver"
+    ) -> abc.Iterator[str]:
+        if not isinstance(schema, abc.Mapping):
+            raise Uncompilable(f"Not a schema: {schema!r}")
+
+        unknown = schema.keys() - COMPILED_KEYWORDS - ANNOTATION_KEYWORDS
+        if unknown:
+            raise Uncompilable(f"Unsupported keywords: {', '.join(sorted(unknown))}")
+
+        if "$id" in schema:
+            resolver = resolver.in_subresource(DRAFT202012.create_resource(schema))
+
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else types
+            if not set(types) <= TYPE_EXPRESSIONS.keys():
+                raise Uncompilable(f"Unknown types: {types!r}")
+            expression = " or ".join(f"({TYPE_EXPRESSIONS[t]})" for t in types)
+            yield f"if not ({expression}): return False"
+            types = frozenset(types)
+
+        yield from self.value_lines(schema)
+        yield from guarded_lines(
+            types, STRING_TYPES, "isinstance(value, str)", self.string_lines(schema)
+        )
+        yield from guarded_lines(
+            types, NUMBER_TYPES, TYPE_EXPRESSIONS["number"], self.number_lines(schema)
+        )
+        yield from guarded_lines(
+            types,
+            OBJECT_TYPES,
+            "isinstance(value, dict)",
+            self.object_lines(schema, resolver),
+        )
+        yield from guarded_lines(
+            types,
+            ARRAY_TYPES,
+            "isinstance(value, list)",
+            self.array_lines(schema, resolver),
+        )
+        yield from self.applicator_lines(schema, resolver)
+
+    def value_lines(self, schema: abc.Mapping[str, typing.Any]) -> abc.Iterator[str]:
+        # only strings are compared, `jsonschema` equality of others differs
+        if "enum" in schema:
+            values = schema["enum"]
+            if not all(isinstance(v, str) for v in values):
+                raise Uncompilable("Only string enums are supported")
+            name = self.constant(frozenset(values))
+            yield f"if not (isinstance(value, str) and value in {name}): return False"
+
+        if "const" in schema:
+            if not isinstance(schema["const"], str):
+                raise Uncompilable("Only string constants are supported")
+            name = self.constant(schema["const"])
+            yield f"if not (isinstance(value, str) and value == {name}): return False"
+
+        if "format" in schema:
+            name = self.constant(schema["format"])
+            yield f"if not format_checker.conforms(value, {name}): return False"
+
+    def string_lines(self, schema: abc.Mapping[str, typing.Any]) -> abc.Iterator[str]:
+        if "minLength" in schema:
+            yield f"if len(value) < {int(schema['minLength'])}: return False"
+        if "maxLength" in schema:
+            yield f"if len(value) > {int(schema['maxLength'])}: return False"
+        if "pattern" in schema:
+            name = self.constant(re.compile(schema["pattern"]))
+            yield f"if {name}.search(value) is None: return False"
+
+    def number_lines(self, schema: abc.Mapping[str, typing.Any]) -> abc.Iterator[str]:
+        for keyword, operator in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if keyword in schema:
+                name = self.constant(schema[keyword])
+                yield f"if value {operator} {name}: return False"
+
+    def object_lines(
+        self, schema: abc.Mapping[str, typing.Any], resolver: "Resolver"
+    ) -> abc.Iterator[str]:
+        if "minProperties" in schema:
+            yield f"if len(value) < {int(schema['minProperties'])}: return False"
+        if "maxProperties" in schema:
+            yield f"if len(value) > {int(schema['maxProperties'])}: return False"
+
+        if schema.get("required"):
+            name = self.constant(frozenset(schema["required"]))
+            yield f"if not value.keys() >= {name}: return False"
+
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            key_name = self.constant(key)
+            check = self.function(subschema, resolver)
+            yield f"if {key_name} in value and not {check}(value[{key_name}]):"
+            yield "    return False"
+
+        if "additionalProperties" in schema:
+            known = self.constant(frozenset(properties))
+            check = self.function(schema["additionalProperties"], resolver)
+            yield f"for key in value.keys() - {known}:"
+            yield f"    if not {check}(value[key]): return False"
+
+        for key, required in schema.get("dependentRequired", {}).items():
+            key_name = self.constant(key)
+            name = self.constant(frozenset(required))
+            yield f"if {key_name} in value and not value.keys() >= {name}:"
+            yield "    return False"
+
+        for key, subschema in schema.get("dependentSchemas", {}).items():
+            key_name = self.constant(key)
+            check = self.function(subschema, resolver)
+            yield f"if {key_name} in value and not {check}(value): return False"
+
+        if "unevaluatedProperties" in schema:
+            if schema["unevaluatedProperties"] is not False:
+                raise Uncompilable("Only `unevaluatedProperties: false` is supported")
+            if "additionalProperties" not in schema:
+                evaluated = self.constant(
+                    frozenset(evaluated_properties(schema, resolver))
+                )
+                yield f"if not value.keys() <= {evaluated}: return False"
+
+    def array_lines(
+        self, schema: abc.Mapping[str, typing.Any], resolver: "Resolver"
+    ) -> abc.Iterator[str]:
+        if "minItems" in schema:
+            yield f"if len(value) < {int(schema['minItems'])}: return False"
+        if "maxItems" in schema:
+            yield f"if len(value) > {int(schema['maxItems'])}: return False"
+        if "items" in schema:
+            check = self.function(schema["items"], resolver)
+            yield "for item in value:"
+            yield f"    if not {check}(item): return False"
+
+    def applicator_lines(
+        self, schema: abc.Mapping[str, typing.Any], resolver: "Resolver"
+    ) -> abc.Iterator[str]:
+        if "$ref" in schema:
+            resolved = resolver.lookup(schema["$ref"])
+            check = self.function(resolved.contents, resolved.resolver)
+            yield f"if not {check}(value): return False"
+
+        for subschema in schema.get("allOf", ()):
+            yield f"if not {self.function(subschema, resolver)}(value): return False"
+
+        if "anyOf" in schema:
+            checks = [self.function(s, resolver) for s in schema["anyOf"]]
+            expression = " or ".join(f"{check}(value)" for check in checks)
+            yield f"if not ({expression}): return False"
+
+        if "oneOf" in schema:
+            checks = [self.function(s, resolver) for s in schema["oneOf"]]
+            expression = ", ".join(f"{check}(value)" for check in checks)
+            yield f"if sum(({expression},)) != 1: return False"
+
+        if "not" in schema:
+            yield f"if {self.function(schema['not'], resolver)}(value): return False"
+
+
+def guarded_lines(
+    types: frozenset[str] | None,
+    keyword_types: frozenset[str],
+    guard: str,
+    lines: abc.Iterable[str],
+) -> abc.Iterator[str]:
+    """Apply keywords only to values of their types, unless `type` ensures it."""
+    lines = list(lines)
+    if not lines:
+        return
+
+    if types is not None and types <= keyword_types:
+        yield from lines
+        return
+
+    yield f"if {guard}:"
+    yield from (f"    {line}" for line in lines)
+
+
+def evaluated_properties(schema: typing.Any, resolver: "Resolver") -> set[str]:
+    """Properties evaluated by the schema for `unevaluatedProperties`.
+
+    Only properties evaluated by every valid value are supported, i.e.
+    properties of the schema, its references and `allOf` subschemas.
+    """
+    if isinstance(schema, bool):
+        return set()
+
+    if "patternProperties" in schema or "additionalProperties" in schema:
+        raise Uncompilable("Properties evaluated by patterns aren't supported")
+
+    if "$id" in schema:
+        resolver = resolver.in_subresource(DRAFT202012.create_resource(schema))
+
+    names = set(schema.get("properties", ()))
+    if "$ref" in schema:
+        resolved = resolver.lookup(schema["$ref"])
+        names |= evaluated_properties(resolved.contents, resolved.resolver)
+    for subschema in schema.get("allOf", ()):
+        names |= evaluated_properties(subschema, resolver)
+
+    for keyword in CONDITIONAL_APPLICATORS:
+        subschemas = schema.get(keyword, ())
+        if isinstance(subschemas, abc.Mapping):
+            subschemas = subschemas.values()
+        if any(evaluated_properties(s, resolver) for s in subschemas):
+            raise Uncompilable(f"Properties evaluated by {keyword} aren't supported")
+
+    return names
+
+
+def compile_schema(
+    ref: str,
+    *,
+    schema_registry: SchemaRegistry,
+    format_checker: jsonschema.FormatChecker,
+) -> CheckFunction:
+    """Compile a check function of the referenced schema.
+
+    Raises:
+        Uncompilable: Schema uses keywords the compiler doesn't support.
+    """
+    resolved = schema_registry.resolver().lookup(ref)
+    compiler = SchemaCompiler(format_checker=format_checker)
+    return compiler.build(compiler.function(resolved.contents, resolved.resolver))
@@ -1,18 +1,24 @@
+import enum
 import functools
+import hashlib
 import importlib.resources
+import itertools
 import logging
 import os.path
 import pathlib
+import tempfile
 import typing
 from collections import abc
 from importlib.resources import abc as importlib_abc
 
 import jsonschema
+import orjson
 import referencing
 import yaml
 from jsonschema.protocols import Validator
 from referencing.jsonschema import SchemaRegistry
 
+from chameleon.step.validation import compiler
 from chameleon.step.validation import registry
 
 # Default validator used in the app
@@ -20,11 +26,48 @@ type DefaultJsonMappingType = jsonschema.Draft202012Validator
 DefaultJsonMapping = jsonschema.Draft202012Validator
 # Schema registry is id to schema registry
 default_schema_registry: SchemaRegistry = SchemaRegistry()
-# Schema validators registered for type_id and action_id
+# Schema references and registries of validators, None is the default registry
+validator_refs: abc.MutableMapping[
+    tuple[str, str | None], tuple[str, SchemaRegistry | None]
+] = {}
+# Schema validators registered for type_id and action_id, created on first use
 validators: abc.MutableMapping[tuple[str, str | None], Validator] = {}
+# Compiled fast checks of validators, None if the schema isn't supported
+compiled_checks: abc.MutableMapping[
+    tuple[str, str | None], compiler.CheckFunction | None
+] = {}
+compiled_validation = False
+
+# Schema file base, filename and content
+type SchemaSource = tuple[str | pathlib.Path, str, bytes]
+# Schema ids and data of a checked schema
+type SchemaEntry = tuple[list[str], typing.Any]
 
 logger = logging.getLogger(__name__)
 JSON_EXTENSIONS = (".json", ".yml", ".yaml")
+# libyaml parser is an order of magnitude faster if PyYAML is built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SCHEMA_CACHE_VERSION = 1
+SCHEMA_BUNDLE_VERSION = 1
+DEFAULT_MAX_ERRORS = 10
+
+
+class ValidationMode(enum.Enum):
+    """How much of an invalid value is reported."""
+
+    # only that the value is invalid, no errors are computed
+    VALID = "valid"
+    # first `max_errors` errors
+    FIRST_ERRORS = "first_errors"
+    # all errors, invalid values cost the most
+    FULL = "full"
+
+
+class ErrorDetail(typing.TypedDict):
+    """Compact validation error: JSON pointer to the value and failed keyword."""
+
+    pointer: str
+    keyword: str | None
 
 
 def register_jsonschema_validation(
@@ -33,22 +76,28 @@ def register_jsonschema_validation(
     type_id: str,
     action_id: str | None = None,
     schema_registry: SchemaRegistry | None = None,
+    mode: ValidationMode = ValidationMode.FIRST_ERRORS,
+    max_errors: int = DEFAULT_MAX_ERRORS,
 ):
-    key = (type_id, action_id)
-
-    schema_registry_work: SchemaRegistry = guess_schema_registry(schema_registry)
+    """Register JSON Schema validation of the referenced schema.
 
-    create_validator(
-        ref=ref,
-        type_id=type_id,
-        action_id=action_id,
-        schema_registry=schema_registry_work,
-    )
+    Args:
+        ref: Schema reference, e.g. `schema_project.yml#/$defs/ChameleonProject`.
+        type_id: Type id to register validation for.
+        action_id: Action id to register validation for.
+        schema_registry: Registry to resolve the reference, default one if None.
+        mode: How much of an invalid value is reported.
+        max_errors: Number of errors reported in `FIRST_ERRORS` mode.
+    """
+    key = (type_id, action_id)
+    validator_refs[key] = (ref, schema_registry)
 
     registry.register(
         type_id=type_id,
         action_id=action_id,
-        processor=functools.partial(json_validation_processor, key=key),
+        processor=functools.partial(
+            json_validation_processor, key=key, mode=mode, max_errors=max_errors
+        ),
     )
 
 
@@ -60,27 +109,135 @@ def create_validator(
     schema_registry: SchemaRegistry | None = None,
 ):
     """Create JSON Schema Validator for given reference and cache it."""
-
-    schema_registry_work = guess_schema_registry(schema_registry)
     key = (type_id, action_id)
-    if key not in validators:
+    validator_refs.setdefault(key, (ref, schema_registry))
+    get_validator(key)
+
+
+def get_validator(key: tuple[str, str | None]) -> Validator:
+    """Validator of the registered reference, created on first use."""
+    validator = validators.get(key)
+    if validator is None:
+        ref, schema_registry = validator_refs[key]
         # noinspection PyTypeChecker
-        validators[key] = DefaultJsonMapping(
+        validator = validators[key] = DefaultJsonMapping(
             schema={"$ref": ref},
             format_checker=DefaultJsonMapping.FORMAT_CHECKER,
-            registry=schema_registry_work,
+            registry=guess_schema_registry(schema_registry),
         )
+    return validator
+
+
+def get_check(key: tuple[str, str | None]) -> compiler.CheckFunction | None:
+    """Compiled check of the validator, compiled on first use if enabled."""
+    try:
+        return compiled_checks[key]
+    except KeyError:
+        if not compiled_validation:
+            return None
+    return compile_check(key)
+
+
+def compile_check(
+    key: tuple[str, str | None], *, schema_registry: SchemaRegistry | None = None
+) -> compiler.CheckFunction | None:
+    """Compile the fast check of the validator, if its schema is supported."""
+    ref, validator_schema_registry = validator_refs[key]
+    if schema_registry is None:
+        schema_registry = validator_schema_registry
+    schema_registry_work = guess_schema_registry(schema_registry)
+    try:
+        check = compiler.compile_schema(
+            ref,
+            schema_registry=schema_registry_work,
+            format_checker=DefaultJsonMapping.FORMAT_CHECKER,
+        )
+    except compiler.Uncompilable as e:
+        logger.info("Schema of %r isn't compiled: %s", key, e)
+        check = None
+
+    compiled_checks[key] = check
+    return check
+
+
+def enable_compiled_validation():
+    """Validate by compiled checks first, `jsonschema` reports errors only.
+
+    Checks are compiled on first use or by `warmup_validators`.
+    """
+    global compiled_validation  # pylint: disable=global-statement
+
+    compiled_validation = True
+    compiled_checks.clear()
+
+
+def warmup_validators():
+    """Create all validators and compiled checks ahead of the first request.
+
+    An empty object is validated to prepare lazily created parts too,
+    e.g. resolved references.
+    """
+    for key in validator_refs:
+        validator = get_validator(key)
+        check = get_check(key)
+        if check is not None:
+            check({})
+        for _error in validator.iter_errors({}):
+            pass
+
+
+def json_validation_processor(
+    value: typing.Any,
+    *,
+    key: tuple[str, str | None],
+    mode: ValidationMode = ValidationMode.FULL,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> list[ErrorDetail] | None:
+    """Basic JSON Schema validation processor.
+
+    Returns:
+        Compact errors of an invalid value, None if the value is valid.
+    """
+    check = get_check(key)
+    if check is not None:
+        if check(value):
+            return None
+        if mode is ValidationMode.VALID:
+            return [invalid_value()]
 
+    validator = get_validator(key)
+    if mode is ValidationMode.VALID:
+        return None if validator.is_valid(value) else [invalid_value()]
 
-def json_validation_processor(value: typing.Any, *, key: tuple[str, str | None]):
-    """Basic JSON Schema validation processor."""
-    return list(validators[key].iter_errors(value)) or None
+    errors = validator.iter_errors(value)
+    if mode is ValidationMode.FIRST_ERRORS:
+        errors = itertools.islice(errors, max_errors)
+    return [error_detail(error) for error in errors] or None
+
+
+def invalid_value() -> ErrorDetail:
+    return {"pointer": "", "keyword": None}
+
+
+def error_detail(error: jsonschema.ValidationError) -> ErrorDetail:
+    return {
+        "pointer": json_pointer(error.absolute_path),
+        "keyword": error.validator,  # type: ignore[typeddict-item]
+    }
+
+
+def json_pointer(path: abc.Iterable[str | int]) -> str:
+    """RFC 6901 JSON pointer of the path."""
+    return "".join(
+        f"/{str(part).replace('~', '~0').replace('/', '~1')}" for part in path
+    )
 
 
 def load_schemas(
     paths_or_modules: abc.Sequence[str | pathlib.Path] | str | pathlib.Path,
     aliases: abc.Mapping[str, str] | None = None,
     schema_registry: SchemaRegistry | None = None,
+    cache_path: str | pathlib.Path | None = None,
 ):
     """Load schemas from given paths and apply aliases to them.
 
@@ -88,6 +245,8 @@ def load_schemas(
         paths_or_modules: Paths to read schema files from.
         aliases: Schema id aliases to use.
         schema_registry: Base registry to use to evolve.
+        cache_path: Schema cache file, parsed and checked schemas are stored
+            in it and reused until schema files or aliases change.
     """
     global default_schema_registry  # pylint: disable=global-statement
 
@@ -96,7 +255,9 @@ def load_schemas(
     known_schema_ids = set(schema_registry_work)  # it's iterable
 
     schema_registry_work = schema_registry_work.with_resources(
-        obtain_schema_data(paths_or_modules, aliases or {}, known_schema_ids)
+        obtain_schema_data(
+            paths_or_modules, aliases or {}, known_schema_ids, cache_path
+        )
     ).crawl()
 
     update_validators(schema_registry=schema_registry_work)
@@ -111,13 +272,15 @@ def load_schemas(
 def update_validators(*, schema_registry: SchemaRegistry | None = None):
     """Update validators using new registry.
 
+    Validators and compiled checks are created again on first use.
+
     Args:
         schema_registry: Registry to use for new validators.
     """
-
-    schema_registry_work = guess_schema_registry(schema_registry)
-    for key, validator in list(validators.items()):
-        validators[key] = validator.evolve(registry=schema_registry_work)
+    for key, (ref, _schema_registry) in list(validator_refs.items()):
+        validator_refs[key] = (ref, schema_registry)
+    validators.clear()
+    compiled_checks.clear()
 
 
 def guess_schema_registry(schema_registry: SchemaRegistry | None) -> SchemaRegistry:
@@ -132,26 +295,49 @@ def obtain_schema_data(
     paths_or_modules: abc.Sequence[str | pathlib.Path] | str | pathlib.Path,
     aliases: abc.Mapping[str, str],
     known_schema_ids: abc.MutableSet[str],
+    cache_path: str | pathlib.Path | None = None,
 ) -> abc.Iterator[tuple[str, referencing.Resource]]:
     """Read and filter out schema files and return.
 
     Args:
-        paths_or_modules: Paths to read schema files from.
+        paths_or_modules: Paths to read schema files from, `module:` prefixed
+            modules and `bundle:` prefixed schema bundles.
         aliases: Schema id aliases to use.
         known_schema_ids: Already known schema ids.
+        cache_path: Schema cache file to skip parsing and checks of unchanged
+            schema files, no cache if None.
     """
+    paths, modules, bundles = split_sources(paths_or_modules)
+    sources = itertools.chain(read_files(paths), read_modules(modules))
+    if cache_path is None:
+        entries = parse_schemas(sources, aliases)
+    else:
+        entries = cached_schemas(cache_path, list(sources), aliases)
 
-    for base, filename, schema_data in read_schema_data(paths_or_modules):
-        yield from process_schema(
-            base, filename, schema_data, aliases, known_schema_ids
-        )
+    yield from schema_resources(entries, known_schema_ids)
+    for bundle in bundles:
+        yield from schema_resources(read_bundle(bundle), known_schema_ids)
+
+
+def schema_resources(
+    entries: abc.Iterable[SchemaEntry], known_schema_ids: abc.MutableSet[str]
+) -> abc.Iterator[tuple[str, referencing.Resource]]:
+    for schema_ids, schema_data in entries:
+        schema_resource = referencing.Resource.from_contents(schema_data)
+        for schema_id in schema_ids:
+            if schema_id in known_schema_ids:
+                raise ValueError(f"Schema with id {schema_id!r} is already defined")
+            known_schema_ids.add(schema_id)
+            yield schema_id, schema_resource
 
 
-def read_schema_data(
+def split_sources(
     paths_or_modules: abc.Sequence[str | pathlib.Path] | str | pathlib.Path,
-) -> abc.Iterator[tuple[str | pathlib.Path, str, typing.Any]]:
-    paths: abc.MutableSequence[str | pathlib.Path] = []
-    modules: abc.MutableSequence[str] = []
+) -> tuple[list[str | pathlib.Path], list[str], list[str]]:
+    """Split sources to paths, modules and schema bundles."""
+    paths: list[str | pathlib.Path] = []
+    modules: list[str] = []
+    bundles: list[str] = []
 
     if isinstance(paths_or_modules, (str, pathlib.Path)):
         paths_or_modules = [paths_or_modules]
@@ -160,40 +346,105 @@ def read_schema_data(
         if isinstance(item, str) and item.startswith("module:"):
             module = item[len("module:") :].strip()
             modules.append(module)
+        elif isinstance(item, str) and item.startswith("bundle:"):
+            bundles.append(item[len("bundle:") :].strip())
         else:
             paths.append(item)
 
+    return paths, modules, bundles
+
+
+def read_schema_sources(
+    paths_or_modules: abc.Sequence[str | pathlib.Path] | str | pathlib.Path,
+) -> abc.Iterator[SchemaSource]:
+    """Read schema files of paths and modules, bundles aren't read."""
+    paths, modules, _bundles = split_sources(paths_or_modules)
     yield from read_files(paths)
     yield from read_modules(modules)
 
 
-def process_schema(
-    base: str | pathlib.Path | None,
-    filename: str | None,
-    schema_data: typing.Any,
+def read_bundle(path: str | pathlib.Path) -> list[SchemaEntry]:
+    """Read schemas of a bundle made by `bundle_schemas` command.
+
+    Schemas of a bundle are checked on bundling and aren't checked again.
+    """
+    with open(path, "rb") as f:
+        bundle = orjson.loads(f.read())
+
+    if not isinstance(bundle, dict) or bundle.get("bundle") != SCHEMA_BUNDLE_VERSION:
+        raise ValueError(f"{path!r} isn't a schema bundle")
+    return bundle["schemas"]
+
+
+def parse_schemas(
+    sources: abc.Iterable[SchemaSource],
     aliases: abc.Mapping[str, str],
-    known_schema_ids: abc.MutableSet[str],
-) -> abc.Iterator[tuple[str, referencing.Resource]]:
-    """Check schema data and return mapping id to a resource.
+) -> abc.Iterator[SchemaEntry]:
+    """Parse schema files, check schemas and return their ids and data.
 
     Args:
-        base: Base for filename to determine schema id.
-        filename: Schema filename.
-        schema_data: Schema data.
-        aliases: schema id aliases.
-        known_schema_ids: already known schema ids
+        sources: Schema files with their bases to determine schema ids.
+        aliases: Schema id aliases.
     """
-    if not check_schema(filename, schema_data):
-        return
+    for base, filename, source in sources:
+        schema_data = yaml.load(source, Loader=YamlLoader)
+        if not check_schema(filename, schema_data):
+            continue
 
-    schema_resource = referencing.Resource.from_contents(schema_data)
-    for schema_id in filter(
-        None, obtain_schema_ids(schema_data, base, filename, aliases)
-    ):
-        if schema_id in known_schema_ids:
-            raise ValueError(f"Schema with id {schema_id!r} is already defined")
-        known_schema_ids.add(schema_id)
-        yield schema_id, schema_resource
+        schema_ids = obtain_schema_ids(schema_data, base, filename, aliases)
+        yield list(filter(None, schema_ids)), schema_data
+
+
+def cached_schemas(
+    cache_path: str | pathlib.Path,
+    sources: abc.Sequence[SchemaSource],
+    aliases: abc.Mapping[str, str],
+) -> list[SchemaEntry]:
+    """Parsed and checked schemas from the cache, rebuilt if sources changed.
+
+    Args:
+        cache_path: Schema cache file.
+        sources: Schema files with their bases to determine schema ids.
+        aliases: Schema id aliases.
+    """
+    cache_key = schema_cache_key(sources, aliases)
+    try:
+        with open(cache_path, "rb") as f:
+            cache = orjson.loads(f.read())
+        if cache["key"] == cache_key:
+            return cache["schemas"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    entries = list(parse_schemas(sources, aliases))
+    try:
+        write_atomic(cache_path, orjson.dumps({"key": cache_key, "schemas": entries}))
+    except (OSError, orjson.JSONEncodeError) as e:
+        logger.warning("Schema cache %s isn't written: %s", cache_path, e)
+    return entries
+
+
+def schema_cache_key(
+    sources: abc.Sequence[SchemaSource], aliases: abc.Mapping[str, str]
+) -> str:
+    digest = hashlib.sha256(f"{SCHEMA_CACHE_VERSION}".encode())
+    digest.update(orjson.dumps(aliases, option=orjson.OPT_SORT_KEYS))
+    for base, filename, source in sources:
+        digest.update(orjson.dumps((str(base), filename, len(source))))
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def write_atomic(path: str | pathlib.Path, data: bytes):
+    """Write the file whole, concurrently starting workers never read a part."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+        f.write(data)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
 
 
 def check_schema(filename: str | None, raw_data: typing.Any) -> bool:
@@ -214,11 +465,7 @@ def check_schema(filename: str | None, raw_data: typing.Any) -> bool:
     ):
         return False
 
-    if (
-        filename is None
-        and "$id" not in raw_data
-        or not isinstance(raw_data["$id"], str)
-    ):
+    if filename is None and not isinstance(raw_data.get("$id"), str):
         logger.warning(
             "Given schema doesn't contain $id key. "
             "It's impossible to identify such schemas. Skipping"
@@ -273,7 +520,7 @@ def obtain_schema_ids(
 
 def read_files(
     paths: abc.Sequence[str | pathlib.Path],
-) -> abc.Iterator[tuple[str | pathlib.Path, str, typing.Any]]:
+) -> abc.Iterator[SchemaSource]:
     """Read json and yaml files from given paths.
 
     Args:
@@ -281,21 +528,19 @@ def read_files(
     """
     for base, filename in list_files_on_filesystem(paths):
         with open(filename, "rb") as f:
-            schema_data = yaml.safe_load(f.read())
-        yield base, filename, schema_data
+            yield base, filename, f.read()
 
 
 def read_modules(
     modules: abc.Sequence[str],
-) -> abc.Iterator[tuple[str, str, typing.Any]]:
+) -> abc.Iterator[SchemaSource]:
     """Read json and yaml files from given modules.
 
     Args:
         modules: Paths to read json and yaml files from
     """
     for base, filename, traversable in files_in_modules(modules):
-        schema_data = yaml.safe_load(traversable.read_bytes())
-        yield base, filename, schema_data
+        yield base, filename, traversable.read_bytes()
 
 
 def is_json_or_yaml(filename: str):
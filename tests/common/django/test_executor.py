@@ -0,0 +1,35 @@
+import threading
+
+import pytest
+
+from chameleon.common.django import executor
+from chameleon.step import core
+from chameleon.step.core import deadline
+from chameleon.step.core import sync
+
+
+def create_response(context: core.StepContext):
+    context.response = context.output_business
+
+
+def business_fun_sync(context: core.StepContext):
+    context.output_business = threading.get_ident()
+
+
+business_fun = executor.sync_business_step(business_fun_sync)
+
+
+@pytest.mark.asyncio
+async def test_sync_business_step():
+    assert core.core.is_async_step(business_fun)
+    assert business_fun.__name__ == "business_fun"
+    # the thread can't be interrupted, writes aren't cancelled by deadlines
+    for handler in (business_fun, sync.sync_step(business_fun)):
+        assert getattr(handler, deadline.UNCANCELLABLE_ATTRIBUTE)
+
+    steps = {"business": business_fun, "create_response": create_response}
+    handler = core.CompiledUrlHandler(steps=steps, error_status_to_http={})
+    assert await handler(None) != threading.get_ident()
+
+    sync_handler = core.SyncUrlHandler(steps=steps, error_status_to_http={})
+    assert sync_handler(None) == threading.get_ident()
@@ -0,0 +1,132 @@
+import datetime
+import operator
+import os
+import types
+import typing
+
+import pytest
+from django.db import connections
+from django.db import models
+from django.db import transaction
+from django.test.utils import isolate_apps
+
+from chameleon.common import pagination
+from chameleon.common.django.query import DjangoMergedQuery
+from chameleon.common.django.query import DjangoModelQuery
+from chameleon.common.django.query import update_returning_sql
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+# "postgresql" database is configured by `conftest.py`
+POSTGRESQL_DATABASE = os.environ.get("CHAMELEON_TEST_POSTGRESQL")
+
+postgresql = pytest.mark.skipif(
+    not POSTGRESQL_DATABASE, reason="CHAMELEON_TEST_POSTGRESQL isn't set"
+)
+
+
+def at(seconds: int) -> datetime.datetime:
+    return START + datetime.timedelta(seconds=seconds)
+
+
+def create_query(source_count: int) -> DjangoMergedQuery:
+    source = types.SimpleNamespace(page_key=operator.itemgetter(0, 1))
+    return DjangoMergedQuery([source] * source_count)  # type: ignore[list-item]
+
+
+def test_merged_page():
+    query = create_query(2)
+    sources = [
+        [(at(0), 1), (at(1), 2), (at(1), 3)],
+        [(at(1), 1), (at(2), 2)],
+    ]
+
+    page = query.create_page(sources, pagination.PageRequest(limit=3))
+    # same times are ordered by source, then by pk
+    assert page.items == [(at(0), 1), (at(1), 2), (at(1), 3)]
+    assert page.next_key == (at(1), 0, 3)
+
+    page = query.create_page(sources, pagination.PageRequest(limit=5))
+    assert page.items == [
+        (at(0), 1),
+        (at(1), 2),
+        (at(1), 3),
+        (at(1), 1),
+        (at(2), 2),
+    ]
+    assert page.next_key is None
+
+
+@pytest.fixture
+def item_model() -> typing.Iterator[type[models.Model]]:
+    with isolate_apps():
+
+        class Item(models.Model):
+            class Meta:
+                app_label = "query_test"
+
+            # attribute and column names differ
+            title = models.CharField(max_length=10, db_column="item_title")
+            state = models.CharField(
+                max_length=10, choices=(("OPEN", "Open"), ("DONE", "Done"))
+            )
+            due = models.DateTimeField()
+
+        yield Item
+
+
+def test_update_returning_sql(item_model):
+    connection = connections["default"]
+    due = at(5)
+
+    sql, params = update_returning_sql(
+        item_model.objects.filter(pk=5), {"title": "x", "due": due}, connection
+    )
+
+    table = '"query_test_item"'
+    assert sql == (
+        f'UPDATE {table} SET "item_title" = %s, "due" = %s FROM ('
+        f'SELECT {table}."id" AS "previous_pk",'
+        f' {table}."item_title" AS "previous_0", {table}."due" AS "previous_1"'
+        f' FROM {table} WHERE {table}."id" = %s) AS previous'
+        f' WHERE {table}."id" = previous."previous_pk"'
+        f' RETURNING previous."previous_0", previous."previous_1",'
+        f' {table}."id", {table}."item_title", {table}."state", {table}."due"'
+    )
+    # values are prepared for the database like `QuerySet.update()` does
+    due_field = item_model._meta.get_field("due")
+    assert params == ("x", due_field.get_db_prep_save(due, connection), 5)
+
+
+@postgresql
+def test_update_returning_postgresql(item_model):
+    connection = connections["postgresql"]
+    with connection.schema_editor() as editor:
+        editor.create_model(item_model)
+    try:
+        item = item_model.objects.using("postgresql").create(
+            title="a", state="OPEN", due=at(0)
+        )
+        query = DjangoModelQuery(
+            item_model.objects.using("postgresql").filter(pk=item.pk)
+        )
+
+        with transaction.atomic(using="postgresql"):
+            previous, updated = query.update_returning_sync(
+                {"title": "b", "state": "DONE", "due": at(5)}
+            )
+
+        assert previous == {"title": "a", "state": "OPEN", "due": at(0)}
+        assert (updated.pk, updated.title, updated.state, updated.due) == (
+            item.pk,
+            "b",
+            "DONE",
+            at(5),
+        )
+        with pytest.raises(item_model.DoesNotExist):
+            DjangoModelQuery(
+                item_model.objects.using("postgresql").filter(pk=-1)
+            ).update_returning_sync({"title": "c"})
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(item_model)
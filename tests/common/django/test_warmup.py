@@ -0,0 +1,16 @@
+from chameleon.common.django import warmup
+
+
+def test_warmup_requests():
+    routes = {
+        "api": {
+            "project": {"": "list", "{project_id}/history": "history"},
+            "ticket/{ticket_id}": "ticket",
+        }
+    }
+
+    assert [tuple(request) for request in warmup.warmup_requests(routes)] == [
+        ("/api/project", "list", {}),
+        ("/api/project/0/history", "history", {"project_id": "0"}),
+        ("/api/ticket/0", "ticket", {"ticket_id": "0"}),
+    ]
@@ -0,0 +1,136 @@
+import datetime
+
+import pytest
+
+from chameleon.common import pagination
+from chameleon.common.query import AbstractQuery
+from chameleon.step import core
+
+KEY = (datetime.datetime(2024, 5, 1, 12, 30, 15, 500, tzinfo=datetime.UTC), 42)
+
+
+class ListQuery(AbstractQuery[list[int], int]):
+    """Objects `n` with key `(creation_time + n seconds, n)`."""
+
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+    def key(self, value: int) -> pagination.PageKey:
+        return self.start + datetime.timedelta(seconds=value), value
+
+    def page_sync(self, page_request: pagination.PageRequest) -> pagination.Page[int]:
+        after = page_request.after
+        items = [
+            value for value in self.query if after is None or self.key(value) > after
+        ][: page_request.limit + 1]
+        if len(items) <= page_request.limit:
+            return pagination.Page(items, None)
+        return pagination.Page(
+            items[: page_request.limit], self.key(items[page_request.limit - 1])
+        )
+
+    async def page(self, page_request: pagination.PageRequest) -> pagination.Page[int]:
+        return self.page_sync(page_request)
+
+
+def create_context(query: dict[str, str]) -> core.StepContext:
+    return core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None, query=query),
+        error_status_to_http={},
+    )
+
+
+def test_cursor():
+    cursor = pagination.encode_cursor(KEY)
+    assert "=" not in cursor
+    assert pagination.decode_cursor(cursor) == KEY
+
+
+def test_merged_cursor():
+    key = (*KEY, 7)
+    assert pagination.decode_cursor(pagination.encode_cursor(key)) == key
+    assert pagination.check_key(key, 3) == key
+
+    with pytest.raises(pagination.InvalidPageRequest, match="another list"):
+        pagination.check_key(key, 2)
+
+
+@pytest.mark.parametrize("cursor", ("x", "eyJ", "bnVsbA", "WzEsMiwzXQ", "WyJ4IiwxXQ"))
+def test_invalid_cursor(cursor: str):
+    with pytest.raises(pagination.InvalidPageRequest):
+        pagination.decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    "query,page_request",
+    (
+        ({}, pagination.PageRequest()),
+        ({"limit": "10"}, pagination.PageRequest(limit=10)),
+        (
+            {"cursor": pagination.encode_cursor(KEY)},
+            pagination.PageRequest(after=KEY),
+        ),
+    ),
+)
+def test_page_request(query: dict[str, str], page_request: pagination.PageRequest):
+    assert pagination.PageRequest.from_query(query) == page_request
+
+
+@pytest.mark.parametrize("limit", ("0", "-1", "1001", "ten"))
+def test_invalid_limit(limit: str):
+    with pytest.raises(pagination.InvalidPageRequest):
+        pagination.PageRequest.from_query({"limit": limit})
+
+
+@pytest.mark.parametrize(
+    "query,time_range",
+    (
+        ({}, pagination.TimeRange()),
+        (
+            {"since": "2024-05-01T12:30:15.000500Z"},
+            pagination.TimeRange(since=KEY[0]),
+        ),
+        (
+            {"until": "2024-05-01T14:30:15.000500+02:00"},
+            pagination.TimeRange(until=KEY[0]),
+        ),
+        (
+            {"since": "2024-05-01", "until": ""},
+            pagination.TimeRange(
+                since=datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+            ),
+        ),
+    ),
+)
+def test_time_range(query: dict[str, str], time_range: pagination.TimeRange):
+    assert pagination.TimeRange.from_query(query) == time_range
+
+
+@pytest.mark.parametrize("parameter", ("since", "until"))
+def test_invalid_time_range(parameter: str):
+    with pytest.raises(pagination.InvalidPageRequest, match="Invalid timestamp"):
+        pagination.TimeRange.from_query({parameter: "yesterday"})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
+async def test_paginate(is_async: bool):
+    query = ListQuery(list(range(5)))
+    pages = []
+    request_query = {"limit": "2", "fields": "id"}
+
+    while True:
+        context = create_context(request_query)
+        if is_async:
+            pages.append(await pagination.paginate(context, query))
+        else:
+            pages.append(pagination.paginate_sync(context, query))
+
+        if context.response_headers is None:
+            break
+        link = context.response_headers["Link"]
+        assert link.startswith("<?limit=2&fields=id&cursor=")
+        assert link.endswith('>; rel="next"')
+        cursor = link.removeprefix("<?limit=2&fields=id&cursor=").split(">")[0]
+        request_query = {**request_query, "cursor": cursor}
+
+    assert pages == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,25 @@
+import os
+
+import django
+from django.conf import settings
+
+# name of a PostgreSQL database to run queries against, libpq environment
+# variables (PGHOST, PGUSER, ...) are used to connect
+POSTGRESQL_DATABASE = os.environ.get("CHAMELEON_TEST_POSTGRESQL")
+
+
+def pytest_configure():
+    """Minimal Django settings, tests don't load the application ones."""
+    if settings.configured:
+        return
+
+    databases = {
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    }
+    if POSTGRESQL_DATABASE:
+        databases["postgresql"] = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": POSTGRESQL_DATABASE,
+        }
+    settings.configure(USE_TZ=True, DATABASES=databases)
+    django.setup()
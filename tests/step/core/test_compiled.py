@@ -0,0 +1,144 @@
+import itertools
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import compiled
+from chameleon.step.core import multi
+
+
+class TestException(Exception):
+    __test__ = False
+
+
+def recording_step(
+    name: str, calls: list[str], *, result=None, fail=False, is_async=True
+):
+    def step(context: core.StepContext):
+        calls.append(f"{name}@{context.current_step}")
+        if fail:
+            raise TestException(name)
+        return result
+
+    if not is_async:
+        return step
+
+    async def step_async(context: core.StepContext):
+        return step(context)
+
+    return step_async
+
+
+def definition_variants(name: str, step: str, calls: list[str]):
+    """Possible definitions of a step: none, single, list and mapping."""
+    yield None
+    yield recording_step(name, calls)
+    yield [
+        recording_step(f"{name}1", calls),
+        recording_step(f"{name}2", calls, is_async=False),
+    ]
+    yield []
+    yield {step: recording_step(name, calls, result=True, is_async=False)}
+    yield {step: recording_step(name, calls, result=False)}
+    yield {"business": recording_step(name, calls)}
+
+
+async def run_handler(handler_type, definition: multi.StepsDefinitionDict):
+    if handler_type is compiled.CompiledUrlHandler:
+        handler = compiled.CompiledUrlHandler(steps=definition, error_status_to_http={})
+    else:
+        handler = core.UrlHandler(
+            steps=multi.multi_processor_steps(**definition),
+            error_status_to_http={},
+        )
+    return await handler(request=object())
+
+
+def variants_count():
+    return len(tuple(definition_variants("", "", [])))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "base,default", itertools.product(range(variants_count()), repeat=2)
+)
+@pytest.mark.parametrize("pre,post", ((0, 0), (1, 2), (4, 6), (3, 5)))
+async def test_compiled_same_order(base: int, default: int, pre: int, post: int):
+    """Compiled steps must be called exactly as nested multi-steps are called."""
+    results = []
+    for handler_type in (core.UrlHandler, compiled.CompiledUrlHandler):
+        calls: list[str] = []
+
+        def variant(name, index, calls=calls):
+            return tuple(definition_variants(name, "map_output", calls))[index]
+
+        definition: multi.StepsDefinitionDict = {
+            "map_output": variant("base", base),
+            "map_output_default": variant("default", default),
+            "map_output_pre": variant("pre", pre),
+            "map_output_post": variant("post", post),
+            "business": recording_step("business", calls),
+        }
+        await run_handler(handler_type, definition)
+        results.append(calls)
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("handled_by_step", (True, False))
+@pytest.mark.parametrize("faulty_step", ("business", "map_output"))
+async def test_compiled_exception_handler(handled_by_step: bool, faulty_step: str):
+    results = []
+    for handler_type in (core.UrlHandler, compiled.CompiledUrlHandler):
+        calls: list[str] = []
+        definition: multi.StepsDefinitionDict = {
+            "business": recording_step(
+                "business", calls, fail=faulty_step == "business"
+            ),
+            "map_output": recording_step(
+                "map_output", calls, fail=faulty_step == "map_output"
+            ),
+            "exception_handler_pre": recording_step("pre", calls),
+            "exception_handler_default": {
+                "business": recording_step("business", calls, result=handled_by_step),
+            },
+            "exception_handler": [recording_step("generic", calls, result=True)],
+            "serialize": recording_step("serialize", calls),
+        }
+        await run_handler(handler_type, definition)
+        results.append(calls)
+
+    assert results[0] == results[1]
+
+
+def test_compiled_flat_steps():
+    """Pre, base and post steps are stored as separate handlers."""
+    pre = recording_step("pre", [])
+    base = recording_step("base", [])
+    post = recording_step("post", [])
+    default = recording_step("default", [])
+
+    handler = compiled.CompiledUrlHandler(
+        steps={
+            "business_pre": [pre],
+            "business": {"business": base},
+            "business_post": post,
+            "serialize_default": default,
+        },
+        error_status_to_http={},
+    )
+
+    assert handler.process_steps == (
+        ("business", pre, True),
+        ("business", base, True),
+        ("business", post, True),
+    )
+    assert handler.response_steps == (("serialize", default, True),)
+
+
+def test_compiled_invalid_step():
+    steps: typing.Any = {"unknown_step": recording_step("x", [])}
+    with pytest.raises(KeyError):
+        compiled.CompiledUrlHandler(steps=steps, error_status_to_http={})
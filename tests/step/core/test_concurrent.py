@@ -0,0 +1,141 @@
+import asyncio
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import concurrent
+
+
+class TestException(Exception):
+    __test__ = False
+
+
+def create_response(context: core.StepContext):
+    context.response = context.error_status
+
+
+def concurrent_check(name: str, calls: list[str], *, fail: bool = False):
+    @core.concurrent_step
+    async def check(context: core.StepContext):
+        calls.append(f"{name} started")
+        await asyncio.sleep(0)
+        if fail:
+            raise TestException(name)
+        await asyncio.sleep(0.01)
+        calls.append(f"{name} finished")
+
+    return check
+
+
+def exception_handler(calls: list[str]):
+    def handler(context: core.StepContext) -> bool:
+        calls.append(f"exception@{context.current_step}")
+        context.error_status = 1
+        return True
+
+    return handler
+
+
+@pytest.mark.parametrize("handler_class", (core.CompiledUrlHandler, core.UrlHandler))
+def test_grouping(handler_class: typing.Any):
+    calls: list[str] = []
+    steps: typing.Any = {
+        "check_authenticated": concurrent_check("auth", calls),
+        "check_headers": lambda context: None,
+        "check_access_pre_read": concurrent_check("access", calls),
+        "business": concurrent_check("business", calls),
+    }
+    if handler_class is core.UrlHandler:
+        steps = core.UrlHandlerSteps(**steps)
+
+    handler = handler_class(steps=steps, error_status_to_http={})
+    assert [name for name, _, _ in handler.process_steps] == [
+        "check_authenticated",
+        "check_headers",
+        "check_access_pre_read",
+        "business",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent():
+    calls: list[str] = []
+    handler = core.CompiledUrlHandler(
+        steps={
+            "check_authenticated": concurrent_check("auth", calls),
+            "check_access_pre_read_pre": concurrent_check("access_pre", calls),
+            "check_access_pre_read": concurrent_check("access", calls),
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+    )
+
+    (entry,) = handler.process_steps
+    assert entry[0] == "check_authenticated+check_access_pre_read"
+    assert isinstance(entry[1], concurrent.ConcurrentSteps)
+
+    assert await handler(None) == 0
+    assert calls[:3] == ["auth started", "access_pre started", "access started"]
+    assert sorted(calls[3:]) == [
+        "access finished",
+        "access_pre finished",
+        "auth finished",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_siblings():
+    calls: list[str] = []
+    handler = core.CompiledUrlHandler(
+        steps={
+            "check_authenticated": concurrent_check("auth", calls),
+            "check_headers": concurrent_check("headers", calls, fail=True),
+            "check_access_pre_read": concurrent_check("access", calls),
+            "business": concurrent_check("business", calls),
+            "exception_handler": exception_handler(calls),
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+    )
+
+    assert await handler(None) == 1
+    assert calls == [
+        "auth started",
+        "headers started",
+        "access started",
+        "exception@check_headers",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failure_unhandled():
+    calls: list[str] = []
+    handler = core.CompiledUrlHandler(
+        steps={
+            "check_authenticated": concurrent_check("auth", calls, fail=True),
+            "check_access_pre_read": concurrent_check("access", calls, fail=True),
+        },
+        error_status_to_http={},
+    )
+
+    with pytest.raises(TestException, match="auth"):
+        await handler(None)
+
+
+def test_sync_pipeline_ignores_marker():
+    calls: list[str] = []
+
+    def check_sync(context: core.StepContext):
+        calls.append(context.current_step)
+
+    @core.concurrent_step
+    @core.with_sync_variant(check_sync)
+    async def check(context: core.StepContext): ...
+
+    handler = core.SyncUrlHandler(
+        steps={"check_authenticated": check, "check_access_pre_read": check},
+        error_status_to_http={},
+    )
+    handler(None)
+    assert calls == ["check_authenticated", "check_access_pre_read"]
@@ -36,22 +36,26 @@ response_step_order = (
 
 
 @pytest.mark.asyncio
-async def test_processing_order():
+@pytest.mark.parametrize("is_async", (True, False))
+async def test_processing_order(is_async: bool):
     step_order: list[str] = []
-    await generate_and_run_steps(step_order_collect=step_order)
+    await generate_and_run_steps(step_order_collect=step_order, is_async=is_async)
     assert tuple(step_order) == processing_step_order + response_step_order
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
 @pytest.mark.parametrize("faulty_step", processing_step_order)
-async def test_faulty_processing_step(faulty_step: str):
+async def test_faulty_processing_step(faulty_step: str, is_async: bool):
     step_order: list[str] = []
     expected_steps = (
         tuple(itertools.takewhile(lambda x: x != faulty_step, processing_step_order))
         + (faulty_step, f"exception: {faulty_step}")
         + response_step_order
     )
-    await generate_and_run_steps(step_order_collect=step_order, faulty_step=faulty_step)
+    await generate_and_run_steps(
+        step_order_collect=step_order, faulty_step=faulty_step, is_async=is_async
+    )
     assert tuple(step_order) == expected_steps
 
 
@@ -123,10 +127,11 @@ def step_handler_generator(
     faulty: bool,
     exception: bool,
     exception_handled: bool = True,
+    is_async: bool = True,
 ):
     assert expected_step is not None
 
-    async def step_handler(context: core.StepContext):
+    def step_handler(context: core.StepContext):
         assert context is not None
         assert context.current_step == expected_step
         assert context.custom_info == expected_custom_info
@@ -148,7 +153,13 @@ def step_handler_generator(
         if faulty:
             raise TestException(expected_step)
 
-    return step_handler
+    if not is_async:
+        return step_handler
+
+    async def step_handler_async(context: core.StepContext):
+        return step_handler(context)
+
+    return step_handler_async
 
 
 async def generate_and_run_steps(
@@ -156,6 +167,7 @@ async def generate_and_run_steps(
     faulty_step: str = "__unknown__",
     step_order_collect: list[str],
     exception_handled: bool = True,
+    is_async: bool = True,
 ):
     steps = {}
     request = object()
@@ -186,6 +198,7 @@ async def generate_and_run_steps(
             faulty=faulty,
             exception=exception,
             exception_handled=exception_handled,
+            is_async=is_async,
         )
 
     handler_steps = core.UrlHandlerSteps(**steps)
@@ -198,3 +211,58 @@ async def generate_and_run_steps(
 
 def random_int():
     return int.from_bytes(secrets.token_bytes(4))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "handler_class", (core.CompiledUrlHandler, core.SyncUrlHandler)
+)
+async def test_stop_processing(handler_class: typing.Any):
+    step_order: list[str] = []
+
+    def step(context: core.StepContext):
+        step_order.append(context.current_step)
+        if context.current_step == "validate_input":
+            raise core.StopProcessing()
+
+    steps: typing.Any = {
+        step_name: step for step_name in processing_step_order + response_step_order
+    }
+    handler = handler_class(
+        steps={**steps, "exception_handler": step}, error_status_to_http={}
+    )
+    result = handler(None)
+    if handler_class is core.CompiledUrlHandler:
+        await result
+
+    assert tuple(step_order) == (
+        tuple(
+            itertools.takewhile(lambda x: x != "validate_input", processing_step_order)
+        )
+        + ("validate_input",)
+        + response_step_order
+    )
+
+
+class AsyncCallable:
+    async def __call__(self, context: core.StepContext): ...
+
+
+class SyncCallable:
+    def __call__(self, context: core.StepContext): ...
+
+
+async def async_function(context: core.StepContext): ...
+
+
+@pytest.mark.parametrize(
+    "handler,is_async",
+    (
+        (async_function, True),
+        (lambda context: None, False),
+        (AsyncCallable(), True),
+        (SyncCallable(), False),
+    ),
+)
+def test_is_async_step(handler: typing.Any, is_async: bool):
+    assert core.core.is_async_step(handler) is is_async
@@ -0,0 +1,254 @@
+import asyncio
+import time
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import deadline
+
+
+def create_response(context: core.StepContext):
+    context.response = (context.error_status, context.output_raw)
+
+
+def exception_handler(context: core.StepContext) -> bool:
+    if not isinstance(context.exception, core.DeadlineExceeded):
+        return False
+    context.error_status = 20
+    context.output_raw = (context.current_step, context.exception.step)
+    return True
+
+
+async def slow(context: core.StepContext):
+    await asyncio.sleep(1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", (True, False))
+async def test_cancelled_during_step(compiled: bool):
+    calls: list[str] = []
+
+    def map_output(context: core.StepContext):
+        calls.append("map_output")  # pragma: no cover
+
+    dispatcher = core.method_dispatcher(
+        invalid_method=None,  # type: ignore[arg-type]
+        compiled=compiled,
+        timeout=0.01,
+        get={
+            "business": slow,
+            "map_output": map_output,
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+    )
+
+    request = typing.NamedTuple("Request", [("method", str)])("GET")
+    started = time.monotonic()
+    assert await dispatcher(request) == (20, ("business", "business"))
+    assert time.monotonic() - started < 0.5
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_checked_between_steps():
+    def busy(context: core.StepContext):
+        time.sleep(0.02)
+
+    handler = core.CompiledUrlHandler(
+        steps={
+            "validate_input": busy,
+            "business": lambda context: None,
+            "exception_handler": {"business": exception_handler},
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=0.01,
+    )
+    assert await handler(None) == (20, ("business", "business"))
+
+
+@pytest.mark.asyncio
+async def test_not_exceeded():
+    handler = core.CompiledUrlHandler(
+        steps={
+            "business": lambda context: setattr(context, "output_raw", "done"),
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=10,
+    )
+    assert await handler(None) == (0, "done")
+
+
+@pytest.mark.asyncio
+async def test_timeout_error_from_step():
+    async def business(context: core.StepContext):
+        raise TimeoutError("external")
+
+    handler = core.CompiledUrlHandler(
+        steps={"business": business}, error_status_to_http={}, timeout=10
+    )
+    with pytest.raises(TimeoutError, match="external") as exc_info:
+        await handler(None)
+    assert not isinstance(exc_info.value, core.DeadlineExceeded)
+
+
+@pytest.mark.asyncio
+async def test_limited_by_step():
+    def fill_request_info(context: core.StepContext):
+        deadline.limit_deadline(context, 0.01)
+
+    handler = core.CompiledUrlHandler(
+        steps={
+            "fill_request_info": fill_request_info,
+            "business": slow,
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+    )
+    assert await handler(None) == (20, ("business", "business"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_step_timed_out():
+    @core.concurrent_step
+    async def fast(context: core.StepContext): ...
+
+    handler = core.CompiledUrlHandler(
+        steps={
+            "check_authenticated": fast,
+            "check_access_pre_read": core.concurrent_step(slow),
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=0.01,
+    )
+    assert await handler(None) == (
+        20,
+        ("check_access_pre_read", "check_access_pre_read"),
+    )
+
+
+def test_sync_pipeline():
+    def busy(context: core.StepContext):
+        time.sleep(0.02)
+
+    handler = core.SyncUrlHandler(
+        steps={
+            "validate_input": busy,
+            "business": lambda context: None,
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=0.01,
+    )
+    assert handler(None) == (20, ("business", "business"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", (True, False))
+async def test_write_finishes_after_deadline(compiled: bool):
+    calls: list[str] = []
+
+    @core.uncancellable_step
+    async def write(context: core.StepContext):
+        await asyncio.sleep(0.05)
+        calls.append("write")
+
+    def map_output(context: core.StepContext):
+        calls.append("map_output")
+        context.output_raw = "written"
+
+    dispatcher = core.method_dispatcher(
+        invalid_method=None,  # type: ignore[arg-type]
+        compiled=compiled,
+        timeout=0.01,
+        post={
+            "business": write,
+            "map_output": map_output,
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+    )
+
+    request = typing.NamedTuple("Request", [("method", str)])("POST")
+    assert await dispatcher(request) == (0, "written")
+    assert calls == ["write", "map_output"]
+
+
+@pytest.mark.asyncio
+async def test_write_not_started_after_deadline():
+    @core.uncancellable_step
+    def write(context: core.StepContext):
+        raise AssertionError("started after the deadline")  # pragma: no cover
+
+    def busy(context: core.StepContext):
+        time.sleep(0.02)
+
+    handler = core.CompiledUrlHandler(
+        steps={
+            "validate_input": busy,
+            "business": write,
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=0.01,
+    )
+    assert await handler(None) == (20, ("business", "business"))
+
+
+def test_sync_write_finishes_after_deadline():
+    @core.uncancellable_step
+    def write(context: core.StepContext):
+        time.sleep(0.02)
+
+    handler = core.SyncUrlHandler(
+        steps={
+            "business": write,
+            "map_output": lambda context: setattr(context, "output_raw", "written"),
+            "exception_handler": exception_handler,
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+        timeout=0.01,
+    )
+    assert handler(None) == (0, "written")
+
+
+def test_limit_deadline():
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+    )
+    deadline.limit_deadline(context, 10)
+    assert context.deadline is not None
+    limited = context.deadline
+
+    deadline.limit_deadline(context, 100)
+    assert context.deadline == limited
+
+    deadline.limit_deadline(context, 1)
+    assert context.deadline < limited
+
+
+@pytest.mark.parametrize(
+    "value,timeout",
+    (
+        (None, None),
+        ("1.5", 1.5),
+        (b"2", 2.0),
+        ("0", 0.0),
+        ("-1", None),
+        ("inf", None),
+        ("nan", None),
+        ("soon", None),
+    ),
+)
+def test_parse_timeout(value: str | bytes | None, timeout: float | None):
+    assert deadline.parse_timeout(value) == timeout
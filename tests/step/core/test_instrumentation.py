@@ -0,0 +1,169 @@
+import logging
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import core as step_core
+from chameleon.step.core import instrumentation
+from chameleon.step.core import tools
+
+
+class TestException(Exception):
+    __test__ = False
+
+
+class CollectingSink:
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, *, route: str, step: str, wall_time: float, cpu_time: float):
+        assert wall_time >= 0
+        assert cpu_time >= 0
+        self.calls.append((route, step))
+
+
+def step(context: core.StepContext):
+    pass
+
+
+async def step_async(context: core.StepContext):
+    pass
+
+
+def step_faulty(context: core.StepContext):
+    raise TestException()
+
+
+def exception_handler(context: core.StepContext) -> bool:
+    return isinstance(context.exception, TestException)
+
+
+def make_handler(steps: typing.Any, sink: CollectingSink, compiled: bool):
+    return tools.create_url_handler(
+        steps=steps,
+        error_status_to_http={},
+        compiled=compiled,
+        route="test",
+        instrumentation=sink,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", (True, False))
+async def test_step_timings(compiled: bool):
+    sink = CollectingSink()
+    steps: typing.Any = {
+        "fill_request_info": step,
+        "business_pre": step_async,
+        "business": step,
+        "business_post": step,
+        "serialize": step_async,
+        "create_response": step,
+    }
+    await make_handler(steps, sink, compiled)(None)
+
+    assert sink.calls == [
+        ("test", "fill_request_info"),
+        ("test", "business"),
+        ("test", "serialize"),
+        ("test", "create_response"),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compiled", (True, False))
+async def test_step_timings_exception(compiled: bool):
+    sink = CollectingSink()
+    steps: typing.Any = {
+        "fill_request_info": step,
+        "business": step_faulty,
+        "map_output": step,
+        "exception_handler": exception_handler,
+        "create_response": step,
+    }
+    await make_handler(steps, sink, compiled)(None)
+
+    assert sink.calls == [
+        ("test", "fill_request_info"),
+        ("test", "business"),
+        ("test", "exception_handler"),
+        ("test", "create_response"),
+    ]
+
+
+def test_sync_step_timings():
+    """The sync pipeline reports the same timings as the async one."""
+    sink = CollectingSink()
+    steps: typing.Any = {
+        "fill_request_info": step,
+        "business_pre": step,
+        "business": step_faulty,
+        "map_output": step,
+        "exception_handler": exception_handler,
+        "create_response": step,
+    }
+    core.SyncUrlHandler(
+        steps=steps, error_status_to_http={}, route="test", instrumentation=sink
+    )(None)
+
+    assert sink.calls == [
+        ("test", "fill_request_info"),
+        ("test", "business"),
+        ("test", "exception_handler"),
+        ("test", "create_response"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_step_timings_disabled():
+    handler = tools.create_url_handler(
+        steps={"business": step}, error_status_to_http={}, compiled=True
+    )
+    assert handler.call_steps is step_core.call_steps
+    await handler(None)
+
+
+def test_histogram():
+    histogram = instrumentation.StepTimingHistogram(buckets=(0.001, 0.01, 0.1))
+    for wall_time in (0.0005, 0.005, 0.005, 0.05, 1.0):
+        histogram(route="r", step="business", wall_time=wall_time, cpu_time=0.0005)
+    histogram(route="r", step="serialize", wall_time=0.0005, cpu_time=0.0005)
+
+    snapshot = histogram.snapshot()
+    assert set(snapshot) == {("r", "business"), ("r", "serialize")}
+
+    stats = snapshot[("r", "business")]
+    assert stats.count == 5
+    assert stats.wall_time_counts == [1, 2, 1, 1]
+    assert stats.cpu_time_counts == [5, 0, 0, 0]
+    assert stats.wall_time_total == pytest.approx(1.0605)
+    assert stats.quantile(0.2) == 0.001
+    assert stats.quantile(0.5) == 0.01
+    assert stats.quantile(0.8) == 0.1
+    assert stats.quantile(1.0) == float("inf")
+    assert stats.quantile(1.0, cpu=True) == 0.001
+
+    histogram(route="r", step="business", wall_time=0.0005, cpu_time=0.0005)
+    assert stats.count == 5, "Snapshot must not change"
+
+    histogram.reset()
+    assert not histogram.snapshot()
+
+
+def test_histogram_invalid():
+    with pytest.raises(ValueError):
+        instrumentation.StepTimingHistogram(buckets=(0.1, 0.01))
+
+    with pytest.raises(ValueError):
+        instrumentation.StepTimingStats(buckets=(0.1,)).quantile(2)
+
+
+def test_logger(caplog: pytest.LogCaptureFixture):
+    sink = instrumentation.StepTimingLogger(level=logging.INFO)
+    with caplog.at_level(logging.INFO, logger=instrumentation.logger.name):
+        sink(route="test", step="business", wall_time=0.5, cpu_time=0.25)
+
+    assert caplog.messages == [
+        "route='test' step=business wall_time=0.500000 cpu_time=0.250000"
+    ]
@@ -539,3 +539,33 @@ def create_step(params: StepParams) -> mock.AsyncMock | None:
     return mock.AsyncMock(
         spec=core.StepHandlerProtocol, return_value=params.return_value
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
+async def test_list_step_sync(is_async: bool):
+    """List of sync steps is a sync step, otherwise async."""
+    calls = []
+
+    def sync_step(context: ctx.StepContext):
+        calls.append("sync")
+        return False
+
+    async def async_step(context: ctx.StepContext):
+        calls.append("async")
+        return True
+
+    if is_async:
+        step = multi.list_step([sync_step, async_step])
+    else:
+        step = multi.list_step([sync_step, sync_step])
+
+    assert step is not None
+    assert core.is_async_step(step) is is_async
+
+    if is_async:
+        assert await step(test_context) is True
+        assert calls == ["sync", "async"]
+    else:
+        assert step(test_context) is False
+        assert calls == ["sync", "sync"]
@@ -0,0 +1,51 @@
+import pytest
+
+from chameleon.step.core import registry as reg
+
+
+def test_factory_created_on_first_use():
+    registry = reg.ProcessorRegistry("test")
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return str.upper
+
+    registry.register_factory(type_id="a", action_id="get", factory=factory)
+    assert calls == []
+
+    assert registry.get("a", "get") is str.upper
+    assert registry["a:get"] is str.upper
+    assert calls == [1]
+
+
+def test_warmup():
+    registry = reg.ProcessorRegistry("test")
+    registry.register_factory(type_id="a", factory=lambda: str.upper)
+    registry.register(type_id="b", processor=str.lower)
+
+    registry.warmup()
+    assert registry.get("a") is str.upper
+    assert registry.get("b") is str.lower
+
+
+def test_missing():
+    registry = reg.ProcessorRegistry("test")
+    assert registry.get("a", default=str.lower) is str.lower
+    with pytest.raises(KeyError):
+        registry["a"]  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("factory_first", (False, True))
+def test_already_registered(factory_first: bool):
+    registry = reg.ProcessorRegistry("test")
+    register = (
+        lambda: registry.register_factory(type_id="a", factory=lambda: str.upper),
+        lambda: registry.register(type_id="a", processor=str.lower),
+    )
+    if factory_first:
+        register = register[::-1]
+
+    register[0]()
+    with pytest.raises(ValueError, match="already contains 'a'"):
+        register[1]()
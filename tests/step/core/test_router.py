@@ -0,0 +1,131 @@
+import dataclasses
+import inspect
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import router
+
+routes = {
+    "api": {
+        "project": {
+            "": "project-list",
+            "{project_id}": "project",
+            "{project_id}/history": "project-history",
+            "{project_id}/ticket": "project-ticket",
+        },
+        "ticket": {
+            "{ticket_id}": "ticket",
+            "{ticket_id}/comment": "ticket-comment",
+        },
+        "comment/{comment_id}": "comment",
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "path,handler,kwargs,route",
+    (
+        ("api/project", "project-list", {}, "api/project"),
+        ("/api/project", "project-list", {}, "api/project"),
+        ("api/project/1", "project", {"project_id": "1"}, "api/project/{project_id}"),
+        (
+            "api/project/a_B-9/history",
+            "project-history",
+            {"project_id": "a_B-9"},
+            "api/project/{project_id}/history",
+        ),
+        (
+            "api/ticket/42/comment",
+            "ticket-comment",
+            {"ticket_id": "42"},
+            "api/ticket/{ticket_id}/comment",
+        ),
+        ("api/comment/7", "comment", {"comment_id": "7"}, "api/comment/{comment_id}"),
+    ),
+)
+def test_resolve(path: str, handler: str, kwargs: dict[str, str], route: str):
+    trie = router.RouteTrie(routes)
+    assert trie.resolve(path) == router.RouteMatch(handler, kwargs, route)
+
+
+@pytest.mark.parametrize(
+    "path",
+    (
+        "",
+        "api",
+        "api/project/",
+        "api/project/1/",
+        "api/project//history",
+        "api/project/1.2",
+        "api/project/%31",
+        "api/project/1/unknown",
+        "api/ticket",
+        "api/comment/1/history",
+        "apiproject",
+    ),
+)
+def test_resolve_not_found(path: str):
+    assert router.RouteTrie(routes).resolve(path) is None
+
+
+def test_resolve_static_precedence():
+    trie = router.RouteTrie({"project/{project_id}": "project", "project/new": "new"})
+    assert trie.resolve("project/new") == ("new", {}, "project/new")
+    assert trie.resolve("project/old") == (
+        "project",
+        {"project_id": "old"},
+        "project/{project_id}",
+    )
+
+
+def test_add_invalid():
+    trie = router.RouteTrie(routes)
+
+    with pytest.raises(ValueError):
+        trie.add("api/project/{project_id}", "duplicate")
+
+    with pytest.raises(ValueError):
+        trie.add("api/project/{id}/duplicate", "conflicting parameter")
+
+    with pytest.raises(ValueError):
+        trie.add("api/empty", None)
+
+
+def test_routes():
+    trie = router.RouteTrie(routes)
+    assert dict(trie.routes()) == {
+        "api/project": "project-list",
+        "api/project/{project_id}": "project",
+        "api/project/{project_id}/history": "project-history",
+        "api/project/{project_id}/ticket": "project-ticket",
+        "api/ticket/{ticket_id}": "ticket",
+        "api/ticket/{ticket_id}/comment": "ticket-comment",
+        "api/comment/{comment_id}": "comment",
+    }
+
+
+@dataclasses.dataclass
+class Request:
+    method: str
+
+
+@pytest.mark.asyncio
+async def test_method_dispatcher():
+    def business(context: core.StepContext):
+        context.response = context.request_info.request.method
+
+    async def invalid_method(request):
+        return f"invalid {request.method}"
+
+    dispatcher = core.method_dispatcher(
+        invalid_method=invalid_method,
+        get={"business": business},
+        POST={"business": business},
+    )
+
+    assert inspect.iscoroutinefunction(dispatcher)
+    assert set(dispatcher.steps) == {"GET", "POST"}
+    assert await dispatcher(Request("GET")) == "GET"
+    assert await dispatcher(Request("POST")) == "POST"
+    assert await dispatcher(Request("DELETE")) == "invalid DELETE"
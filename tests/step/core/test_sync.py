@@ -0,0 +1,110 @@
+import dataclasses
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.core import sync
+
+
+class TestException(Exception):
+    __test__ = False
+
+
+@dataclasses.dataclass
+class Request:
+    method: str
+
+
+def recording_step(name: str, calls: list[str], *, fail: bool = False):
+    def step(context: core.StepContext):
+        calls.append(f"{name}@{context.current_step}")
+        if fail:
+            raise TestException(name)
+
+    return step
+
+
+def business_sync(context: core.StepContext):
+    context.output_raw = "sync"
+
+
+@core.with_sync_variant(business_sync)
+async def business(context: core.StepContext):
+    context.output_raw = "async"  # pragma: no cover
+
+
+def create_response(context: core.StepContext):
+    context.response = (context.output_raw, context.error_status)
+
+
+def test_sync_variant():
+    assert sync.sync_step(business) is business_sync
+    assert sync.sync_step(business_sync) is business_sync
+
+    async def no_variant(context: core.StepContext): ...
+
+    with pytest.raises(TypeError):
+        sync.sync_step(no_variant)
+
+
+def test_sync_url_handler():
+    calls: list[str] = []
+    steps: typing.Any = {
+        "fill_request_info": recording_step("fill", calls),
+        "business_pre": [recording_step("pre", calls)],
+        "business": business,
+        "business_post": {"business": recording_step("post", calls)},
+        "create_response": create_response,
+    }
+    handler = core.SyncUrlHandler(steps=steps, error_status_to_http={})
+
+    assert handler(None) == ("sync", 0)
+    assert calls == [
+        "fill@fill_request_info",
+        "pre@business",
+        "post@business",
+    ]
+
+
+@pytest.mark.parametrize("handled", (True, False))
+def test_sync_url_handler_exception(handled: bool):
+    calls: list[str] = []
+
+    def exception_handler(context: core.StepContext) -> bool:
+        calls.append(f"exception@{context.current_step}")
+        context.error_status = 1
+        return handled
+
+    steps: typing.Any = {
+        "business": recording_step("business", calls, fail=True),
+        "map_output": recording_step("map_output", calls),
+        "exception_handler": exception_handler,
+        "create_response": create_response,
+    }
+    handler = core.SyncUrlHandler(steps=steps, error_status_to_http={})
+
+    if handled:
+        assert handler(None) == (None, 1)
+    else:
+        with pytest.raises(TestException):
+            handler(None)
+
+    assert calls == ["business@business", "exception@business"]
+
+
+def test_sync_url_handler_async_step():
+    async def no_variant(context: core.StepContext): ...
+
+    with pytest.raises(TypeError):
+        core.SyncUrlHandler(steps={"business": no_variant}, error_status_to_http={})
+
+
+def test_sync_method_dispatcher():
+    dispatcher = core.sync_method_dispatcher(
+        invalid_method=lambda request: f"invalid {request.method}",
+        get={"business": business, "create_response": create_response},
+    )
+
+    assert dispatcher(Request("GET")) == ("sync", 0)
+    assert dispatcher(Request("POST")) == "invalid POST"
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import time
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.framework import steps_asgi
+from chameleon.step.steps import steps_default
+from chameleon.step.steps import streaming
+
+
+def echo(context: core.StepContext):
+    context.output_raw = {
+        "method": context.request_info.method,
+        "input": context.input_raw,
+        "url": context.custom_info,
+    }
+
+
+def not_found(context: core.StepContext):
+    context.error_status = 10
+
+
+def dispatcher(**kwargs: typing.Any) -> core.MethodDispatcher:
+    async def invalid_method(*_args, **_kwargs):
+        raise AssertionError("Must be replaced for ASGI")
+
+    return core.method_dispatcher(
+        invalid_method=invalid_method,
+        error_status_to_http={10: 404},
+        compiled=True,
+        **kwargs,
+    )
+
+
+routes = {
+    "api": {
+        "echo/{echo_id}": dispatcher(
+            get=steps_default.default_json_steps(business=echo),
+            post=steps_default.default_json_steps(business=echo),
+        ),
+        "missing": dispatcher(
+            get=steps_default.default_json_steps(business=not_found),
+        ),
+    },
+}
+
+
+async def request(
+    application: typing.Any,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: typing.Sequence[tuple[bytes, bytes]] = (),
+) -> tuple[int, dict[bytes, bytes], bytes]:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(b"content-type", b"application/json"), *headers],
+    }
+    # split the body to check chunked reading
+    messages = [
+        {"type": "http.request", "body": body[:2], "more_body": True},
+        {"type": "http.request", "body": body[2:], "more_body": False},
+    ]
+    sent: list[dict[str, typing.Any]] = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()  # pragma: no cover
+
+    async def send(message):
+        sent.append(message)
+
+    await application(scope, receive, send)
+
+    start, body_message = sent
+    return start["status"], dict(start["headers"]), body_message["body"]
+
+
+@pytest.mark.asyncio
+async def test_get():
+    application = steps_asgi.AsgiApplication(routes=routes)
+    status, headers, body = await request(
+        application, "GET", "/api/echo/1", headers=[(b"accept", b"application/json")]
+    )
+    assert status == 200
+    assert headers[b"content-type"] == b"application/json"
+    assert headers[b"content-length"] == str(len(body)).encode()
+    assert json.loads(body) == {
+        "method": "GET",
+        "input": None,
+        "url": {"echo_id": "1"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_post():
+    application = steps_asgi.AsgiApplication(routes=routes)
+    status, _, body = await request(
+        application, "POST", "/api/echo/1", body=b'{"value": [1, 2, 3]}'
+    )
+    assert status == 200
+    assert json.loads(body)["input"] == {"value": [1, 2, 3]}
+
+
+@pytest.mark.asyncio
+async def test_error_status():
+    application = steps_asgi.AsgiApplication(routes=routes)
+    status, _, _ = await request(application, "GET", "/api/missing")
+    assert status == 404
+
+
+@pytest.mark.asyncio
+async def test_invalid_method():
+    application = steps_asgi.AsgiApplication(routes=routes)
+    status, headers, _ = await request(application, "DELETE", "/api/echo/1")
+    assert status == 405
+    assert headers[b"allow"] == b"GET, POST"
+
+
+@pytest.mark.asyncio
+async def test_not_found():
+    application = steps_asgi.AsgiApplication(routes=routes)
+    status, _, _ = await request(application, "GET", "/api/echo/1/unknown")
+    assert status == 404
+
+
+@pytest.mark.asyncio
+async def test_fallback():
+    calls = []
+
+    async def fallback(scope, receive, send):
+        calls.append(scope["path"])
+        await steps_asgi.AsgiResponse(status=204).send(send)
+
+    application = steps_asgi.AsgiApplication(routes=routes, fallback=fallback)
+    status, _, _ = await request(application, "GET", "/other")
+    assert status == 204
+    assert calls == ["/other"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "accept,status",
+    (
+        (b"application/json", 200),
+        (b"text/html, application/*;q=0.5", 200),
+        (b"*/*", 200),
+        (b"text/html", 500),
+        (b"application/json;q=0", 500),
+    ),
+)
+async def test_accept(accept: bytes, status: int):
+    application = steps_asgi.AsgiApplication(routes=routes)
+    response_status, _, _ = await request(
+        application, "GET", "/api/echo/1", headers=[(b"accept", accept)]
+    )
+    assert response_status == status
+
+
+def test_fill_request_info():
+    request = steps_asgi.AsgiRequest(
+        scope={
+            "method": "POST",
+            "headers": [(b"content-type", b'application/json; charset="utf-8"')],
+        },
+        receive=None,  # type: ignore[arg-type]
+    )
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=request),
+        error_status_to_http={},
+    )
+    steps_asgi.asgi_fill_request_info(context)
+    assert context.request_info.method == "POST"
+    assert context.request_info.content_type == "application/json"
+    assert context.request_info.content_encoding == "utf-8"
+
+
+def test_fill_request_info_timeout():
+    request = steps_asgi.AsgiRequest(
+        scope={"method": "GET", "headers": [(b"x-request-timeout", b"1.5")]},
+        receive=None,  # type: ignore[arg-type]
+    )
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=request),
+        error_status_to_http={},
+    )
+    started = time.monotonic()
+    steps_asgi.asgi_fill_request_info(context)
+    assert context.deadline is not None
+    assert started + 1.5 <= context.deadline <= time.monotonic() + 1.5
+
+
+@pytest.mark.asyncio
+async def test_not_modified():
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+        response_headers={"ETag": '"1"'},
+        not_modified=True,
+    )
+    steps_asgi.asgi_create_response_json(context)
+    sent: list[dict[str, typing.Any]] = []
+
+    async def send(message):
+        sent.append(message)
+
+    await context.response.send(send)
+    assert sent == [
+        {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", b'"1"')],
+        },
+        {"type": "http.response.body", "body": b""},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream():
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+        response_stream=streaming.JsonArrayStream(
+            range(3), dumps=lambda value: str(value).encode(), chunk_size=1
+        ),
+    )
+    steps_asgi.asgi_create_response_json(context)
+    sent: list[dict[str, typing.Any]] = []
+
+    async def send(message):
+        sent.append(message)
+
+    await context.response.send(send)
+    assert sent[0]["headers"] == [(b"content-type", b"application/json")]
+    assert [message["body"] for message in sent[1:]] == [b"[0", b",1", b",2", b"]", b""]
+    assert [message.get("more_body", False) for message in sent[1:]] == [
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
@@ -0,0 +1,44 @@
+import threading
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.framework import steps_django
+
+
+class Request(typing.NamedTuple):
+    method: str
+
+
+def business(context: core.StepContext):
+    context.output_raw = threading.get_ident()
+
+
+async def business_async(context: core.StepContext):
+    raise AssertionError("sync variant is expected")  # pragma: no cover
+
+
+def create_response(context: core.StepContext):
+    context.response = context.output_raw
+
+
+@pytest.mark.asyncio
+async def test_sync_view():
+    view = steps_django.method_dispatcher(
+        compiled=True,
+        get={
+            "business": core.with_sync_variant(business)(business_async),
+            "create_response": create_response,
+        },
+    )
+
+    sync_view = steps_django.sync_view(view)
+    assert isinstance(sync_view, core.SyncMethodDispatcher)
+    assert steps_django.sync_view(view) is sync_view, "Created once"
+    assert sync_view(Request("GET")) == threading.get_ident()
+    assert sync_view(Request("POST")).status_code == 405
+
+    def other_view(request): ...
+
+    assert steps_django.sync_view(other_view) is other_view
@@ -0,0 +1,51 @@
+"""Pipeline scaffold shared by tests of response steps."""
+
+import typing
+
+from chameleon.step import core
+from chameleon.step.steps import steps_json
+
+
+class Request(typing.NamedTuple):
+    method: str = "GET"
+    query: dict[str, str] = {}
+    headers: dict[str, str] = {}
+
+
+def fill_request_info(context: core.StepContext):
+    request: Request = context.request_info.request
+    context.request_info.method = request.method
+    context.request_info.query = request.query
+    context.request_info.headers = request.headers
+
+
+def create_response(context: core.StepContext):
+    context.response = (context.error_status, context.response_body)
+
+
+def create_steps(
+    business: core.StepHandler,
+    steps: core.StepsDefinitionDict,
+    *,
+    create_response: core.StepHandler = create_response,
+) -> core.StepsDefinitionDict:
+    """Steps of a JSON response of `business` output, with tested `steps`."""
+    return {
+        "fill_request_info": fill_request_info,
+        "business": business,
+        "serialize": steps_json.default_serialize_json(),
+        "create_response": create_response,
+        **steps,
+    }
+
+
+def create_handler(
+    business: core.StepHandler,
+    steps: core.StepsDefinitionDict,
+    *,
+    create_response: core.StepHandler = create_response,
+) -> core.CompiledUrlHandler:
+    return core.CompiledUrlHandler(
+        steps=create_steps(business, steps, create_response=create_response),
+        error_status_to_http={},
+    )
@@ -0,0 +1,180 @@
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.steps import cache
+from tests.step.steps import helpers
+from tests.step.steps.helpers import Request
+
+
+class MemoryBackend:
+    def __init__(self):
+        self.data: dict[str, typing.Any] = {}
+        self.async_calls = 0
+
+    def get_many(self, keys):
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def set_many(self, data, timeout=None):
+        self.data.update(data)
+
+    def add(self, key, value, timeout=None) -> bool:
+        return self.data.setdefault(key, value) is value
+
+    async def aget_many(self, keys):
+        self.async_calls += 1
+        return self.get_many(keys)
+
+    async def aset(self, key, value, timeout=None):
+        self.async_calls += 1
+        self.set(key, value, timeout)
+
+    async def aadd(self, key, value, timeout=None) -> bool:
+        self.async_calls += 1
+        return self.add(key, value, timeout)
+
+
+def create_handler(
+    response_cache: cache.ResponseCache, calls: list[str], *, error_status: int = 0
+) -> core.UrlHandler:
+    def business(context: core.StepContext):
+        calls.append(context.custom_info["object_id"])
+        context.error_status = error_status
+        context.output_raw = {"calls": len(calls)}
+
+    return helpers.create_handler(
+        business,
+        cache.response_cache_steps(
+            response_cache, route="object/{object_id}", tags=["object:{object_id}"]
+        ),
+    )
+
+
+@pytest.fixture
+def response_cache() -> cache.ResponseCache:
+    return cache.ResponseCache(backend=MemoryBackend())
+
+
+@pytest.mark.asyncio
+async def test_hit_and_invalidate(response_cache: cache.ResponseCache):
+    calls: list[str] = []
+    handler = create_handler(response_cache, calls)
+
+    assert await handler(Request(), object_id="1") == (0, b'{"calls": 1}')
+    assert await handler(Request(), object_id="1") == (0, b'{"calls": 1}')
+    assert await handler(Request(), object_id="2") == (0, b'{"calls": 2}')
+    response = await handler(Request(query={"a": "1"}), object_id="1")
+    assert response == (0, b'{"calls": 3}')
+    assert calls == ["1", "2", "1"]
+
+    response_cache.invalidate(["object:1"])
+    assert await handler(Request(), object_id="1") == (0, b'{"calls": 4}')
+    assert await handler(Request(), object_id="2") == (0, b'{"calls": 2}')
+    assert calls == ["1", "2", "1", "1"]
+
+
+@pytest.mark.asyncio
+async def test_async_backend_api():
+    """The async pipeline doesn't block the event loop on backend calls."""
+
+    class AsyncOnlyBackend(MemoryBackend):
+        def get_many(self, keys):
+            if self.async_calls == 0:
+                raise AssertionError("sync API called")  # pragma: no cover
+            return super().get_many(keys)
+
+    backend = AsyncOnlyBackend()
+    calls: list[str] = []
+    handler = create_handler(cache.ResponseCache(backend=backend), calls)
+
+    response = await handler(Request(), object_id="1")
+    assert await handler(Request(), object_id="1") == response
+    assert calls == ["1"]
+    # entry and token lookups, new token, entry, then the cached lookup
+    assert backend.async_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_not_stored(response_cache: cache.ResponseCache):
+    calls: list[str] = []
+    handler = create_handler(response_cache, calls, error_status=1)
+
+    assert await handler(Request(), object_id="1") == (1, b'{"calls": 1}')
+    assert await handler(Request(), object_id="1") == (1, b'{"calls": 2}')
+    assert await handler(Request(method="POST"), object_id="1") == (1, b'{"calls": 3}')
+    assert len(calls) == 3
+
+
+def test_concurrent_token():
+    backend = MemoryBackend()
+    response_cache = cache.ResponseCache(backend=backend)
+    entry_key = response_cache.entry_key("object/1", None)
+
+    original_get_many = backend.get_many
+
+    def get_many(keys):
+        values = original_get_many(keys)
+        backend.data[response_cache.tag_key("object:1")] = "concurrent"
+        return values
+
+    backend.get_many = get_many  # type: ignore[method-assign]
+    assert response_cache.get(entry_key, ["object:1"]) == (None, None)
+
+    backend.get_many = original_get_many  # type: ignore[method-assign]
+    assert response_cache.get(entry_key, ["object:1"]) == (None, ("concurrent",))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_token_async():
+    backend = MemoryBackend()
+    response_cache = cache.ResponseCache(backend=backend)
+    entry_key = response_cache.entry_key("object/1", None)
+    backend.data[response_cache.tag_key("object:2")] = "current"
+
+    async def aadd(key, value, timeout=None) -> bool:
+        return False  # another request has added a token
+
+    backend.aadd = aadd  # type: ignore[method-assign]
+    assert await response_cache.aget(entry_key, ["object:1"]) == (None, None)
+    assert await response_cache.aget(entry_key, ["object:2"]) == (None, ("current",))
+
+
+def test_sync_pipeline(response_cache: cache.ResponseCache):
+    calls: list[int] = []
+    handler = core.SyncUrlHandler(
+        steps=helpers.create_steps(
+            lambda context: calls.append(1),
+            cache.response_cache_steps(
+                response_cache, route="object/{object_id}", tags=["object"]
+            ),
+        ),
+        error_status_to_http={},
+    )
+
+    assert handler(Request(), object_id="1") == handler(Request(), object_id="1")
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_headers_stored(response_cache: cache.ResponseCache):
+    def business(context: core.StepContext):
+        context.response_headers = {"Link": '<?cursor=x>; rel="next"'}
+        context.output_raw = []
+
+    def create_response(context: core.StepContext):
+        context.response = context.response_headers
+
+    handler = helpers.create_handler(
+        business,
+        cache.response_cache_steps(
+            response_cache, route="object/{object_id}", tags=["object"]
+        ),
+        create_response=create_response,
+    )
+
+    response = await handler(Request(), object_id="1")
+    assert await handler(Request(), object_id="1") == response
@@ -0,0 +1,184 @@
+import datetime
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step import steps
+from chameleon.step.steps import conditional
+from tests.step.steps import helpers
+from tests.step.steps.helpers import Request
+
+MODIFIED = datetime.datetime(2024, 5, 1, 12, 30, 15, 500, tzinfo=datetime.UTC)
+
+
+def create_response(context: core.StepContext):
+    context.response = (
+        304 if context.not_modified else 200,
+        context.response_headers or {},
+        context.response_body,
+    )
+
+
+def create_handler(calls: list[str], **kwargs: typing.Any) -> core.CompiledUrlHandler:
+    def business(context: core.StepContext):
+        calls.append("business")
+        context.output_raw = {"value": 1}
+
+    return helpers.create_handler(
+        business,
+        conditional.conditional_steps(**kwargs),
+        create_response=create_response,
+    )
+
+
+@pytest.mark.asyncio
+async def test_etag_from_body():
+    calls: list[str] = []
+    handler = create_handler(calls)
+
+    status, headers, body = await handler(Request())
+    assert status == 200
+    assert headers == {"ETag": conditional.etag_from_body(body)}
+
+    etag = headers["ETag"]
+    assert (await handler(Request(headers={"If-None-Match": etag})))[0] == 304
+    assert (await handler(Request(headers={"If-None-Match": f"W/{etag}"})))[0] == 304
+    assert (await handler(Request(headers={"If-None-Match": '"x", ' + etag})))[0] == 304
+    assert (await handler(Request(headers={"If-None-Match": '"x"'})))[0] == 200
+    assert calls == ["business"] * 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
+async def test_last_modified(is_async: bool):
+    calls: list[str] = []
+
+    def last_modified_sync(context: core.StepContext) -> datetime.datetime | None:
+        return MODIFIED
+
+    async def last_modified(context: core.StepContext) -> datetime.datetime | None:
+        return MODIFIED
+
+    if is_async:
+        handler = create_handler(
+            calls, last_modified=last_modified, last_modified_sync=last_modified_sync
+        )
+    else:
+        handler = create_handler(calls, last_modified=last_modified_sync)
+
+    status, headers, _ = await handler(Request())
+    assert status == 200
+    assert headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+    etag = headers["ETag"]
+    assert calls == ["business"]
+
+    status, headers, body = await handler(Request(headers={"If-None-Match": etag}))
+    assert (status, headers["ETag"], body) == (304, etag, b"")
+    assert calls == ["business"]
+
+    for since, expected in (
+        ("Wed, 01 May 2024 12:30:15 GMT", 304),
+        ("Wed, 01 May 2024 12:30:14 GMT", 200),
+        ("invalid", 200),
+    ):
+        response = await handler(Request(headers={"If-Modified-Since": since}))
+        assert response[0] == expected
+
+    # If-None-Match takes precedence
+    response = await handler(
+        Request(
+            headers={
+                "If-None-Match": '"x"',
+                "If-Modified-Since": "Wed, 01 May 2024 12:30:15 GMT",
+            }
+        )
+    )
+    assert response[0] == 200
+
+    # query parameters change the representation
+    response = await handler(Request(headers={"If-None-Match": etag}, query={"a": "1"}))
+    assert response[0] == 200
+
+
+def test_last_modified_without_sync_variant():
+    async def last_modified(context: core.StepContext) -> datetime.datetime | None:
+        return MODIFIED  # pragma: no cover
+
+    with pytest.raises(TypeError, match="has no sync variant"):
+        conditional.conditional_steps(last_modified=last_modified)
+
+
+@pytest.mark.asyncio
+async def test_unknown_last_modified():
+    calls: list[str] = []
+    handler = create_handler(calls, last_modified=lambda context: None)
+
+    status, headers, body = await handler(Request(headers={"If-None-Match": "*"}))
+    assert status == 304
+    assert headers == {"ETag": conditional.etag_from_body(b'{"value": 1}')}
+    assert calls == ["business"]
+
+
+@pytest.mark.asyncio
+async def test_not_applied():
+    handler = helpers.create_handler(
+        lambda context: setattr(context, "error_status", 10),
+        conditional.conditional_steps(),
+        create_response=create_response,
+    )
+    assert (await handler(Request(headers={"If-None-Match": "*"})))[:2] == (200, {})
+
+    calls: list[str] = []
+    handler = create_handler(calls)
+    response = await handler(Request(method="POST", headers={"If-None-Match": "*"}))
+    assert response[:2] == (200, {})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
+async def test_no_validators_on_error(is_async: bool):
+    def last_modified_sync(context: core.StepContext) -> datetime.datetime | None:
+        return MODIFIED
+
+    async def last_modified(context: core.StepContext) -> datetime.datetime | None:
+        return MODIFIED
+
+    conditional_steps = conditional.conditional_steps(
+        last_modified=last_modified if is_async else last_modified_sync,
+        last_modified_sync=last_modified_sync if is_async else None,
+    )
+    steps_definition = helpers.create_steps(
+        lambda context: setattr(context, "error_status", 10),
+        conditional_steps,
+        create_response=create_response,
+    )
+    handler = core.CompiledUrlHandler(steps=steps_definition, error_status_to_http={})
+    # no validators to revalidate the error response with
+    assert (await handler(Request()))[:2] == (200, {})
+
+    sync_handler = core.SyncUrlHandler(steps=steps_definition, error_status_to_http={})
+    assert sync_handler(Request())[:2] == (200, {})
+
+
+def test_merge_steps():
+    def first(context: core.StepContext): ...
+
+    def second(context: core.StepContext): ...
+
+    assert steps.merge_steps(
+        {"business_pre": first, "business": first, "map_input": None},
+        {"business_pre": [second, None], "business_post": second},
+        {"business": None, "map_input": first},
+    ) == {
+        "business_pre": [first, second, None],
+        "business": first,
+        "business_post": second,
+        "map_input": first,
+    }
+
+    with pytest.raises(ValueError):
+        steps.merge_steps(
+            {"exception_handler": {"business": first}},
+            {"exception_handler": second},
+        )
@@ -0,0 +1,182 @@
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step import mapping
+from chameleon.step.mapping import simple
+from chameleon.step.steps import fieldsets
+
+TYPE_ID = "fieldsets_test"
+
+simple.register_simple_mapping_from_object(
+    type_id=TYPE_ID,
+    action_id="get",
+    target_object_type=dict,
+    fields=("id", "title", "summary"),
+    custom_mapping={"parent_id": "parent"},
+    custom_converters={"id": str, "parent_id": str},
+)
+
+FIELD_MAPPING = {
+    "parent_id": "parent",
+    "id": "id",
+    "title": "title",
+    "summary": "summary",
+}
+
+
+class Item(typing.NamedTuple):
+    id: int
+    title: str
+    summary: str | None
+    parent: int
+
+
+class PartialItem:
+    """Object with only some attributes loaded, like a deferred model."""
+
+    def __init__(self, **values: typing.Any):
+        self.__dict__.update(values)
+
+    def __getattr__(self, name: str):
+        raise AssertionError(f"Deferred field loaded: {name}")
+
+
+def create_response(context: core.StepContext):
+    context.response = (context.error_status, context.output_raw)
+
+
+def exception_handler(context: core.StepContext) -> bool:
+    if not isinstance(context.exception, fieldsets.InvalidFieldsRequest):
+        return False
+    context.error_status = 5
+    return True
+
+
+def create_handler(
+    query: dict[str, str] | None, business: core.StepHandler
+) -> core.SyncUrlHandler:
+    def fill_request_info(context: core.StepContext):
+        context.request_info.query = query
+
+    return core.SyncUrlHandler(
+        steps={
+            "fill_request_info": fill_request_info,
+            **fieldsets.sparse_fieldset_steps(type_id=TYPE_ID),
+            "business": business,
+            "exception_handler": {"business": exception_handler},
+            "create_response": create_response,
+        },
+        error_status_to_http={},
+    )
+
+
+def business_returning(
+    item: typing.Any, captured: list[typing.Any] | None = None
+) -> core.StepHandler:
+    def business(context: core.StepContext):
+        if captured is not None:
+            source_fields = fieldsets.source_fields(context)
+            captured.append(None if source_fields is None else list(source_fields))
+        context.output_business = item
+
+    return business
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("title", {"title": "title"}),
+        ("summary, id", {"id": "id", "summary": "summary"}),
+        ("id,parent_id,", {"parent_id": "parent", "id": "id"}),
+    ),
+)
+def test_parse_fields(value: str, expected: dict[str, str]):
+    output_fields = fieldsets.parse_fields(value, FIELD_MAPPING)
+    assert output_fields == expected
+    assert list(output_fields) == [f for f in FIELD_MAPPING if f in expected]
+
+
+@pytest.mark.parametrize(
+    "value,match",
+    (
+        ("", "No fields"),
+        (" , ", "No fields"),
+        ("title,nope", "Unknown fields: nope"),
+        ("parent", "Unknown fields: parent"),
+    ),
+)
+def test_parse_fields_invalid(value: str, match: str):
+    with pytest.raises(fieldsets.InvalidFieldsRequest, match=match):
+        fieldsets.parse_fields(value, FIELD_MAPPING)
+
+
+def test_row_mapping_select():
+    row_mapping = simple.get_row_mapping(mapping.registry.get(TYPE_ID, "get"))
+    assert row_mapping is not None
+
+    assert row_mapping.field_mapping == FIELD_MAPPING
+
+    selected = row_mapping.select(("title", "parent_id"))
+    assert selected.fields == ("parent", "title")
+    assert selected.target_fields == ("parent_id", "title")
+    assert selected.mapping((2, "a")) == {"parent_id": "2", "title": "a"}
+
+
+def test_no_row_mapping():
+    simple.register_simple_mapping_from_object(
+        type_id=TYPE_ID,
+        action_id="nested",
+        target_object_type=dict,
+        custom_mapping={"title": "parent.title"},
+    )
+
+    steps = fieldsets.sparse_fieldset_steps(type_id=TYPE_ID, action_id="nested")
+    with pytest.raises(ValueError, match="No row mapping"):
+        steps["map_output"](
+            core.StepContext(
+                request_info=core.StepContextRequestInfo(request=None),
+                error_status_to_http={},
+            )
+        )
+
+
+def test_all_fields():
+    item = Item(1, "a", None, 2)
+    captured: list[typing.Any] = []
+
+    handler = create_handler(None, business_returning(item, captured))
+    assert handler(None) == (0, mapping.registry.get(TYPE_ID, "get")(item))
+    assert captured == [None]
+
+
+def test_selected_fields():
+    captured: list[typing.Any] = []
+
+    handler = create_handler(
+        {"fields": "parent_id,id"},
+        business_returning(PartialItem(id=1, parent=2), captured),
+    )
+    assert handler(None) == (0, {"id": "1", "parent_id": "2"})
+    assert captured == [["parent", "id"]]
+
+
+def test_single_field():
+    handler = create_handler(
+        {"fields": "title"}, business_returning(PartialItem(title="a"))
+    )
+    assert handler(None) == (0, {"title": "a"})
+
+
+@pytest.mark.parametrize("query", ({"fields": ""}, {"fields": "nope"}))
+def test_invalid_fields(query: dict[str, str]):
+    handler = create_handler(query, business_returning(None))
+    assert handler(None) == (5, None)
+
+
+def test_list_output():
+    steps = fieldsets.sparse_fieldset_steps(
+        type_id=TYPE_ID, mapping_output_expect_list=True
+    )
+    assert list(steps) == ["business_pre"]
@@ -0,0 +1,126 @@
+import datetime
+import typing
+from collections import abc
+
+import pytest
+
+from chameleon.common import pagination
+from chameleon.common.query import AbstractQuery
+from chameleon.step import core
+from chameleon.step import mapping
+from chameleon.step.mapping import simple
+from chameleon.step.steps import rows
+
+TYPE_ID = "rows_test"
+CREATED = datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+
+simple.register_simple_mapping_from_object(
+    type_id=TYPE_ID,
+    action_id="get",
+    target_object_type=dict,
+    fields=("id", "title", "creation_time"),
+    custom_converters={"id": str},
+)
+
+simple.register_simple_mapping_from_object(
+    type_id=TYPE_ID,
+    action_id="nested",
+    target_object_type=dict,
+    custom_mapping={"title": "parent.title"},
+)
+
+
+class Item(typing.NamedTuple):
+    id: int
+    title: str | None
+    creation_time: datetime.datetime
+
+
+ITEMS = [Item(1, "a", CREATED), Item(2, None, CREATED)]
+
+
+class ItemQuery(AbstractQuery[list[Item], typing.Any]):
+    fields: abc.Sequence[str] | None = None
+
+    def values_rows(self, fields: abc.Sequence[str]) -> typing.Self:
+        query = ItemQuery(self.query)
+        query.fields = fields
+        return query
+
+    def page_sync(self, page_request: pagination.PageRequest) -> pagination.Page:
+        assert self.fields is not None
+        values = [tuple(getattr(item, f) for f in self.fields) for item in self.query]
+        return pagination.Page(values, None)
+
+    async def page(self, page_request: pagination.PageRequest) -> pagination.Page:
+        return self.page_sync(page_request)
+
+
+def create_context() -> core.StepContext:
+    return core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+    )
+
+
+def test_row_mapping():
+    object_mapping = mapping.registry.get(TYPE_ID, "get")
+    row_mapping = simple.get_row_mapping(object_mapping)
+    assert row_mapping is not None
+    assert row_mapping.fields == ("id", "title", "creation_time")
+
+    for item in ITEMS:
+        assert row_mapping.mapping(tuple(item)) == object_mapping(item)
+
+
+def test_no_row_mapping():
+    assert simple.get_row_mapping(mapping.registry.get(TYPE_ID, "nested")) is None
+
+    steps = rows.list_rows_steps(type_id=TYPE_ID, action_id="nested", query=ItemQuery)
+    with pytest.raises(ValueError, match="No row mapping"):
+        steps["map_output"](create_context())
+
+
+def test_mapping_created_on_first_call():
+    created = []
+
+    def factory():
+        created.append(True)
+        return simple.create_mapping_function(
+            target_object_type=dict,
+            get_field_fun=simple.get_field_attr,
+            include_none=False,
+            field_mapping={"title": "title"},
+            custom_converters={},
+        )
+
+    mapping.registry.register_factory(
+        type_id=TYPE_ID, action_id="lazy", factory=factory
+    )
+    steps = rows.list_rows_steps(type_id=TYPE_ID, action_id="lazy", query=ItemQuery)
+    assert created == []
+
+    context = create_context()
+    context.output_business = [("a",), ("b",)]
+    steps["map_output"](context)
+    steps["map_output"](context)
+    assert context.output_raw == [{"title": "a"}, {"title": "b"}]
+    assert created == [True]
+
+
+@pytest.mark.asyncio
+async def test_list_rows_steps():
+    def create_response(context: core.StepContext):
+        context.response = context.output_raw
+
+    steps = {
+        **rows.list_rows_steps(type_id=TYPE_ID, query=lambda context: ItemQuery(ITEMS)),
+        "create_response": create_response,
+    }
+    expected = [mapping.registry.get(TYPE_ID, "get")(item) for item in ITEMS]
+
+    handler = core.CompiledUrlHandler(steps=steps, error_status_to_http={})
+    assert await handler(None) == expected
+
+    sync_handler = core.SyncUrlHandler(steps=steps, error_status_to_http={})
+    assert sync_handler(None) == expected
@@ -0,0 +1,128 @@
+import asyncio
+import typing
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.steps import single_flight
+from tests.step.steps import helpers
+from tests.step.steps.helpers import Request
+
+
+class TestException(Exception):
+    __test__ = False
+
+
+def create_handler(business: core.StepHandler, **kwargs) -> core.UrlHandler:
+    return helpers.create_handler(business, single_flight.single_flight_steps(**kwargs))
+
+
+class Business:
+    def __init__(self, *, fail: bool = False):
+        self.calls: list[typing.Any] = []
+        self.release = asyncio.Event()
+        self.fail = fail
+
+    async def __call__(self, context: core.StepContext):
+        self.calls.append(context.custom_info.get("object_id"))
+        await self.release.wait()
+        if self.fail and len(self.calls) == 1:
+            raise TestException()
+        context.output_raw = {"calls": len(self.calls)}
+
+
+async def run_concurrently(
+    handler: core.UrlHandler,
+    business: Business,
+    requests: typing.Sequence[tuple[Request, dict[str, str]]],
+) -> list[typing.Any]:
+    tasks = [
+        asyncio.ensure_future(handler(request, **url_params))
+        for request, url_params in requests
+    ]
+    await asyncio.sleep(0.01)
+    business.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_coalesced():
+    business = Business()
+    handler = create_handler(business)
+
+    responses = await run_concurrently(
+        handler, business, [(Request(), {"object_id": "1"})] * 3
+    )
+    assert business.calls == ["1"]
+    assert responses == [(0, b'{"calls": 1}')] * 3
+
+    # finished requests are not reused
+    assert await handler(Request(), object_id="1") == (0, b'{"calls": 2}')
+
+
+@pytest.mark.asyncio
+async def test_different_keys():
+    business = Business()
+    handler = create_handler(business)
+
+    await run_concurrently(
+        handler,
+        business,
+        [
+            (Request(), {"object_id": "1"}),
+            (Request(), {"object_id": "2"}),
+            (Request(query={"limit": "1"}), {"object_id": "1"}),
+            (Request(headers={"authorization": "token"}), {"object_id": "1"}),
+            (Request(headers={"accept": "*/*"}), {"object_id": "1"}),
+        ],
+    )
+    assert business.calls == ["1", "2", "1", "1"]
+
+
+@pytest.mark.asyncio
+async def test_custom_key():
+    business = Business()
+    handler = create_handler(business, key=lambda context: "same")
+
+    await run_concurrently(
+        handler,
+        business,
+        [(Request(), {"object_id": "1"}), (Request(), {"object_id": "2"})],
+    )
+    assert business.calls == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_not_get():
+    business = Business()
+    handler = create_handler(business)
+
+    await run_concurrently(
+        handler, business, [(Request(method="POST"), {"object_id": "1"})] * 2
+    )
+    assert business.calls == ["1", "1"]
+
+
+@pytest.mark.asyncio
+async def test_leader_failed():
+    business = Business(fail=True)
+    handler = create_handler(business)
+
+    leader, *followers = await run_concurrently(
+        handler, business, [(Request(), {"object_id": "1"})] * 3
+    )
+    assert isinstance(leader, TestException)
+    assert business.calls == ["1", "1", "1"]
+    # followers are processed on their own
+    assert [status for status, _ in followers] == [0, 0]
+
+
+def test_sync_pipeline():
+    handler = core.SyncUrlHandler(
+        steps=helpers.create_steps(
+            lambda context: setattr(context, "output_raw", "sync"),
+            single_flight.single_flight_steps(),
+        ),
+        error_status_to_http={},
+    )
+    assert handler(Request()) == (0, b'"sync"')
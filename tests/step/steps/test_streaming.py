@@ -0,0 +1,97 @@
+import json
+import typing
+from collections import abc
+
+import pytest
+
+from chameleon.step import core
+from chameleon.step.steps import mapping
+from chameleon.step.steps import steps_json
+from chameleon.step.steps import streaming
+
+
+class Rows:
+    """Lazy rows iterable both ways, like a query."""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __iter__(self) -> abc.Iterator[int]:
+        return iter(range(self.count))
+
+    async def __aiter__(self) -> abc.AsyncIterator[int]:
+        for value in range(self.count):
+            yield value
+
+
+async def collect(stream: typing.Any, is_async: bool) -> list[typing.Any]:
+    if is_async:
+        return [chunk async for chunk in stream]
+    return list(stream)
+
+
+@pytest.mark.parametrize(
+    "value,is_lazy",
+    (
+        ([1], False),
+        ((1,), False),
+        ({"a": 1}, False),
+        ("abc", False),
+        (None, False),
+        (Rows(1), True),
+        (iter([1]), True),
+        (streaming.MappedRows([1], str), True),
+    ),
+)
+def test_is_lazy_rows(value: typing.Any, is_lazy: bool):
+    assert streaming.is_lazy_rows(value) is is_lazy
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", (True, False))
+@pytest.mark.parametrize("count", (0, 1, 100))
+@pytest.mark.parametrize("chunk_size", (1, 10, 1000))
+async def test_json_array_stream(is_async: bool, count: int, chunk_size: int):
+    rows = streaming.MappedRows(Rows(count), lambda value: {"id": value})
+    stream = streaming.JsonArrayStream(
+        rows,
+        dumps=lambda value: json.dumps(value).encode(),
+        chunk_size=chunk_size,
+    )
+
+    chunks = await collect(stream, is_async)
+    assert json.loads(b"".join(chunks)) == [{"id": value} for value in range(count)]
+    assert all(len(chunk) < chunk_size + 20 for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_mapped_rows_sync_source():
+    rows = streaming.MappedRows(iter([1, 2]), str)
+    assert await collect(rows, True) == ["1", "2"]
+
+
+def test_serialize_lazy_rows():
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+        output_business=Rows(3),
+    )
+    mapping.mapper_handler_list_output(context, mapping_function=str)
+    steps_json.default_serialize_json()(context)
+
+    assert context.response_body is None
+    assert json.loads(b"".join(context.response_stream)) == ["0", "1", "2"]
+
+
+def test_serialize_list():
+    context = core.StepContext(
+        request_info=core.StepContextRequestInfo(request=None),
+        error_status_to_http={},
+        output_business=range(3),
+    )
+    mapping.mapper_handler_list_output(context, mapping_function=str)
+    steps_json.default_serialize_json()(context)
+
+    assert context.output_raw == ["0", "1", "2"]
+    assert context.response_body == b'["0", "1", "2"]'
+    assert context.response_stream is None
@@ -0,0 +1,108 @@
+import pathlib
+
+import jsonschema
+import orjson
+import pytest
+from referencing.jsonschema import SchemaRegistry
+
+from chameleon.step.validation import bundle
+from chameleon.step.validation import jsonschema as chameleon_jsonschema
+
+SCHEMAS_PATH = pathlib.Path(__file__).parents[3] / "schemas"
+DRAFT = "https://json-schema.org/draft/2020-12/schema"
+
+project = {
+    "name": "Chameleon",
+    "summary": "A ticket tracker which changes its colors",
+    "description": "Description",
+    "description_markup": "PLAIN",
+}
+
+
+@pytest.fixture(autouse=True)
+def no_validators(monkeypatch):
+    monkeypatch.setattr(chameleon_jsonschema, "validators", {})
+    monkeypatch.setattr(chameleon_jsonschema, "validator_refs", {})
+
+
+def write_schema(path: pathlib.Path, name: str, content: str):
+    path.mkdir(exist_ok=True)
+    (path / name).write_text(f"$schema: {DRAFT}\n{content}")
+
+
+def test_chameleon_schemas(tmp_path: pathlib.Path):
+    entries = bundle.bundle_schemas(SCHEMAS_PATH)
+    assert b"$ref" not in orjson.dumps(entries)
+
+    bundle_path = tmp_path / "bundle.json"
+    bundle.write_bundle(bundle_path, entries)
+    registries = [
+        chameleon_jsonschema.load_schemas(source, schema_registry=SchemaRegistry())
+        for source in (SCHEMAS_PATH, f"bundle:{bundle_path}")
+    ]
+    assert sorted(registries[0]) == sorted(registries[1])
+
+    ref = "schema_project.yml#/$defs/ChameleonProjectCreate"
+    validators = [
+        jsonschema.Draft202012Validator({"$ref": ref}, registry=registry)
+        for registry in registries
+    ]
+    for value in (project, {**project, "name": ""}, {**project, "x": 1}, {}):
+        assert validators[0].is_valid(value) is validators[1].is_valid(value)
+
+
+def test_ref_with_siblings(tmp_path: pathlib.Path):
+    write_schema(
+        tmp_path,
+        "a.yml",
+        "$defs:\n"
+        "  Name: {type: string}\n"
+        "  Named:\n"
+        "    properties:\n"
+        "      name: {$ref: '#/$defs/Name', maxLength: 3}\n",
+    )
+    [(schema_ids, schema)] = bundle.bundle_schemas(tmp_path)
+    assert schema_ids == ["a.yml"]
+    assert schema["$defs"]["Named"]["properties"]["name"] == {
+        "maxLength": 3,
+        "allOf": [{"type": "string"}],
+    }
+
+
+def test_cyclic_ref(tmp_path: pathlib.Path):
+    write_schema(
+        tmp_path,
+        "tree.yml",
+        "$defs:\n"
+        "  Tree:\n"
+        "    properties:\n"
+        "      children: {items: {$ref: '#/$defs/Tree'}}\n"
+        "      leaf: {$ref: 'leaf.yml'}\n",
+    )
+    write_schema(tmp_path, "leaf.yml", "type: string\n")
+
+    entries = bundle.bundle_schemas(tmp_path)
+    schemas = {schema_ids[0]: schema for schema_ids, schema in entries}
+    properties = schemas["tree.yml"]["$defs"]["Tree"]["properties"]
+    assert properties["leaf"] == {"type": "string"}
+    assert properties["children"]["items"]["properties"]["children"] == {
+        "items": {"$ref": "tree.yml#/$defs/Tree"}
+    }
+
+    bundle_path = tmp_path / "bundle.json"
+    bundle.write_bundle(bundle_path, entries)
+    registry = chameleon_jsonschema.load_schemas(
+        f"bundle:{bundle_path}", schema_registry=SchemaRegistry()
+    )
+    validator = jsonschema.Draft202012Validator(
+        {"$ref": "tree.yml#/$defs/Tree"}, registry=registry
+    )
+    assert validator.is_valid({"children": [{"children": [{"leaf": "a"}]}]})
+    assert not validator.is_valid({"children": [{"children": [{"leaf": 1}]}]})
+
+
+def test_not_a_bundle(tmp_path: pathlib.Path):
+    path = tmp_path / "bundle.json"
+    path.write_bytes(b"[]")
+    with pytest.raises(ValueError, match="isn't a schema bundle"):
+        chameleon_jsonschema.read_bundle(path)
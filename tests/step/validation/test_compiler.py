@@ -0,0 +1,172 @@
+import pathlib
+import typing
+
+import jsonschema
+import pytest
+import referencing
+from referencing.jsonschema import DRAFT202012
+from referencing.jsonschema import SchemaRegistry
+
+from chameleon.step.validation import compiler
+from chameleon.step.validation import jsonschema as chameleon_jsonschema
+
+SCHEMAS_PATH = pathlib.Path(__file__).parents[3] / "schemas"
+FORMAT_CHECKER = jsonschema.Draft202012Validator.FORMAT_CHECKER
+
+REPLACEMENTS = (None, True, 1, 1.5, "", "x", "x" * 300, [], {}, "2024-01-02T03:04:05Z")
+
+project = {
+    "name": "Chameleon",
+    "summary": "A ticket tracker which changes its colors",
+    "description": "Description",
+    "description_markup": "PLAIN",
+}
+VALID_PAYLOADS = (
+    ("schema_project.yml#/$defs/ChameleonProjectCreate", project),
+    ("schema_project.yml#/$defs/ChameleonProjectUpdate", project),
+    (
+        "schema_project.yml#/$defs/ChameleonProject",
+        {"id": "12", "creation_time": "2024-01-02T03:04:05+00:00", **project},
+    ),
+    ("schema_ticket.yml#/$defs/ChameleonTicketCreate", {"title": "Colors"}),
+    (
+        "schema_comment.yml#/$defs/ChameleonCommentCreate",
+        {"description": "Description", "description_markup": "PLAIN"},
+    ),
+)
+
+
+def variants(value: dict[str, typing.Any]) -> typing.Iterator[typing.Any]:
+    """Value, values with a key missing, replaced or added and non-objects."""
+    yield value
+    yield from REPLACEMENTS
+    for key in value:
+        yield {k: v for k, v in value.items() if k != key}
+        for replacement in REPLACEMENTS:
+            yield {**value, key: replacement}
+    yield {**value, "unknown": "x"}
+
+
+@pytest.fixture(scope="module")
+def schema_registry() -> SchemaRegistry:
+    return (
+        SchemaRegistry()
+        .with_resources(
+            chameleon_jsonschema.obtain_schema_data(SCHEMAS_PATH, {}, set())
+        )
+        .crawl()
+    )
+
+
+def assert_same_as_jsonschema(
+    ref: str, schema_registry: SchemaRegistry, values: typing.Iterable[typing.Any]
+):
+    check = compiler.compile_schema(
+        ref, schema_registry=schema_registry, format_checker=FORMAT_CHECKER
+    )
+    validator = jsonschema.Draft202012Validator(
+        {"$ref": ref}, registry=schema_registry, format_checker=FORMAT_CHECKER
+    )
+    for value in values:
+        assert check(value) is validator.is_valid(value), value
+
+
+@pytest.mark.parametrize("ref,value", VALID_PAYLOADS)
+def test_chameleon_schemas(ref: str, value: dict, schema_registry: SchemaRegistry):
+    assert_same_as_jsonschema(ref, schema_registry, variants(value))
+
+
+def schema_registry_of(schema: dict[str, typing.Any]) -> SchemaRegistry:
+    resource = DRAFT202012.create_resource(
+        {"$schema": "https://json-schema.org/draft/2020-12/schema", **schema}
+    )
+    return referencing.Registry().with_resource("test.json", resource)
+
+
+@pytest.mark.parametrize(
+    "schema,values",
+    (
+        (
+            {"type": "integer", "minimum": 1, "exclusiveMaximum": 10},
+            (0, 1, 1.0, 9, 10, True, "1", None),
+        ),
+        ({"type": ["string", "null"], "pattern": "^a"}, ("a", "ba", None, 1)),
+        ({"enum": ["a", "b"]}, ("a", "c", 1, [], {})),
+        ({"const": "a"}, ("a", "b", None)),
+        (
+            {"oneOf": [{"type": "number"}, {"type": "integer"}]},
+            (1, 1.5, "1"),
+        ),
+        ({"not": {"type": "string"}, "maxLength": 1}, ("a", 1, None)),
+        (
+            {"type": "array", "items": {"type": "string"}, "minItems": 1},
+            ([], ["a"], ["a", 1], "a"),
+        ),
+        (
+            {
+                "properties": {"a": {"type": "string"}},
+                "additionalProperties": {"type": "integer"},
+                "dependentRequired": {"a": ["b"]},
+                "maxProperties": 2,
+            },
+            ({}, {"a": "x"}, {"a": "x", "b": 1}, {"b": "x"}, {"b": 1, "c": 2, "d": 3}),
+        ),
+        (
+            {
+                "$defs": {"Base": {"properties": {"a": True}}},
+                "allOf": [{"$ref": "#/$defs/Base"}],
+                "properties": {"b": True},
+                "unevaluatedProperties": False,
+            },
+            ({}, {"a": 1, "b": 2}, {"c": 3}, []),
+        ),
+        ({"format": "date-time"}, ("2024-01-02T03:04:05Z", "2024-01-02", 1)),
+    ),
+)
+def test_keywords(schema: dict, values: tuple):
+    assert_same_as_jsonschema("test.json", schema_registry_of(schema), values)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    (
+        {"patternProperties": {"^a": True}},
+        {"enum": [1, 2]},
+        {"unevaluatedProperties": {"type": "string"}},
+        {
+            "anyOf": [{"properties": {"a": True}}, {"properties": {"b": True}}],
+            "unevaluatedProperties": False,
+        },
+    ),
+)
+def test_uncompilable(schema: dict):
+    with pytest.raises(compiler.Uncompilable):
+        compiler.compile_schema(
+            "test.json",
+            schema_registry=schema_registry_of(schema),
+            format_checker=FORMAT_CHECKER,
+        )
+
+
+def test_json_validation_processor(schema_registry: SchemaRegistry, monkeypatch):
+    monkeypatch.setattr(chameleon_jsonschema, "validators", {})
+    monkeypatch.setattr(chameleon_jsonschema, "validator_refs", {})
+    monkeypatch.setattr(chameleon_jsonschema, "compiled_checks", {})
+    monkeypatch.setattr(chameleon_jsonschema, "compiled_validation", False)
+
+    key = ("project", "compiled_test")
+    chameleon_jsonschema.create_validator(
+        ref="schema_project.yml#/$defs/ChameleonProjectCreate",
+        type_id=key[0],
+        action_id=key[1],
+        schema_registry=schema_registry,
+    )
+    assert key not in chameleon_jsonschema.compiled_checks
+
+    chameleon_jsonschema.compile_check(key, schema_registry=schema_registry)
+    assert key in chameleon_jsonschema.compiled_checks
+
+    validate = chameleon_jsonschema.json_validation_processor
+    assert validate(project, key=key) is None
+    errors = validate({**project, "name": ""}, key=key)
+    assert errors and errors[0] == {"pointer": "/name", "keyword": "minLength"}
@@ -0,0 +1,170 @@
+import pathlib
+
+import pytest
+from referencing.jsonschema import SchemaRegistry
+
+from chameleon.step.validation import jsonschema
+
+SCHEMAS_PATH = pathlib.Path(__file__).parents[3] / "schemas"
+KEY = ("project", "modes_test")
+
+project = {
+    "name": "Chameleon",
+    "summary": "A ticket tracker which changes its colors",
+    "description": "Description",
+    "description_markup": "PLAIN",
+}
+invalid_project = {**project, "name": "", "summary": "s" * 300, "unknown": True}
+
+
+@pytest.fixture(autouse=True)
+def validator(monkeypatch):
+    monkeypatch.setattr(jsonschema, "validators", {})
+    monkeypatch.setattr(jsonschema, "validator_refs", {})
+    monkeypatch.setattr(jsonschema, "compiled_checks", {})
+    monkeypatch.setattr(jsonschema, "compiled_validation", False)
+
+    schema_registry = (
+        SchemaRegistry()
+        .with_resources(jsonschema.obtain_schema_data(SCHEMAS_PATH, {}, set()))
+        .crawl()
+    )
+    jsonschema.create_validator(
+        ref="schema_project.yml#/$defs/ChameleonProjectCreate",
+        type_id=KEY[0],
+        action_id=KEY[1],
+        schema_registry=schema_registry,
+    )
+    return schema_registry
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+@pytest.mark.parametrize("mode", tuple(jsonschema.ValidationMode))
+def test_valid(mode: jsonschema.ValidationMode, compiled: bool, validator):
+    if compiled:
+        jsonschema.compile_check(KEY, schema_registry=validator)
+
+    assert jsonschema.json_validation_processor(project, key=KEY, mode=mode) is None
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_valid_mode(compiled: bool, validator):
+    if compiled:
+        jsonschema.compile_check(KEY, schema_registry=validator)
+
+    errors = jsonschema.json_validation_processor(
+        invalid_project, key=KEY, mode=jsonschema.ValidationMode.VALID
+    )
+    assert errors == [{"pointer": "", "keyword": None}]
+
+
+def test_full_mode():
+    errors = jsonschema.json_validation_processor(
+        invalid_project, key=KEY, mode=jsonschema.ValidationMode.FULL
+    )
+    assert errors is not None
+    assert sorted(map(tuple, (e.values() for e in errors))) == [
+        ("", "unevaluatedProperties"),
+        ("/name", "minLength"),
+        ("/summary", "maxLength"),
+    ]
+
+
+@pytest.mark.parametrize("max_errors", (1, 2))
+def test_first_errors_mode(max_errors: int):
+    errors = jsonschema.json_validation_processor(
+        invalid_project,
+        key=KEY,
+        mode=jsonschema.ValidationMode.FIRST_ERRORS,
+        max_errors=max_errors,
+    )
+    assert errors is not None
+    assert len(errors) == max_errors
+
+
+@pytest.mark.parametrize(
+    "path,pointer",
+    (((), ""), (("a", 0), "/a/0"), (("a/b", "c~d"), "/a~1b/c~0d")),
+)
+def test_json_pointer(path: tuple, pointer: str):
+    assert jsonschema.json_pointer(path) == pointer
+
+
+def load_schemas(cache_path: pathlib.Path, schemas_path: pathlib.Path = SCHEMAS_PATH):
+    return jsonschema.load_schemas(
+        schemas_path, schema_registry=SchemaRegistry(), cache_path=cache_path
+    )
+
+
+def test_schema_cache(tmp_path: pathlib.Path, monkeypatch):
+    cache_path = tmp_path / "schemas.json"
+    schema_registry = load_schemas(cache_path)
+    assert cache_path.exists()
+
+    def parse_schemas(*_args):
+        raise AssertionError("Cached schemas are parsed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(jsonschema, "parse_schemas", parse_schemas)
+        cached_registry = load_schemas(cache_path)
+
+    assert sorted(cached_registry) == sorted(schema_registry)
+    ref = "schema_project.yml#/$defs/ChameleonProjectCreate"
+    assert (
+        cached_registry.resolver().lookup(ref).contents
+        == schema_registry.resolver().lookup(ref).contents
+    )
+
+
+def test_schema_cache_rebuilt(tmp_path: pathlib.Path):
+    cache_path = tmp_path / "schemas.json"
+    schemas_path = tmp_path / "schemas"
+    schemas_path.mkdir()
+    schema_file = schemas_path / "schema.yml"
+    schema_file.write_text(
+        "$schema: https://json-schema.org/draft/2020-12/schema\n$id: urn:a\n"
+    )
+    assert "urn:a" in load_schemas(cache_path, schemas_path)
+
+    schema_file.write_text(
+        "$schema: https://json-schema.org/draft/2020-12/schema\n$id: urn:b\n"
+    )
+    schema_registry = load_schemas(cache_path, schemas_path)
+    assert "urn:b" in schema_registry
+    assert "urn:a" not in schema_registry
+
+
+def test_schema_cache_not_written(tmp_path: pathlib.Path):
+    schema_registry = load_schemas(tmp_path / "missing" / "schemas.json")
+    assert "schema_project.yml" in schema_registry
+
+
+def test_lazy_validator(validator):
+    key = ("project", "lazy_test")
+    jsonschema.validator_refs[key] = (
+        "schema_project.yml#/$defs/ChameleonProjectCreate",
+        validator,
+    )
+    assert key not in jsonschema.validators
+
+    assert jsonschema.json_validation_processor(project, key=key) is None
+    assert key in jsonschema.validators
+    assert key not in jsonschema.compiled_checks
+
+
+def test_warmup_validators(monkeypatch):
+    monkeypatch.setattr(jsonschema, "compiled_validation", True)
+    jsonschema.validators.clear()
+
+    jsonschema.warmup_validators()
+    assert KEY in jsonschema.validators
+    assert jsonschema.compiled_checks[KEY] is not None
+
+
+def test_update_validators(validator):
+    jsonschema.update_validators(schema_registry=validator)
+    assert not jsonschema.validators
+    assert jsonschema.validator_refs[KEY] == (
+        "schema_project.yml#/$defs/ChameleonProjectCreate",
+        validator,
+    )